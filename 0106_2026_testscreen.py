@@ -4,18 +4,18 @@ MotorControlScreen build_ui() Standalone Demo - Educational Version
 Focus: Pie Chart Progress Animation (ProcessFlowWidget)
 
 Key Learning Topics:
-1. Custom Widget - inherit from kivy.uix.widget.Widget
-2. Canvas Drawing - using Kivy Graphics instructions
+1. Custom Widget - inherit from mdWidgets.ProgressRing
+2. Retained-mode Canvas - instructions built once, then mutated
 3. NumericProperty - Kivy's reactive properties
-4. Clock.schedule_interval - animation timer updates
+4. clockService ticks - shared animation timer updates
 5. Circular Progress Bar - Ellipse with angle_start and angle_end
+6. runEngine - the run's stages and timing live outside the widgets
 """
 
+import math
+
 from kivy.metrics import dp
-from kivy.clock import Clock
-from kivy.graphics import Color, Ellipse, Line
 from kivy.properties import NumericProperty, StringProperty
-from kivy.uix.widget import Widget
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
@@ -23,120 +23,62 @@ from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.floatlayout import MDFloatLayout
 from kivymd.uix.button import MDButton, MDButtonIcon, MDButtonText
 from kivymd.uix.label import MDLabel
-from datetime import datetime
-import math
+
+from mdWidgets import ProgressRing
+from clockService import TIER_1HZ, clock_service
+from screenLifecycle import ScreenLifecycleMixin
+from temperatureAcquisition import get_temperature_acquisition
+from heaterControl import get_heater_controller
+from runEngine import COMPLETED, DEMO_PROTOCOL, EVENT_STAGE, RunEngine
 
 
-class ProcessFlowWidget(Widget):
+class ProcessFlowWidget(ProgressRing):
     """
     Pie Chart Progress Animation Widget
     
     Core Concepts:
-    - Use Canvas to draw circles and sectors
-    - fill_percentage controls progress (0-100)
-    - Auto-update animation
+    - Retained-mode drawing: ProgressRing creates its canvas instructions once
+      and only updates angles/positions/colors afterwards
+    - The screen's RunEngine drives the ring: the active stage is highlighted
+      and the fill shows that stage's progress (ProgressRing.follow_engine)
+    - Auto-update animation (fill eases at display rate)
     """
     
     # Kivy reactive properties - auto-trigger updates when values change
-    remaining_time = NumericProperty(10)              # Remaining time (seconds)
-    current_stage = NumericProperty(0)                # Current stage index
-    fill_percentage = NumericProperty(0)               # Fill percentage 0-100
+    remaining_time = NumericProperty(0)               # Remaining time in the stage (seconds)
     stage_text = StringProperty("Initializing")        # Stage text
-    total_time_per_stage = 10                          # Duration per stage (seconds)
     
     def __init__(self, motor_screen, **kwargs):
         super().__init__(**kwargs)
         
         # Save reference to MotorControlScreen (for updating status)
         self.motor_screen = motor_screen
+        engine = motor_screen.engine
         
-        # Define all stages
-        self.stages = [
-            "Preheating",           # Preheating stage
-            "Heating",              # Heating stage
-            "Holding",              # High temperature holding stage
-            "Cooling",              # Cooling stage
-            "PCR Cycling",          # PCR data collection cycles
-            "Experiment Complete"   # Experiment finished
-        ]
+        # One ring segment per protocol stage, plus one for the finished run
+        self.stages = engine.protocol.stage_names + ["Experiment Complete"]
         
         print(f"📋 ProcessFlowWidget initialized with {len(self.stages)} stages")
         
-        # Start timer - update every second
-        Clock.schedule_interval(self.update_timer, 1)
+        # Stage highlight and fill follow the run engine
+        self.follow_engine(engine)
         
-        # Initial draw
-        self.update_canvas()
+        # Start timer - update every second (shared 1 Hz tick)
+        clock_service.subscribe(self.update_timer, TIER_1HZ)
     
-    def update_timer(self, dt):
-        """
-        Timer callback - called every second
-        
-        Functions:
-        1. Update remaining time
-        2. Switch stages
-        3. Update progress percentage
-        """
-        if self.remaining_time > 0:
-            self.remaining_time -= 1
-        else:
-            # Time's up, switch to next stage
-            self.current_stage = (self.current_stage + 1) % len(self.stages)
-            self.stage_text = self.stages[self.current_stage]
-            self.remaining_time = self.total_time_per_stage
-        
-        # Update canvas
-        self.update_canvas()
+    def _on_run_event(self, event):
+        super()._on_run_event(event)
+        if event.state == COMPLETED:
+            self.stage_text = self.stages[-1]
+        elif event.kind == EVENT_STAGE:
+            self.stage_text = event.stage.name
     
-    def on_size(self, *args):
-        """Redraw when window size changes"""
-        self.update_canvas()
-    
-    def update_canvas(self):
-        """
-        Core drawing method - draw pie chart progress animation
-        
-        Drawing steps:
-        1. Clear canvas
-        2. Draw gray background circle
-        3. Draw blue progress sector
-        4. Draw black border
-        """
-        # Clear previous drawings
-        self.canvas.clear()
-        
-        # Calculate circle radius and center position
-        radius = min(self.width, self.height) / 2 - 20
-        center_x, center_y = self.center_x, self.center_y
-        
-        with self.canvas:
-            # ========== 1. Draw gray background circle ==========
-            Color(0.9, 0.9, 0.9, 1)  # Light gray (R, G, B, Alpha)
-            Ellipse(
-                pos=(center_x - radius, center_y - radius),  # Bottom-left position
-                size=(radius * 2, radius * 2)                # Circle size
-            )
-            
-            # ========== 2. Draw blue progress sector ==========
-            # Calculate fill angle based on fill_percentage
-            fill_angle = 360 * (self.fill_percentage / 100)
-            Color(0.3, 0.5, 0.9, 1)  # Blue
-            Ellipse(
-                pos=(center_x - radius, center_y - radius),
-                size=(radius * 2, radius * 2),
-                angle_start=0,           # Start angle (from right, counter-clockwise)
-                angle_end=fill_angle     # End angle
-            )
-            
-            # ========== 3. Draw black border ==========
-            Color(0, 0, 0, 1)  # Black
-            Line(
-                circle=(center_x, center_y, radius),  # (center_x, center_y, radius)
-                width=2                                # Line width
-            )
+    def update_timer(self, dt):
+        """Timer callback - called every second to refresh the stage countdown"""
+        self.remaining_time = math.ceil(self.engine.stage_remaining)
 
 
-class MotorControlScreen(MDScreen):
+class MotorControlScreen(ScreenLifecycleMixin, MDScreen):
     """
     Motor Control Screen - Educational Version
     
@@ -151,7 +93,11 @@ class MotorControlScreen(MDScreen):
         
         # Initialize variables
         self.project_name = ""
-        self.stop_requested = False
+        
+        # ========== Run engine ==========
+        # Owns the stages, timing and heater setpoints; widgets only observe it
+        self.engine = RunEngine(DEMO_PROTOCOL, heater=get_heater_controller())
+        self.engine.attach_clock()
         
         # ========== Create pie chart animation widget ==========
         # Pass 'self' so ProcessFlowWidget can access this Screen
@@ -180,6 +126,9 @@ class MotorControlScreen(MDScreen):
         ui = self.build_ui()
         self.add_widget(ui)
         self.add_widget(self.project_label)
+        
+        # The demo run starts as soon as the screen exists
+        self.engine.start()
     
     def build_ui(self):
         """
@@ -317,46 +266,42 @@ class MotorControlScreen(MDScreen):
         
         # ========== Start timers ==========
         
-        # Update temperature every 0.5 seconds
-        Clock.schedule_interval(self.update_actual_temperature, 0.5)
+        # Temperature is sampled off the UI thread; the label gets the 2 Hz decimated stream
+        get_temperature_acquisition().subscribe_display(self.update_actual_temperature)
+        get_heater_controller().subscribe_display(self.update_heater_status)
         
-        # Update date/time every second
-        Clock.schedule_interval(self.update_date_time, 1)
+        # Update date/time every second (shared 1 Hz tick)
+        clock_service.subscribe(self.update_date_time, TIER_1HZ)
         
-        # Simulate progress update
-        Clock.schedule_interval(self.simulate_progress, 1)
+        # Stage countdown display
+        clock_service.subscribe(self.update_remaining_time, TIER_1HZ)
         
         return screen
     
-    def update_actual_temperature(self, dt):
+    def update_actual_temperature(self, point):
         """
         Update temperature display
-        
-        In real application, this would read from actual sensor
-        Here we just simulate with random values
+
+        `point` summarizes the samples taken since the last update
+        (see temperatureAcquisition.DisplayPoint)
         """
-        import random
-        temp = 25 + random.random() * 10  # Simulate 25-35°C
-        self.actual_temperature_label.text = f"Current Temperature: {temp:.1f} °C"
+        self.actual_temperature_label.text = f"Current Temperature: {point.mean:.1f} °C"
+    
+    def update_heater_status(self, state):
+        """Show the heater loop's newest state (see heaterControl.ControlState)"""
+        if state.fault:
+            self.status_label.text = f"Status: Heater fault ({state.fault})"
+        elif state.setpoint is None:
+            self.status_label.text = "Status: Heater off"
+        else:
+            self.status_label.text = f"Status: {state.stage} {state.setpoint:.0f} °C, heater {state.output:.0%}"
     
     def update_date_time(self, dt):
         """Update date/time display"""
-        now = datetime.now()
-        self.date_time_label.text = now.strftime("%Y-%m-%d %H:%M:%S")
+        self.date_time_label.text = clock_service.strftime("%Y-%m-%d %H:%M:%S")
     
-    def simulate_progress(self, dt):
-        """
-        Simulate progress for demo purposes
-        In real application, this would be updated by actual process
-        """
-        # Increase progress by 1% each second
-        if self.process_flow.fill_percentage < 100:
-            self.process_flow.fill_percentage += 1
-        else:
-            # Reset to 0 when reaching 100%
-            self.process_flow.fill_percentage = 0
-        
-        # Update remaining time display
+    def update_remaining_time(self, dt):
+        """Show the time left in the current stage"""
         total_seconds = int(self.process_flow.remaining_time)
         minutes = total_seconds // 60
         seconds = total_seconds % 60
@@ -375,7 +320,7 @@ class MotorControlScreen(MDScreen):
     def on_stop_clicked(self, *args):
         """Stop button clicked"""
         print("⏹️  Stop button clicked")
-        self.stop_requested = True
+        self.engine.abort()
     
     def on_result_clicked(self, *args):
         """Result button clicked"""
@@ -406,22 +351,22 @@ class DemoApp(MDApp):
         print("="*70)
         print("\n📚 Key Learning Points:")
         print("  1. ProcessFlowWidget - Custom circular progress widget")
-        print("  2. Canvas Drawing - Using Color, Ellipse, Line")
+        print("  2. Retained-mode Canvas - ProgressRing mutates angle_end")
         print("  3. NumericProperty - Reactive property system")
-        print("  4. Clock.schedule_interval - Timer-based animations")
+        print("  4. clockService ticks - Timer-based animations")
         print("  5. Complex Layout - Dual-column with multiple components")
         print("\n💡 Animation Features:")
-        print("  - Pie chart fills from 0% to 100%")
-        print("  - Automatic stage switching")
+        print("  - Pie chart fills from 0% to 100% per stage")
+        print("  - Stage switching driven by the RunEngine protocol")
         print("  - Real-time updates")
         print("\n🎨 Canvas Drawing Concepts:")
         print("  - Background circle: Gray base")
         print("  - Progress sector: Blue fill (angle_start to angle_end)")
         print("  - Border: Black outline")
         print("\n🔧 Try modifying:")
-        print("  - Change fill_percentage increment speed")
-        print("  - Modify colors in update_canvas()")
-        print("  - Add more stages to self.stages list")
+        print("  - Change stage durations in runEngine.DEMO_PROTOCOL")
+        print("  - Modify fill_color / stage_colors on ProgressRing")
+        print("  - Add more stages to the protocol")
         print("="*70 + "\n")
 
 
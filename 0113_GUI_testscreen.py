@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """
 MotorControlScreen with LoadingBar Demo - Standalone Version
-完全独立版本，包含LoadingBar类定义
+独立版本，包含LoadingBar类定义（定时器使用共享的 clockService）
 
 新布局：
 - Back/Home按钮（顶部左右）
@@ -12,7 +12,6 @@ MotorControlScreen with LoadingBar Demo - Standalone Version
 """
 
 from kivy.metrics import dp
-from kivy.clock import Clock
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.label import Label
 from kivy.graphics import Color, RoundedRectangle
@@ -30,8 +29,12 @@ from kivymd.uix.dialog import (
     MDDialogHeadlineText,
     MDDialogButtonContainer
 )
-from datetime import datetime
-import random
+
+from clockService import TIER_1HZ, clock_service
+from screenLifecycle import ScreenLifecycleMixin
+from temperatureAcquisition import get_temperature_acquisition
+from heaterControl import get_heater_controller
+from runEngine import ABORTED, ASSAY_PROTOCOL, EVENT_STATE, RUNNING, RunEngine
 
 
 # ============================================================================
@@ -47,12 +50,15 @@ class LoadingBar(RelativeLayout):
     - 显示百分比（大字叠加）
     - 显示剩余时间（顶部）
     - 圆角设计
+    - 传入 engine (runEngine.RunEngine) 时，进度和倒计时跟随运行引擎
     """
     
-    def __init__(self, total_time, **kwargs):
+    def __init__(self, total_time=None, engine=None, **kwargs):
         super().__init__(**kwargs)
 
-        self.total_time = total_time
+        # With an engine the run's duration and elapsed time come from it
+        self.engine = engine
+        self.total_time = int(engine.protocol.duration) if engine is not None else total_time
         self.elapsed = 0
 
         # Fill full width of parent, then center the bar graphics inside
@@ -122,7 +128,20 @@ class LoadingBar(RelativeLayout):
         #
         # --- UPDATE TIMER ---
         #
-        self._event = Clock.schedule_interval(self.update_progress, 1)
+        self._event = clock_service.subscribe(self.update_progress, TIER_1HZ)
+        if engine is not None:
+            engine.add_observer(self.on_run_state, kinds=(EVENT_STATE,))
+
+    def on_run_state(self, event):
+        """Stop counting down when the run pauses or ends, resume with it"""
+        if event.state == RUNNING:
+            if not self._event.active:
+                self._event = clock_service.subscribe(self.update_progress, TIER_1HZ)
+            return
+        self._event.cancel()
+        self.update_progress(0)
+        if event.state == ABORTED:
+            self.time_label.text = "Test Aborted"
 
     def _update_graphics(self, *args):
         # position of bar (lower portion) - use relative coordinates
@@ -160,8 +179,12 @@ class LoadingBar(RelativeLayout):
         #
         # update elapsed time - but don't go past total_time
         #
-        if self.elapsed < self.total_time:
-            self.elapsed += 1
+        if self.engine is not None:
+            # Whole seconds of run time, so the MM:SS text stays integral
+            self.elapsed = int(self.engine.elapsed)
+        elif self.elapsed < self.total_time:
+            # dt is larger than one tick when resuming from a paused screen
+            self.elapsed += max(1, int(round(dt)))
         else:
             # Already at or past total_time, cancel the timer
             self._event.cancel()
@@ -194,7 +217,7 @@ class LoadingBar(RelativeLayout):
 # MotorControlScreen Class - Main Test Interface
 # ============================================================================
 
-class MotorControlScreen(MDScreen):
+class MotorControlScreen(ScreenLifecycleMixin, MDScreen):
     """
     Motor Control Screen - with LoadingBar
     
@@ -209,11 +232,17 @@ class MotorControlScreen(MDScreen):
         
         # Initialize variables
         self.project_name = ""
-        self.stop_requested = False
+        
+        # The run engine owns the assay's stages, timing and heater setpoints
+        self.engine = RunEngine(ASSAY_PROTOCOL, heater=get_heater_controller())
+        self.engine.attach_clock()
         
         # Call build_ui() to construct the interface
         ui = self.build_ui()
         self.add_widget(ui)
+        
+        # Start the assay run (the LoadingBar counts down from the protocol's 300 s)
+        self.engine.start()
     
     def build_ui(self):
         """
@@ -288,7 +317,7 @@ class MotorControlScreen(MDScreen):
         # ========== LoadingBar Progress (center) ==========
         
         self.loading_bar = LoadingBar(
-            total_time=300,  # 5 minutes = 300 seconds
+            engine=self.engine,  # ASSAY_PROTOCOL: 5 minutes = 300 seconds
             size_hint=(0.8, None),
             height=dp(140),
             pos_hint={"center_x": 0.5, "center_y": 0.5}
@@ -430,23 +459,22 @@ class MotorControlScreen(MDScreen):
         
         # ========== Start timers ==========
         
-        # Update temperature every 0.5 seconds
-        Clock.schedule_interval(self.update_actual_temperature, 0.5)
+        # Temperature is sampled off the UI thread; the label gets the 2 Hz decimated stream
+        get_temperature_acquisition().subscribe_display(self.update_actual_temperature)
         
-        # Update date/time every second
-        Clock.schedule_interval(self.update_date_time, 1)
+        # Update date/time every second (shared 1 Hz tick)
+        clock_service.subscribe(self.update_date_time, TIER_1HZ)
         
         return screen
     
-    def update_actual_temperature(self, dt):
+    def update_actual_temperature(self, point):
         """
         Update temperature display
-        
-        In real application, this would read from actual sensor
-        Here we just simulate with random values
+
+        `point` summarizes the samples taken since the last update
+        (see temperatureAcquisition.DisplayPoint)
         """
-        temp = 25 + random.random() * 10  # Simulate 25-35°C
-        self.temperature_label.text = f"Current Temperature: {temp:.1f} °C"
+        self.temperature_label.text = f"Current Temperature: {point.mean:.1f} °C"
     
     # def update_date_time(self, dt):
     #     """Update date/time display"""
@@ -455,17 +483,15 @@ class MotorControlScreen(MDScreen):
 
     def update_date_time(self, dt):
         """Update date/time display"""
-        now = datetime.now()
-        
         # Format date: Jan 06, 2026
-        self.date_label.text = now.strftime("%b %d, %Y")
+        self.date_label.text = clock_service.strftime("%b %d, %Y")
         
         # Format time: 11:30 AM
         try:
-            self.time_label.text = now.strftime("%-I:%M %p")
+            self.time_label.text = clock_service.strftime("%-I:%M %p")
         except ValueError:
             # Windows uses %#I instead of %-I
-            self.time_label.text = now.strftime("%#I:%M %p")
+            self.time_label.text = clock_service.strftime("%#I:%M %p")
 
     def show_stop_confirm_dialog(self, instance):
         """Show confirmation dialog when user clicks Stop button"""
@@ -508,13 +534,9 @@ class MotorControlScreen(MDScreen):
         # 关闭对话框
         self.stop_dialog.dismiss()
         
-        # 执行停止操作
+        # 执行停止操作 (LoadingBar 通过引擎事件停止倒计时)
         print("⏹️  Abort Test confirmed")
-        self.stop_requested = True
-        
-        # 停止LoadingBar的倒计时
-        if hasattr(self, 'loading_bar') and hasattr(self.loading_bar, '_event'):
-            self.loading_bar._event.cancel()
+        self.engine.abort()
 
 
 # ============================================================================
@@ -558,7 +580,7 @@ class DemoApp(MDApp):
         print("  - LoadingBar automatically counts down from 300 seconds")
         print("  - Temperature updates every 0.5 seconds")
         print("  - Date/time updates every second")
-        print("\n✅ This is a standalone version - no external dependencies!")
+        print("\n✅ Standalone screen - timers run on the shared clockService ticks")
         print("="*70 + "\n")
 
 
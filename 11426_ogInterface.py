@@ -1,9 +1,14 @@
+from clockService import TIER_1HZ
+from hal import get_hal
+from temperatureAcquisition import get_temperature_acquisition
+
+
 def build_ui(self):
-    setup_gpio()
+    # GPIO setup and the I2C bus live in the HAL (real or simulated, see hal/config.py)
+    self.hal = get_hal()
 
     try:
-        with SMBus(1) as bus:
-            bus.write_byte_data(MCP4441_I2C_ADDRESS, MCP4441_COMMAND_BYTE, 0xFF)  #蓝光的强度在这里调整！！！！
+        self.hal.led.set_wiper(0, self.hal.config["led"]["default_wiper"])  #蓝光的强度在这里调整！！！！
     except Exception as e:
         print(f"[Warning] MCP4441 I2C init failed: {e}")
 
@@ -131,9 +136,13 @@ def build_ui(self):
 
     screen.add_widget(layout)
 
-    Clock.schedule_interval(self.update_actual_temperature, 0.5)
+    # Temperature is sampled off the UI thread (temperatureAcquisition). Both
+    # callbacks now get a DisplayPoint (mean/min/max/last of the samples since
+    # the previous call) instead of dt.
+    acquisition = get_temperature_acquisition()
+    acquisition.subscribe_display(self.update_actual_temperature)
     Clock.schedule_interval(self.update_date_time, 1)
-    Clock.schedule_interval(self.record_temperature, 1)  # 每隔1秒记录一次温度!!!!!!!!!!!!!!!!!!!!!!!!
+    acquisition.subscribe_display(self.record_temperature, tier=TIER_1HZ)  # 每隔1秒记录一次温度!!!!!!!!!!!!!!!!!!!!!!!!
 
     #step1_button.bind(on_press=self.step1_process)
     #step2_button.bind(on_press=self.start_step2)
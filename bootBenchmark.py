@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Boot-time benchmark for the app entry points.
+
+Each entry point is launched N times in a fresh headless process (SDL
+offscreen/dummy window) and the following marks are recorded, in ms since the
+process started:
+
+    kivy_import   - Kivy imported and the Window created
+    module_import - entry module imported (screens, widgets, KivyMD)
+    build         - App.build() returned (build_ms is its own duration)
+    on_start      - App.on_start dispatched
+    first_frame   - first Window flip after build
+
+Usage:
+    python bootBenchmark.py                      # all entry points, 5 runs
+    python bootBenchmark.py -n 10 test_1124      # one entry point
+    python bootBenchmark.py -o bench/boot        # writes bench/boot.json/.csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_T0 = time.perf_counter()
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (module, App class)
+ENTRY_POINTS = {
+    "test_1124": ("test_1124", "MyApp"),
+    "gui_testscreen": ("0113_GUI_testscreen", "DemoApp"),
+    "pretest_demo": ("0113_pretest_demo", "DemoApp"),
+    "main_og": ("mainOg1124", "DemoApp"),
+}
+
+MARKS = ["kivy_import", "module_import", "build", "build_ms", "on_start", "first_frame"]
+
+RESULT_PREFIX = "BOOTBENCH "
+
+
+def _ms_since_start():
+    return (time.perf_counter() - _T0) * 1000.0
+
+
+# ---------------------------------------------------------------------------
+# Child process: boot one entry point and report its marks
+# ---------------------------------------------------------------------------
+def run_child(entry_name):
+    import importlib
+
+    module_name, app_name = ENTRY_POINTS[entry_name]
+    marks = {}
+
+    from kivy.clock import Clock
+    from kivy.core.window import Window
+
+    marks["kivy_import"] = _ms_since_start()
+
+    sys.path.insert(0, HERE)
+    module = importlib.import_module(module_name)
+    marks["module_import"] = _ms_since_start()
+
+    app_cls = getattr(module, app_name)
+
+    class BenchApp(app_cls):
+        def build(self):
+            started = _ms_since_start()
+            root = super().build()
+            marks["build"] = _ms_since_start()
+            marks["build_ms"] = marks["build"] - started
+            Window.bind(on_flip=self._bench_on_flip)
+            return root
+
+        def on_start(self):
+            marks["on_start"] = _ms_since_start()
+            super().on_start()
+
+        def _bench_on_flip(self, *args):
+            if "first_frame" in marks:
+                return
+            marks["first_frame"] = _ms_since_start()
+            Window.unbind(on_flip=self._bench_on_flip)
+            Clock.schedule_once(lambda dt: self.stop(), 0)
+
+    # Entry points resolve assets relative to the repo root.
+    os.chdir(HERE)
+    BenchApp().run()
+    print(RESULT_PREFIX + json.dumps({"entry": entry_name, "marks": marks}), flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Parent process: repeat, aggregate, report
+# ---------------------------------------------------------------------------
+def run_once(entry_name, video_driver, timeout):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", video_driver)
+    env["KIVY_NO_ARGS"] = "1"
+    env["KIVY_NO_CONSOLELOG"] = "1"
+    proc = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", entry_name],
+        cwd=HERE,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])["marks"]
+    tail = "\n".join((proc.stderr or proc.stdout).splitlines()[-10:])
+    raise RuntimeError(f"{entry_name} exited with {proc.returncode} before its first frame:\n{tail}")
+
+
+def summarize(samples):
+    summary = {}
+    for mark in MARKS:
+        values = [s[mark] for s in samples if mark in s]
+        if not values:
+            continue
+        summary[mark] = {
+            "min": min(values),
+            "median": statistics.median(values),
+            "mean": statistics.fmean(values),
+            "max": max(values),
+        }
+    return summary
+
+
+def write_reports(results, output):
+    out_dir = os.path.dirname(output)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+
+    with open(output + ".json", "w") as f:
+        json.dump(results, f, indent=2)
+
+    with open(output + ".csv", "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["entry", "run"] + MARKS)
+        for entry_name, data in results["entries"].items():
+            for run, sample in enumerate(data["runs"]):
+                writer.writerow(
+                    [entry_name, run] + [f"{sample[m]:.2f}" if m in sample else "" for m in MARKS]
+                )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure time-to-first-frame for each app entry point.")
+    parser.add_argument("entries", nargs="*", help="entry points to run: %s (default: all)" % ", ".join(ENTRY_POINTS))
+    parser.add_argument("-n", "--runs", type=int, default=5, help="runs per entry point")
+    parser.add_argument("-o", "--output", default="boot_benchmark", help="report path without extension")
+    parser.add_argument("--video-driver", default="offscreen", help="SDL_VIDEODRIVER for the child processes (offscreen or dummy)")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds before a run is abandoned")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.child)
+        return 0
+
+    entries = args.entries or list(ENTRY_POINTS)
+    unknown = [e for e in entries if e not in ENTRY_POINTS]
+    if unknown:
+        parser.error("unknown entry point(s): %s" % ", ".join(unknown))
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "runs_per_entry": args.runs,
+        "video_driver": args.video_driver,
+        "entries": {},
+    }
+    failed = False
+    for entry_name in entries:
+        samples = []
+        for run in range(args.runs):
+            try:
+                samples.append(run_once(entry_name, args.video_driver, args.timeout))
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                print(f"[Warning] {entry_name} run {run}: {e}")
+                failed = True
+        results["entries"][entry_name] = {"runs": samples, "summary": summarize(samples)}
+
+        first_frame = results["entries"][entry_name]["summary"].get("first_frame")
+        if first_frame:
+            print(f"{entry_name:16s} first frame median {first_frame['median']:8.1f} ms  (min {first_frame['min']:.1f}, max {first_frame['max']:.1f}, n={len(samples)})")
+
+    write_reports(results, args.output)
+    print(f"Report written to {args.output}.json and {args.output}.csv")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+import time
+import weakref
+from types import MethodType
+
+from kivy.clock import Clock
+
+from virtualClock import virtual_clock
+
+
+# Tick tiers. Each tier owns at most one Clock interval, created when the first
+# subscriber arrives and cancelled when the last one goes away.
+TIER_1HZ = "1hz"
+TIER_2HZ = "2hz"
+TIER_FRAME = "frame"
+
+TIER_INTERVALS = {
+    TIER_1HZ: 1.0,
+    TIER_2HZ: 0.5,
+    TIER_FRAME: 0,
+}
+
+
+class TickSubscription:
+    """
+    Handle returned by ClockService.subscribe. Bound-method callbacks are held
+    weakly, so the subscription drops itself once the owning widget is
+    garbage-collected. `cancel()` removes it explicitly.
+    """
+
+    def __init__(self, service, tier, callback, owner=None, ui=True):
+        self.service = service
+        self.tier = tier
+        self.ui = ui
+        self.active = True
+        self.paused_at = None
+        if isinstance(callback, MethodType):
+            self._callback_ref = weakref.WeakMethod(callback)
+            self._callback = None
+        else:
+            self._callback_ref = None
+            self._callback = callback
+        self._owner_ref = weakref.ref(owner) if owner is not None else None
+
+    @property
+    def owner(self):
+        """The widget this subscription belongs to (explicit owner or the callback's self)."""
+        if self._owner_ref is not None:
+            return self._owner_ref()
+        callback = self.resolve()
+        return getattr(callback, "__self__", None)
+
+    @property
+    def paused(self):
+        return self.paused_at is not None
+
+    def resolve(self):
+        """Return the live callback, or None if its owner has been collected."""
+        if self._owner_ref is not None and self._owner_ref() is None:
+            return None
+        if self._callback_ref is not None:
+            return self._callback_ref()
+        return self._callback
+
+    def cancel(self):
+        if self.active:
+            self.active = False
+            self.service._remove(self)
+
+
+class ClockService:
+    """
+    Shared tick source for UI refreshes.
+
+    Widgets subscribe to a tier instead of scheduling their own intervals, so
+    any number of footers, loading bars and labels cost one Clock callback per
+    tier. Date/time strings are formatted once per tick through `strftime()`
+    and shared by every subscriber.
+    """
+
+    def __init__(self):
+        self._subscribers = {tier: [] for tier in TIER_INTERVALS}
+        self._events = {}
+        self._now = virtual_clock.datetime()
+        self._now_stamp = virtual_clock.now()
+        self._formatted = {}
+        # Optional `hook(callback, seconds)` called after each subscriber runs (profiling).
+        self.timing_hook = None
+
+    def subscribe(self, callback, tier=TIER_1HZ, owner=None, ui=True):
+        """
+        Call `callback(dt)` on every tick of `tier`. Pass `owner` when the
+        callback is not a bound method of the widget that should keep it alive.
+        `ui=False` marks a tick that must keep running while its screen is
+        hidden (data acquisition, run bookkeeping).
+        """
+        if tier not in TIER_INTERVALS:
+            raise ValueError(f"Unknown tick tier: {tier!r}")
+        subscription = TickSubscription(self, tier, callback, owner, ui)
+        self._subscribers[tier].append(subscription)
+        if tier not in self._events:
+            self._events[tier] = Clock.schedule_interval(
+                lambda dt, t=tier: self._tick(t, dt), TIER_INTERVALS[tier]
+            )
+        return subscription
+
+    def subscriber_count(self, tier=None):
+        if tier is not None:
+            return len(self._subscribers[tier])
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    # --- Visibility ---
+    def subscriptions_in(self, root):
+        """Active subscriptions whose owner widget sits inside `root`'s tree."""
+        found = []
+        for subscribers in self._subscribers.values():
+            for subscription in subscribers:
+                widget = subscription.owner
+                while widget is not None and widget is not root:
+                    parent = getattr(widget, "parent", None)
+                    # The Window is its own parent, which ends the chain.
+                    widget = parent if parent is not widget else None
+                if widget is root:
+                    found.append(subscription)
+        return found
+
+    def pause_tree(self, root):
+        """Stop dispatching UI ticks to widgets inside `root` (e.g. a hidden screen)."""
+        now = virtual_clock.now()
+        for subscription in self.subscriptions_in(root):
+            if subscription.ui and not subscription.paused:
+                subscription.paused_at = now
+
+    def resume_tree(self, root):
+        """
+        Resume UI ticks inside `root`. Each callback is called once right away
+        with the time spent paused as `dt`, so it can catch up from wall-clock;
+        `subscription.paused` is still True during that call.
+        """
+        now = virtual_clock.now()
+        for subscription in self.subscriptions_in(root):
+            if not subscription.paused:
+                continue
+            paused_for = now - subscription.paused_at
+            callback = subscription.resolve()
+            try:
+                if callback is not None:
+                    callback(paused_for)
+            finally:
+                subscription.paused_at = None
+
+    # --- Shared formatting ---
+    def now(self):
+        """Wall-clock time of the current 1 Hz tick, as seen by virtual_clock."""
+        self._ensure_fresh()
+        return self._now
+
+    def strftime(self, fmt):
+        """`now().strftime(fmt)`, formatted at most once per 1 Hz tick."""
+        self._ensure_fresh()
+        text = self._formatted.get(fmt)
+        if text is None:
+            text = self._now.strftime(fmt)
+            self._formatted[fmt] = text
+        return text
+
+    def refresh_now(self):
+        self._now = virtual_clock.datetime()
+        self._now_stamp = virtual_clock.now()
+        self._formatted.clear()
+
+    def _ensure_fresh(self):
+        # Covers reads between ticks or while no 1 Hz subscriber is running.
+        if virtual_clock.now() - self._now_stamp >= TIER_INTERVALS[TIER_1HZ]:
+            self.refresh_now()
+
+    # --- Dispatch ---
+    def _tick(self, tier, dt):
+        if tier == TIER_1HZ:
+            self.refresh_now()
+        subscribers = self._subscribers[tier]
+        for subscription in list(subscribers):
+            if not subscription.active or subscription.paused_at is not None:
+                continue
+            callback = subscription.resolve()
+            if callback is None:
+                subscription.cancel()
+                continue
+            hook = self.timing_hook
+            if hook is None:
+                callback(dt)
+            else:
+                start = time.perf_counter()
+                callback(dt)
+                hook(callback, time.perf_counter() - start)
+
+    def _remove(self, subscription):
+        subscribers = self._subscribers[subscription.tier]
+        if subscription in subscribers:
+            subscribers.remove(subscription)
+        if not subscribers:
+            event = self._events.pop(subscription.tier, None)
+            if event is not None:
+                event.cancel()
+
+
+clock_service = ClockService()
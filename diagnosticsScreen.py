@@ -0,0 +1,130 @@
+from kivy.app import App
+from kivy.core.window import Window
+from kivy.metrics import dp
+from kivy.uix.scrollview import ScrollView
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.button import MDButton, MDButtonText
+from kivymd.uix.label import MDLabel
+from kivymd.uix.screen import MDScreen
+
+from screenLifecycle import ScreenLifecycleMixin
+from stallWatchdog import stall_watchdog
+from mdWidgets import (
+    uni_backButton,
+    uni_centerBox,
+    uni_lowerContainer,
+    uni_upperContainer,
+)
+
+DIAGNOSTICS_SCREEN = "diagnostics"
+
+
+def open_diagnostics(manager=None):
+    """Show the diagnostics screen, returning to the current screen on Back."""
+    if manager is None:
+        manager = getattr(App.get_running_app(), "root", None)
+    if manager is None or not manager.has_screen(DIAGNOSTICS_SCREEN):
+        print("[Warning] No diagnostics screen registered")
+        return False
+    if manager.current != DIAGNOSTICS_SCREEN:
+        manager.get_screen(DIAGNOSTICS_SCREEN).return_to = manager.current
+        manager.current = DIAGNOSTICS_SCREEN
+    return True
+
+
+class DiagnosticsScreen(ScreenLifecycleMixin, MDScreen):
+    """Lists the UI stalls recorded by `stall_watchdog`, newest first, with their stacks."""
+
+    def __init__(self, watchdog=stall_watchdog, **kwargs):
+        super().__init__(**kwargs)
+        self.watchdog = watchdog
+        self.return_to = None
+
+        self.md_bg_color = (1, 1, 1, 1)
+        self.size_hint = (1, 1)
+
+        top = uni_upperContainer(
+            title="Diagnostics",
+            size_hint=(0.95, None),
+            pos_hint={"center_x": 0.5, "top": 1},
+        )
+        self.add_widget(top)
+
+        main_content = uni_centerBox(
+            size_hint=(0.9, 0.7),
+            pos_hint={"center_x": 0.5, "center_y": 0.48},
+        )
+        self.add_widget(main_content)
+
+        header = MDBoxLayout(
+            orientation="horizontal",
+            size_hint=(1, None),
+            height=dp(48),
+            spacing=dp(20),
+        )
+        self.summary_label = MDLabel(
+            text="",
+            font_size="20sp",
+            bold=True,
+            theme_text_color="Custom",
+            text_color=(0.16, 0.30, 0.62, 1),
+        )
+        clear_button = MDButton(
+            MDButtonText(text="Clear"),
+            style="outlined",
+            size_hint=(None, None),
+            size=(dp(120), dp(44)),
+        )
+        clear_button.bind(on_release=self.on_clear)
+        header.add_widget(self.summary_label)
+        header.add_widget(clear_button)
+        main_content.add_widget(header)
+
+        scroll = ScrollView(do_scroll_x=False)
+        self.stalls_label = MDLabel(
+            text="",
+            font_name="RobotoMono-Regular",
+            font_size="13sp",
+            adaptive_height=True,
+            size_hint_x=1,
+        )
+        scroll.add_widget(self.stalls_label)
+        main_content.add_widget(scroll)
+
+        bottom = uni_lowerContainer(
+            size_hint=(1, None),
+            pos_hint={"x": 0, "y": 0},
+        )
+        back_button = uni_backButton()
+        back_button.bind(on_release=self.go_back)
+        bottom.left_box.add_widget(back_button)
+        bottom.width = Window.width
+        self.add_widget(bottom)
+
+        def update_width(*args):
+            if bottom.parent:
+                bottom.width = bottom.parent.width
+        Window.bind(width=update_width)
+        self.bind(width=update_width)
+
+    def on_pre_enter(self, *args):
+        self.refresh()
+        return super().on_pre_enter(*args)
+
+    def refresh(self, *args):
+        stalls = self.watchdog.stalls
+        state = "running" if self.watchdog.running else "stopped"
+        threshold_ms = self.watchdog.threshold * 1000
+        self.summary_label.text = f"{len(stalls)} UI stall(s) over {threshold_ms:.0f} ms (watchdog {state})"
+        if not stalls:
+            self.stalls_label.text = "No stalls recorded."
+            return
+        self.stalls_label.text = "\n\n".join(stall.format() for stall in stalls)
+
+    def on_clear(self, *args):
+        self.watchdog.clear()
+        self.refresh()
+
+    def go_back(self, *args):
+        if self.manager is not None and self.return_to:
+            self.manager.current = self.return_to
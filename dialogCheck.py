@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Headless check of the pooled dialogs' single-pass layout.
+
+Opens the confirm and completed dialogs from `mdDialogs.dialog_pool` a few
+times each (the first open builds, later ones reuse the pooled dialog), lets
+them settle, and checks that:
+
+    - the dialog body (`dialog.content.layout_passes`) was laid out at most
+      --max-passes times after `layout_dialog` sized it, and
+    - the dialog kept the height `layout_dialog` gave it, i.e. the measured
+      MDDialog chrome matches what KivyMD's kv lays out.
+
+Usage:
+    python dialogCheck.py
+    python dialogCheck.py --rounds 3 --max-passes 2
+
+Exits with code 1 if any open failed a check, so it doubles as a regression test.
+"""
+
+import os
+import sys
+
+if __name__ == "__main__":
+    # Headless by default; the CLI has its own arguments.
+    os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.clock import Clock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DIALOG_KINDS = ("confirm", "completed")
+
+
+def check_dialogs(rounds, max_passes, settle):
+    """Open every pooled dialog kind `rounds` times. Returns one result per open."""
+    sys.path.insert(0, HERE)
+    os.chdir(HERE)
+    from kivymd.app import MDApp
+    from kivymd.uix.screen import MDScreen
+
+    import mdDialogs
+
+    openers = {
+        "confirm": lambda: mdDialogs.confirmOverlay(None),
+        "completed": lambda: mdDialogs.actionCompletedOverlay(),
+    }
+    results = []
+
+    class CheckApp(MDApp):
+        def build(self):
+            return MDScreen()
+
+        def on_start(self):
+            self._queue = [kind for _ in range(rounds) for kind in DIALOG_KINDS]
+            self._seen = set()
+            Clock.schedule_once(self._next_dialog, settle)
+
+        def _next_dialog(self, dt):
+            if not self._queue:
+                self.stop()
+                return
+            kind = self._queue.pop(0)
+            dialog = openers[kind]()
+            pooled = id(dialog) in self._seen
+            self._seen.add(id(dialog))
+            dialog.open()
+            # on_pre_open ran layout_dialog: this is the height it computed.
+            sized_height = dialog.height
+            Clock.schedule_once(lambda dt: self._measure(kind, dialog, pooled, sized_height), settle)
+
+        def _measure(self, kind, dialog, pooled, sized_height):
+            result = {
+                "kind": kind,
+                "pooled": pooled,
+                "layout_passes": dialog.content.layout_passes,
+                "sized_height": sized_height,
+                "height": dialog.height,
+                "errors": [],
+            }
+            if result["layout_passes"] > max_passes:
+                result["errors"].append(f"{result['layout_passes']} layout passes (max {max_passes})")
+            if abs(dialog.height - sized_height) > 1:
+                result["errors"].append(f"height settled at {dialog.height:.0f}, layout_dialog gave {sized_height:.0f}")
+            results.append(result)
+            status = "ok" if not result["errors"] else "[Warning] " + "; ".join(result["errors"])
+            print(f"{kind:>9s} ({'pooled' if pooled else 'built'}): {result['layout_passes']} layout pass(es), {status}")
+            dialog.dismiss()
+            # Wait for the hide animation, so the next open can reuse the dialog.
+            Clock.schedule_once(self._next_dialog, settle)
+
+    CheckApp().run()
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Check that pooled dialogs open in a single layout pass.")
+    parser.add_argument("--rounds", type=int, default=2, help="opens per dialog kind (the first one builds the dialog)")
+    parser.add_argument("--max-passes", type=int, default=1, help="layout passes of the dialog body allowed per open")
+    parser.add_argument("--settle", type=float, default=0.5, help="seconds to let a dialog settle before measuring")
+    args = parser.parse_args(argv)
+
+    results = check_dialogs(args.rounds, args.max_passes, args.settle)
+    failed = [r for r in results if r["errors"]]
+    expected = args.rounds * len(DIALOG_KINDS)
+    print(f"{len(results)}/{expected} dialog opens checked, {len(failed)} failed")
+    return 1 if failed or len(results) < expected else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Frame-time and Clock-callback profiler with an on-screen overlay.
+
+`FrameProfiler.install()` wraps `Clock.schedule_interval`, `schedule_once`
+and `create_trigger`, so every callback registered afterwards is timed, and
+hooks `clock_service` so each tier subscriber (`update_clock`,
+`update_progress`, `update_actual_temperature`, ...) is timed on its own
+instead of as one tier tick. It also records the time between frames.
+
+The overlay shows, over the last `window` seconds: FPS, 95th-percentile frame
+time and the callbacks with the most cumulative time. Triple-tap the title of
+any `uni_upperContainer` to toggle it, or call `toggle_profiler_overlay()`.
+Tapping the overlay opens the diagnostics screen.
+
+Callbacks registered before `install()` are not timed (except clock_service
+subscribers); call `frame_profiler.install()` at startup to see everything.
+"""
+
+import time
+import weakref
+from collections import defaultdict, deque
+from functools import partial
+from types import MethodType
+
+from kivy.clock import Clock
+from kivy.graphics import Color, Rectangle
+from kivy.metrics import dp
+from kivy.uix.label import Label
+
+from clockService import clock_service
+
+
+def callback_name(callback):
+    """Readable key for a callback: `Class.method`, `function` or `<lambda> module:line`."""
+    if isinstance(callback, partial):
+        return callback_name(callback.func)
+    if isinstance(callback, MethodType):
+        return f"{type(callback.__self__).__name__}.{callback.__func__.__name__}"
+    name = getattr(callback, "__qualname__", None) or repr(callback)
+    code = getattr(callback, "__code__", None)
+    if "<lambda>" in name and code is not None:
+        module = code.co_filename.rsplit("/", 1)[-1]
+        return f"<lambda> {module}:{code.co_firstlineno}"
+    return name
+
+
+class FrameProfiler:
+    def __init__(self, window=5.0, top=8):
+        self.window = window
+        self.top = top
+        self.installed = False
+        self._frames = deque()
+        self._calls = deque()
+        self._originals = {}
+        self._frame_event = None
+        # `listener(name, start, duration)` for every timed call (see traceRecorder).
+        self.listeners = []
+
+    # --- Install / uninstall ---
+    def install(self):
+        if self.installed:
+            return self
+        self.installed = True
+        for name in ("schedule_interval", "schedule_once", "create_trigger", "unschedule"):
+            self._originals[name] = getattr(Clock, name)
+        Clock.schedule_interval = self._schedule_interval
+        Clock.schedule_once = self._schedule_once
+        Clock.create_trigger = self._create_trigger
+        Clock.unschedule = self._unschedule
+        clock_service.timing_hook = self.record
+        self._frame_event = self._originals["schedule_interval"](self._on_frame, 0)
+        return self
+
+    def uninstall(self):
+        if not self.installed:
+            return
+        self.installed = False
+        self._frame_event.cancel()
+        self._frame_event = None
+        # Drop the instance overrides so the Clock's own methods show through.
+        for name in self._originals:
+            delattr(Clock, name)
+        self._originals.clear()
+        if clock_service.timing_hook == self.record:
+            clock_service.timing_hook = None
+        self._frames.clear()
+        self._calls.clear()
+
+    # --- Clock wrappers ---
+    def _wrap(self, callback):
+        if getattr(callback, "_profiled_callback", None) is not None:
+            return callback
+        # Kivy holds bound-method callbacks weakly; keep it that way.
+        if isinstance(callback, MethodType):
+            ref = weakref.WeakMethod(callback)
+        else:
+            ref = lambda: callback  # noqa: E731
+        name = callback_name(callback)
+        profiler = self
+
+        def profiled(*args):
+            target = ref()
+            if target is None:
+                return False
+            if not profiler.installed:
+                return target(*args)
+            start = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                profiler.record(name, time.perf_counter() - start, start)
+
+        profiled._profiled_callback = ref
+        return profiled
+
+    def _schedule_interval(self, callback, timeout):
+        return self._originals["schedule_interval"](self._wrap(callback), timeout)
+
+    def _schedule_once(self, callback, timeout=0):
+        return self._originals["schedule_once"](self._wrap(callback), timeout)
+
+    def _create_trigger(self, callback, timeout=0, interval=False, release_ref=True):
+        return self._originals["create_trigger"](self._wrap(callback), timeout, interval, release_ref)
+
+    def _unschedule(self, callback, all=True):
+        # `Clock.unschedule(method)` must still find events registered through a wrapper.
+        if callable(callback) and not hasattr(callback, "cancel"):
+            for event in Clock.get_events():
+                ref = getattr(event.get_callback(), "_profiled_callback", None)
+                if ref is not None and ref() == callback:
+                    event.cancel()
+                    if not all:
+                        return
+        self._originals["unschedule"](callback, all)
+
+    # --- Recording ---
+    def record(self, callback, duration, start=None):
+        """Add one timed call. `callback` is a callable or an already formatted name."""
+        name = callback if isinstance(callback, str) else callback_name(callback)
+        end = time.perf_counter()
+        self._calls.append((end, name, duration))
+        for listener in self.listeners:
+            listener(name, end - duration if start is None else start, duration)
+
+    def _on_frame(self, dt):
+        now = time.perf_counter()
+        self._frames.append((now, dt))
+        cutoff = now - self.window
+        for samples in (self._frames, self._calls):
+            while samples and samples[0][0] < cutoff:
+                samples.popleft()
+
+    # --- Stats ---
+    def frame_stats(self):
+        """(fps, p95 frame time in seconds) over the window."""
+        times = [dt for _, dt in self._frames if dt > 0]
+        if not times:
+            return 0.0, 0.0
+        fps = len(times) / sum(times)
+        times.sort()
+        p95 = times[min(len(times) - 1, int(len(times) * 0.95))]
+        return fps, p95
+
+    def top_callbacks(self, count=None):
+        """[(name, total seconds, calls)] sorted by cumulative time over the window."""
+        totals = defaultdict(lambda: [0.0, 0])
+        for _, name, duration in self._calls:
+            entry = totals[name]
+            entry[0] += duration
+            entry[1] += 1
+        ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)
+        return [(name, total, calls) for name, (total, calls) in ranked[: count or self.top]]
+
+    def summary(self):
+        fps, p95 = self.frame_stats()
+        lines = [f"{fps:5.1f} fps   p95 {p95 * 1000:5.1f} ms   last {self.window:g}s"]
+        for name, total, calls in self.top_callbacks():
+            lines.append(f"{total * 1000:7.1f} ms {calls:5d}x  {name}")
+        return "\n".join(lines)
+
+
+frame_profiler = FrameProfiler()
+
+
+class ProfilerOverlay(Label):
+    """Semi-transparent text panel in the top-left corner of the Window."""
+
+    def __init__(self, profiler=frame_profiler, **kwargs):
+        kwargs.setdefault("font_size", "13sp")
+        kwargs.setdefault("font_name", "RobotoMono-Regular")
+        super().__init__(
+            size_hint=(None, None),
+            halign="left",
+            valign="top",
+            color=(0.7, 1, 0.7, 1),
+            padding=(dp(10), dp(8)),
+            **kwargs,
+        )
+        self.profiler = profiler
+        self._event = None
+        self._owns_install = False
+
+        with self.canvas.before:
+            Color(0, 0, 0, 0.75)
+            self.bg = Rectangle()
+
+        self.bind(texture_size=self._fit, pos=self._update_bg, size=self._update_bg)
+
+    def on_touch_down(self, touch):
+        # Tapping the overlay opens the diagnostics screen (recorded UI stalls).
+        if self.collide_point(*touch.pos):
+            from diagnosticsScreen import open_diagnostics
+
+            open_diagnostics()
+            return True
+        return super().on_touch_down(touch)
+
+    def _fit(self, *args):
+        self.size = self.texture_size
+        self._place()
+
+    def _place(self, *args):
+        from kivy.core.window import Window
+
+        self.pos = (dp(10), Window.height - self.height - dp(10))
+
+    def _update_bg(self, *args):
+        self.bg.pos = self.pos
+        self.bg.size = self.size
+
+    def show(self):
+        from kivy.core.window import Window
+
+        # Leave a profiler installed at startup running when the overlay closes.
+        self._owns_install = not self.profiler.installed
+        self.profiler.install()
+        if self.parent is None:
+            Window.add_widget(self)
+        Window.bind(height=self._place)
+        # The profiler's own Clock methods, so the overlay doesn't time itself.
+        self._event = self.profiler._originals["schedule_interval"](self.refresh, 0.5)
+        self.refresh()
+
+    def hide(self):
+        from kivy.core.window import Window
+
+        if self._event is not None:
+            self._event.cancel()
+            self._event = None
+        Window.unbind(height=self._place)
+        if self.parent is not None:
+            self.parent.remove_widget(self)
+        if self._owns_install:
+            self.profiler.uninstall()
+
+    @property
+    def is_open(self):
+        return self.parent is not None
+
+    def refresh(self, *args):
+        self.text = self.profiler.summary()
+
+
+_overlay = None
+
+
+def toggle_profiler_overlay():
+    global _overlay
+    if _overlay is None:
+        _overlay = ProfilerOverlay()
+    if _overlay.is_open:
+        _overlay.hide()
+    else:
+        _overlay.show()
+    return _overlay
@@ -0,0 +1,103 @@
+"""
+Hardware abstraction layer.
+
+    from hal import get_hal
+
+    hal = get_hal()                 # backend from POCT_HAL / POCT_HAL_CONFIG
+    hal.led.set_wiper(0, 0xFF)
+    hal.heater.set_power(0.5)
+    print(hal.temperature.read())
+
+`get_hal()` returns one shared instance per process. Its I2C traffic is
+served by a BusService thread (hal.bus), so callers never block on the bus
+for writes. The simulated backend ("sim") runs anywhere; the real one needs
+smbus2, RPi.GPIO and /dev/i2c-1.
+"""
+
+from .config import DEFAULT_CONFIG, load_config
+from .interfaces import GPIO, Hal, Heater, I2CBus, LedDriver, Motor, TemperatureSensor
+from .mcp4441 import MCP4441, MCP4441_COMMAND_BYTE, MCP4441_I2C_ADDRESS
+
+BACKENDS = ("real", "sim")
+
+_hal = None
+
+
+def create_hal(backend=None, config=None, **sim_options):
+    """
+    Build a new Hal. `backend` overrides the configured one; `sim_options`
+    (`time_source`, `sleep`) are passed to the simulated backend.
+    """
+    config = config or load_config()
+    backend = backend or config["backend"]
+    if backend == "auto":
+        from . import real
+
+        backend = "real" if real.available(config) else "sim"
+    if backend == "real":
+        from . import real
+
+        hal = real.create(config)
+    elif backend == "sim":
+        from . import simulated
+
+        hal = simulated.create(config, **sim_options)
+    else:
+        raise ValueError(f"Unknown HAL backend: {backend!r} (expected one of {BACKENDS} or 'auto')")
+
+    hal.config = config
+    if config["bus_service"]:
+        attach_bus_service(hal)
+    return hal
+
+
+def attach_bus_service(hal):
+    """
+    Move the HAL's I2C traffic onto a BusService thread. Temperature reads go
+    first; LED writes are fire-and-forget so UI code never waits on the bus.
+    """
+    from .bus import PRIORITY_COSMETIC, PRIORITY_SAFETY, BusService
+
+    service = BusService(hal.bus).start()
+    hal.bus_service = service
+    hal.temperature.bus = service.client(PRIORITY_SAFETY)
+    hal.led.bus = service.client(PRIORITY_COSMETIC, wait_writes=False)
+    return service
+
+
+def get_hal(backend=None, **kwargs):
+    """The process-wide Hal, created on first use."""
+    global _hal
+    if _hal is None:
+        _hal = create_hal(backend, **kwargs)
+        print(f"HAL backend: {_hal.backend}")
+    return _hal
+
+
+def reset_hal():
+    """Shut down and forget the shared Hal (tests, backend switches)."""
+    global _hal
+    if _hal is not None:
+        _hal.shutdown()
+        _hal = None
+
+
+__all__ = [
+    "BACKENDS",
+    "DEFAULT_CONFIG",
+    "GPIO",
+    "Hal",
+    "Heater",
+    "I2CBus",
+    "LedDriver",
+    "MCP4441",
+    "MCP4441_COMMAND_BYTE",
+    "MCP4441_I2C_ADDRESS",
+    "Motor",
+    "TemperatureSensor",
+    "attach_bus_service",
+    "create_hal",
+    "get_hal",
+    "load_config",
+    "reset_hal",
+]
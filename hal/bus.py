@@ -0,0 +1,307 @@
+"""
+I2C bus service: one thread owns the bus, everyone else queues requests.
+
+Requests are served in priority order (lower number first, FIFO within a
+priority), so a heater temperature read never waits behind a queue of LED
+updates. Each request returns a `concurrent.futures.Future`. A write to an
+(address, register) that already has a write waiting in the queue replaces
+that write's data instead of adding another transaction; both futures
+resolve when the surviving write completes.
+
+    service = BusService(hal.bus).start()
+    service.write(0x2C, 0x00, 0xFF, priority=PRIORITY_COSMETIC)
+    value = service.read(0x48, 0x00, 2, priority=PRIORITY_SAFETY).result()
+
+Device drivers that expect an I2CBus get one from `service.client(priority)`.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+
+from .interfaces import I2CBus
+
+PRIORITY_SAFETY = 0
+PRIORITY_CONTROL = 10
+PRIORITY_NORMAL = 50
+PRIORITY_COSMETIC = 90
+
+# Histogram bucket upper edges in seconds (the last bucket is open-ended).
+LATENCY_BUCKETS = (0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5)
+
+
+class LatencyHistogram:
+    def __init__(self, edges=LATENCY_BUCKETS):
+        self.edges = edges
+        self.counts = [0] * (len(edges) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        index = 0
+        while index < len(self.edges) and seconds > self.edges[index]:
+            index += 1
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p):
+        """Upper edge of the bucket holding the p-th percentile (`max` for the open bucket)."""
+        if not self.count:
+            return 0.0
+        target = p / 100 * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return self.edges[index] if index < len(self.edges) else self.max
+        return self.max
+
+    def summary(self):
+        return (
+            f"n={self.count} mean={self.mean * 1000:.2f}ms p50<={self.percentile(50) * 1000:.2f}ms "
+            f"p95<={self.percentile(95) * 1000:.2f}ms max={self.max * 1000:.2f}ms"
+        )
+
+
+class BusStopped(RuntimeError):
+    """The BusService was stopped (or never started); the request was not served."""
+
+
+def _fail(request, error):
+    for future in request.futures:
+        if not future.done():
+            future.set_exception(error)
+
+
+class _Request:
+    __slots__ = ("kind", "priority", "address", "register", "payload", "futures", "queued_at", "stale")
+
+    def __init__(self, kind, priority, address, register, payload):
+        self.kind = kind
+        self.priority = priority
+        self.address = address
+        self.register = register
+        self.payload = payload
+        self.futures = [Future()]
+        self.queued_at = time.perf_counter()
+        self.stale = False
+
+
+class BusService:
+    def __init__(self, bus, name="i2c-bus"):
+        self.bus = bus
+        self.name = name
+        self.coalesced = 0
+        # Per request kind: time waiting in the queue, and time on the bus.
+        self.wait_latency = {}
+        self.bus_latency = {}
+        self._heap = []
+        self._seq = itertools.count()
+        self._pending_writes = {}
+        self._condition = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    # --- Lifecycle ---
+    def start(self):
+        if self._thread is None:
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        """
+        Finish the queued requests, then stop the thread. Requests still
+        queued when `timeout` runs out, and any submitted afterwards, fail
+        with BusStopped.
+        """
+        with self._condition:
+            self._running = False
+            self._condition.notify()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._condition:
+            abandoned = [request for _, _, request in self._heap if not request.stale]
+            self._heap.clear()
+            self._pending_writes.clear()
+        for request in abandoned:
+            _fail(request, BusStopped(f"{self.name} stopped before serving this request"))
+
+    @property
+    def queue_depth(self):
+        with self._condition:
+            return sum(1 for _, _, request in self._heap if not request.stale)
+
+    # --- Requests ---
+    def read(self, address, register, length=1, priority=PRIORITY_NORMAL):
+        """Future of the `length` bytes starting at `register`."""
+        return self._submit(_Request("read", priority, address, register, length))
+
+    def write(self, address, register, data, priority=PRIORITY_NORMAL, coalesce=True):
+        """Write one byte (int) or a block (bytes/list). Future resolves to None."""
+        payload = [data] if isinstance(data, int) else list(data)
+        request = _Request("write", priority, address, register, payload)
+        if not coalesce:
+            return self._submit(request)
+
+        key = (address, register)
+        with self._condition:
+            if not self._running:
+                _fail(request, BusStopped(f"{self.name} is not running"))
+                return request.futures[0]
+            queued = self._pending_writes.get(key)
+            if queued is not None and len(queued.payload) == len(payload):
+                # Only the last value matters; ride along with the queued write.
+                self.coalesced += 1
+                queued.payload = payload
+                queued.futures.append(request.futures[0])
+                if priority < queued.priority:
+                    # Re-queue at the more urgent priority; the old heap entry is skipped.
+                    queued.stale = True
+                    promoted = _Request("write", priority, address, register, payload)
+                    promoted.futures = queued.futures
+                    promoted.queued_at = queued.queued_at
+                    self._push(promoted)
+                    self._pending_writes[key] = promoted
+                return request.futures[0]
+            self._pending_writes[key] = request
+            self._push(request)
+        return request.futures[0]
+
+    def call(self, fn, priority=PRIORITY_NORMAL):
+        """
+        Run `fn(bus)` on the bus thread as one transaction batch (e.g. a
+        register read-modify-write that must not be interleaved).
+        """
+        return self._submit(_Request("call", priority, None, None, fn))
+
+    def client(self, priority=PRIORITY_NORMAL, wait_writes=True):
+        """An I2CBus whose transactions go through this service at `priority`."""
+        return QueuedI2C(self, priority, wait_writes)
+
+    def stats(self):
+        lines = [f"{self.name}: queue={self.queue_depth} coalesced={self.coalesced}"]
+        for kind in sorted(self.bus_latency):
+            lines.append(f"  {kind} wait {self.wait_latency[kind].summary()}")
+            lines.append(f"  {kind} bus  {self.bus_latency[kind].summary()}")
+        return "\n".join(lines)
+
+    # --- Internals ---
+    def _push(self, request):
+        heapq.heappush(self._heap, (request.priority, next(self._seq), request))
+        self._condition.notify()
+
+    def _submit(self, request):
+        with self._condition:
+            if self._running:
+                self._push(request)
+                return request.futures[0]
+        _fail(request, BusStopped(f"{self.name} is not running"))
+        return request.futures[0]
+
+    def _next(self):
+        with self._condition:
+            while True:
+                while self._heap:
+                    _, _, request = heapq.heappop(self._heap)
+                    if request.stale:
+                        continue
+                    if request.kind == "write":
+                        key = (request.address, request.register)
+                        if self._pending_writes.get(key) is request:
+                            del self._pending_writes[key]
+                    return request
+                if not self._running:
+                    return None
+                self._condition.wait()
+
+    def _run(self):
+        while True:
+            request = self._next()
+            if request is None:
+                return
+            started = time.perf_counter()
+            try:
+                if request.kind == "read":
+                    result = self.bus.read_i2c_block_data(request.address, request.register, request.payload)
+                elif request.kind == "write":
+                    if len(request.payload) == 1:
+                        self.bus.write_byte_data(request.address, request.register, request.payload[0])
+                    else:
+                        self.bus.write_i2c_block_data(request.address, request.register, request.payload)
+                    result = None
+                else:
+                    result = request.payload(self.bus)
+            except Exception as e:
+                for future in request.futures:
+                    future.set_exception(e)
+            else:
+                for future in request.futures:
+                    future.set_result(result)
+            finished = time.perf_counter()
+            self._histogram(self.wait_latency, request.kind).record(started - request.queued_at)
+            self._histogram(self.bus_latency, request.kind).record(finished - started)
+
+    @staticmethod
+    def _histogram(table, kind):
+        histogram = table.get(kind)
+        if histogram is None:
+            histogram = table[kind] = LatencyHistogram()
+        return histogram
+
+
+class QueuedI2C(I2CBus):
+    """
+    I2CBus adapter over a BusService. Reads block until the bus thread has
+    served them; writes block too unless `wait_writes` is False, in which case
+    failures are reported as warnings.
+    """
+
+    def __init__(self, service, priority=PRIORITY_NORMAL, wait_writes=True):
+        self.service = service
+        self.priority = priority
+        self.wait_writes = wait_writes
+
+    def _write(self, address, register, data):
+        future = self.service.write(address, register, data, self.priority)
+        if self.wait_writes:
+            future.result()
+        else:
+            future.add_done_callback(_warn_on_failure)
+        return future
+
+    def read_byte_data(self, address, register):
+        return self.service.read(address, register, 1, self.priority).result()[0]
+
+    def write_byte_data(self, address, register, value):
+        return self._write(address, register, value)
+
+    def read_word_data(self, address, register):
+        low, high = self.service.read(address, register, 2, self.priority).result()
+        return low | (high << 8)
+
+    def write_word_data(self, address, register, value):
+        return self._write(address, register, [value & 0xFF, (value >> 8) & 0xFF])
+
+    def read_i2c_block_data(self, address, register, length):
+        return self.service.read(address, register, length, self.priority).result()
+
+    def write_i2c_block_data(self, address, register, data):
+        return self._write(address, register, list(data))
+
+
+def _warn_on_failure(future):
+    error = future.exception()
+    if error is not None:
+        print(f"[Warning] I2C write failed: {error}")
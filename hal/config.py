@@ -0,0 +1,84 @@
+"""
+HAL configuration.
+
+The backend is chosen by, in order: the `backend` argument to `get_hal()`,
+the `POCT_HAL` environment variable ("real", "sim" or "auto"), then the
+"backend" key of the JSON file named by `POCT_HAL_CONFIG`. "auto" uses the
+real backend when smbus2 and the I2C device are available, otherwise the
+simulated one.
+
+The JSON file overrides any of the defaults below, e.g.
+
+    {"backend": "sim", "sim": {"bus_latency": 0.004, "seed": 7}}
+"""
+
+import copy
+import json
+import os
+
+from .mcp4441 import MCP4441_I2C_ADDRESS
+
+HAL_ENV = "POCT_HAL"
+HAL_CONFIG_ENV = "POCT_HAL_CONFIG"
+
+DEFAULT_CONFIG = {
+    "backend": "auto",
+    "i2c_bus": 1,
+    # Serve all I2C traffic from one worker thread (hal.bus.BusService).
+    "bus_service": True,
+    "led": {
+        "address": MCP4441_I2C_ADDRESS,
+        # Blue LED intensity set at startup (wiper 0).
+        "default_wiper": 0xFF,
+    },
+    "temperature": {
+        # TMP117-style sensor: signed 16-bit result register, 1/128 °C per LSB.
+        "address": 0x48,
+        "register": 0x00,
+        "scale": 0.0078125,
+    },
+    # BCM pin numbers.
+    "gpio": {
+        "heater_pin": 18,
+        "heater_pwm_hz": 10,
+        "motor_enable_pin": 23,
+        "motor_direction_pin": 24,
+        "motor_pwm_hz": 1000,
+    },
+    "sim": {
+        "seed": 0,
+        # Seconds per bus transaction and per sensor conversion.
+        "bus_latency": 0.0005,
+        "sensor_latency": 0.002,
+        "sensor_noise": 0.05,
+        "ambient": 25.0,
+        "heater_watts": 20.0,
+        "heat_capacity": 15.0,
+        "loss_w_per_k": 0.15,
+    },
+}
+
+
+def _merge(base, override):
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(base.get(key), dict):
+            _merge(base[key], value)
+        else:
+            base[key] = value
+    return base
+
+
+def load_config(overrides=None):
+    config = copy.deepcopy(DEFAULT_CONFIG)
+    path = os.environ.get(HAL_CONFIG_ENV)
+    if path:
+        try:
+            with open(path) as f:
+                _merge(config, json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"[Warning] Could not read HAL config {path}: {e}")
+    if os.environ.get(HAL_ENV):
+        config["backend"] = os.environ[HAL_ENV]
+    if overrides:
+        _merge(config, overrides)
+    return config
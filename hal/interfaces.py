@@ -0,0 +1,129 @@
+"""
+Hardware interfaces shared by the real and simulated backends.
+
+UI and acquisition code only talk to these; which implementation sits behind
+them is decided once by `hal.get_hal()`.
+"""
+
+
+class I2CBus:
+    """SMBus-style register access (the subset of smbus2 the device drivers use)."""
+
+    def read_byte_data(self, address, register):
+        raise NotImplementedError
+
+    def write_byte_data(self, address, register, value):
+        raise NotImplementedError
+
+    def read_word_data(self, address, register):
+        raise NotImplementedError
+
+    def write_word_data(self, address, register, value):
+        raise NotImplementedError
+
+    def read_i2c_block_data(self, address, register, length):
+        raise NotImplementedError
+
+    def write_i2c_block_data(self, address, register, data):
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class GPIO:
+    """Digital pins (BCM numbering) with optional software PWM."""
+
+    OUT = "out"
+    IN = "in"
+
+    def setup(self, pin, mode, initial=0):
+        raise NotImplementedError
+
+    def write(self, pin, value):
+        raise NotImplementedError
+
+    def read(self, pin):
+        raise NotImplementedError
+
+    def set_pwm(self, pin, duty, frequency=None):
+        """Drive `pin` with a PWM duty cycle in [0, 1]."""
+        raise NotImplementedError
+
+    def cleanup(self):
+        pass
+
+
+class Heater:
+    def set_power(self, fraction):
+        """Heater drive in [0, 1]; values outside are clamped."""
+        raise NotImplementedError
+
+    @property
+    def power(self):
+        raise NotImplementedError
+
+    def off(self):
+        self.set_power(0.0)
+
+
+class TemperatureSensor:
+    def read(self):
+        """Current temperature in °C."""
+        raise NotImplementedError
+
+
+class LedDriver:
+    """Digital potentiometer setting the LED current (MCP4441)."""
+
+    def set_wiper(self, channel, value):
+        raise NotImplementedError
+
+    def get_wiper(self, channel):
+        raise NotImplementedError
+
+
+class Motor:
+    def start(self, speed=1.0, forward=True):
+        raise NotImplementedError
+
+    def stop(self):
+        raise NotImplementedError
+
+    @property
+    def running(self):
+        raise NotImplementedError
+
+
+class Hal:
+    """The set of devices one backend provides."""
+
+    def __init__(self, backend, bus, gpio, heater, temperature, led, motor):
+        self.backend = backend
+        self.bus = bus
+        self.gpio = gpio
+        self.heater = heater
+        self.temperature = temperature
+        self.led = led
+        self.motor = motor
+        # The config it was created from (see hal.config.load_config), set by create_hal.
+        self.config = None
+        # BusService owning `bus` on its own thread (see hal.bus), if one was started.
+        self.bus_service = None
+
+    def shutdown(self):
+        """Put outputs in a safe state and release the bus/pins."""
+        try:
+            self.heater.off()
+            self.motor.stop()
+        finally:
+            if self.bus_service is not None:
+                self.bus_service.stop()
+            self.gpio.cleanup()
+            self.bus.close()
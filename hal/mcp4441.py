@@ -0,0 +1,26 @@
+from .interfaces import LedDriver
+
+# 7-bit address with A1/A0 tied low (0x2C-0x2F depending on the strapping).
+MCP4441_I2C_ADDRESS = 0x2C
+# Command byte = (memory address << 4) | write command (00). Volatile wipers 0-3.
+MCP4441_WIPER_REGISTERS = (0x00, 0x10, 0x60, 0x70)
+MCP4441_COMMAND_BYTE = MCP4441_WIPER_REGISTERS[0]
+MCP4441_MAX_VALUE = 0xFF
+
+
+class MCP4441(LedDriver):
+    """Quad digital potentiometer driving the excitation LEDs, over any I2CBus."""
+
+    def __init__(self, bus, address=MCP4441_I2C_ADDRESS):
+        self.bus = bus
+        self.address = address
+        self._wipers = {}
+
+    def set_wiper(self, channel, value):
+        value = max(0, min(MCP4441_MAX_VALUE, int(value)))
+        self.bus.write_byte_data(self.address, MCP4441_WIPER_REGISTERS[channel], value)
+        self._wipers[channel] = value
+
+    def get_wiper(self, channel):
+        """Last value written to `channel` (the wiper registers are not read back)."""
+        return self._wipers.get(channel)
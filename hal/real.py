@@ -0,0 +1,169 @@
+"""
+Real hardware backend: smbus2 for I2C and RPi.GPIO for pins.
+
+Both libraries are optional imports so the package loads on machines without
+them; `available()` tells whether this backend can be used.
+"""
+
+import os
+
+from .interfaces import GPIO, Hal, Heater, I2CBus, Motor, TemperatureSensor
+from .mcp4441 import MCP4441
+
+try:
+    from smbus2 import SMBus
+except ImportError:
+    SMBus = None
+
+try:
+    import RPi.GPIO as RPiGPIO
+except (ImportError, RuntimeError):
+    RPiGPIO = None
+
+
+def available(config):
+    """Both libraries are importable and the configured I2C bus exists."""
+    return SMBus is not None and RPiGPIO is not None and os.path.exists(f"/dev/i2c-{config['i2c_bus']}")
+
+
+class SMBusI2C(I2CBus):
+    def __init__(self, bus_number=1):
+        self._bus = SMBus(bus_number)
+
+    def read_byte_data(self, address, register):
+        return self._bus.read_byte_data(address, register)
+
+    def write_byte_data(self, address, register, value):
+        self._bus.write_byte_data(address, register, value)
+
+    def read_word_data(self, address, register):
+        return self._bus.read_word_data(address, register)
+
+    def write_word_data(self, address, register, value):
+        self._bus.write_word_data(address, register, value)
+
+    def read_i2c_block_data(self, address, register, length):
+        return self._bus.read_i2c_block_data(address, register, length)
+
+    def write_i2c_block_data(self, address, register, data):
+        self._bus.write_i2c_block_data(address, register, list(data))
+
+    def close(self):
+        self._bus.close()
+
+
+class PiGPIO(GPIO):
+    def __init__(self):
+        if RPiGPIO is None:
+            raise RuntimeError("RPi.GPIO is not installed")
+        RPiGPIO.setwarnings(False)
+        RPiGPIO.setmode(RPiGPIO.BCM)
+        self._pwm = {}
+
+    def setup(self, pin, mode, initial=0):
+        if mode == GPIO.OUT:
+            RPiGPIO.setup(pin, RPiGPIO.OUT, initial=RPiGPIO.HIGH if initial else RPiGPIO.LOW)
+        else:
+            RPiGPIO.setup(pin, RPiGPIO.IN)
+
+    def write(self, pin, value):
+        RPiGPIO.output(pin, RPiGPIO.HIGH if value else RPiGPIO.LOW)
+
+    def read(self, pin):
+        return int(RPiGPIO.input(pin))
+
+    def set_pwm(self, pin, duty, frequency=None):
+        pwm = self._pwm.get(pin)
+        if pwm is None:
+            pwm = RPiGPIO.PWM(pin, frequency or 100)
+            pwm.start(0)
+            self._pwm[pin] = pwm
+        elif frequency:
+            pwm.ChangeFrequency(frequency)
+        pwm.ChangeDutyCycle(max(0.0, min(1.0, duty)) * 100)
+
+    def cleanup(self):
+        for pwm in self._pwm.values():
+            pwm.stop()
+        self._pwm.clear()
+        RPiGPIO.cleanup()
+
+
+class PwmHeater(Heater):
+    """Heater switched by a (slow) PWM output."""
+
+    def __init__(self, gpio, pin, frequency):
+        self.gpio = gpio
+        self.pin = pin
+        self.frequency = frequency
+        self._power = 0.0
+        gpio.setup(pin, GPIO.OUT)
+
+    def set_power(self, fraction):
+        self._power = max(0.0, min(1.0, float(fraction)))
+        self.gpio.set_pwm(self.pin, self._power, self.frequency)
+
+    @property
+    def power(self):
+        return self._power
+
+
+class I2CTemperatureSensor(TemperatureSensor):
+    """Signed 16-bit big-endian temperature register (TMP117 layout by default)."""
+
+    def __init__(self, bus, address, register, scale):
+        self.bus = bus
+        self.address = address
+        self.register = register
+        self.scale = scale
+
+    def read(self):
+        high, low = self.bus.read_i2c_block_data(self.address, self.register, 2)
+        raw = (high << 8) | low
+        if raw & 0x8000:
+            raw -= 1 << 16
+        return raw * self.scale
+
+
+class GpioMotor(Motor):
+    """DC motor behind an H-bridge: PWM on the enable pin, a direction pin."""
+
+    def __init__(self, gpio, enable_pin, direction_pin, frequency):
+        self.gpio = gpio
+        self.enable_pin = enable_pin
+        self.direction_pin = direction_pin
+        self.frequency = frequency
+        self._running = False
+        gpio.setup(enable_pin, GPIO.OUT)
+        gpio.setup(direction_pin, GPIO.OUT)
+
+    def start(self, speed=1.0, forward=True):
+        self.gpio.write(self.direction_pin, 1 if forward else 0)
+        self.gpio.set_pwm(self.enable_pin, speed, self.frequency)
+        self._running = speed > 0
+
+    def stop(self):
+        self.gpio.set_pwm(self.enable_pin, 0.0, self.frequency)
+        self._running = False
+
+    @property
+    def running(self):
+        return self._running
+
+
+def create(config):
+    if SMBus is None:
+        raise RuntimeError("smbus2 is not installed")
+    bus = SMBusI2C(config["i2c_bus"])
+    gpio = PiGPIO()
+    pins = config["gpio"]
+    sensor = config["temperature"]
+    return Hal(
+        backend="real",
+        bus=bus,
+        gpio=gpio,
+        heater=PwmHeater(gpio, pins["heater_pin"], pins["heater_pwm_hz"]),
+        temperature=I2CTemperatureSensor(bus, sensor["address"], sensor["register"], sensor["scale"]),
+        led=MCP4441(bus, config["led"]["address"]),
+        motor=GpioMotor(gpio, pins["motor_enable_pin"], pins["motor_direction_pin"], pins["motor_pwm_hz"]),
+    )
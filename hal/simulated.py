@@ -0,0 +1,227 @@
+"""
+Deterministic simulated backend.
+
+Runs the same device drivers as the real backend (MCP4441, I2C temperature
+sensor, GPIO motor) on top of an in-memory I2C bus and GPIO. Bus transactions
+and sensor conversions take a configurable time, the heater drives a
+first-order thermal model, and sensor noise comes from a seeded RNG, so two
+runs with the same config and time source produce the same readings.
+"""
+
+import math
+import random
+import threading
+import time
+
+from .interfaces import GPIO, Hal, Heater, I2CBus
+from .mcp4441 import MCP4441
+from .real import GpioMotor, I2CTemperatureSensor
+
+
+class ThermalModel:
+    """
+    Lumped heater block: C dT/dt = P * power - k (T - ambient), integrated
+    exactly between reads. `time_source` returns seconds (monotonic or virtual).
+    """
+
+    def __init__(self, ambient=25.0, heater_watts=20.0, heat_capacity=15.0, loss_w_per_k=0.15, time_source=None):
+        self.ambient = ambient
+        self.heater_watts = heater_watts
+        self.heat_capacity = heat_capacity
+        self.loss_w_per_k = loss_w_per_k
+        self.time_source = time_source or time.monotonic
+        self._temperature = ambient
+        self._power = 0.0
+        self._last = self.time_source()
+        self._lock = threading.Lock()
+
+    def _advance(self):
+        now = self.time_source()
+        dt = now - self._last
+        if dt > 0:
+            target = self.ambient + self.heater_watts * self._power / self.loss_w_per_k
+            decay = math.exp(-dt * self.loss_w_per_k / self.heat_capacity)
+            self._temperature = target + (self._temperature - target) * decay
+        self._last = now
+
+    def set_power(self, fraction):
+        with self._lock:
+            self._advance()
+            self._power = max(0.0, min(1.0, float(fraction)))
+
+    @property
+    def power(self):
+        return self._power
+
+    @property
+    def temperature(self):
+        with self._lock:
+            self._advance()
+            return self._temperature
+
+
+class SimulatedI2CBus(I2CBus):
+    """
+    Register file per address. Devices that compute their registers (the
+    temperature sensor) are attached with `attach(address, device)`, where
+    `device.read_register(register, length)` returns a list of bytes.
+    """
+
+    def __init__(self, latency=0.0, sleep=None):
+        self.latency = latency
+        self.sleep = sleep or time.sleep
+        self.transactions = 0
+        self._registers = {}
+        self._devices = {}
+        # One transaction on the wire at a time, as on the real bus.
+        self._lock = threading.Lock()
+
+    def attach(self, address, device):
+        self._devices[address] = device
+
+    def registers(self, address):
+        return self._registers.setdefault(address, {})
+
+    def _transfer(self):
+        self.transactions += 1
+        if self.latency:
+            self.sleep(self.latency)
+
+    def _read(self, address, register, length):
+        with self._lock:
+            self._transfer()
+            device = self._devices.get(address)
+            if device is not None:
+                return list(device.read_register(register, length))
+            registers = self.registers(address)
+            return [registers.get(register + i, 0) for i in range(length)]
+
+    def _write(self, address, register, data):
+        with self._lock:
+            self._transfer()
+            registers = self.registers(address)
+            for i, value in enumerate(data):
+                registers[register + i] = value & 0xFF
+
+    def read_byte_data(self, address, register):
+        return self._read(address, register, 1)[0]
+
+    def write_byte_data(self, address, register, value):
+        self._write(address, register, [value])
+
+    def read_word_data(self, address, register):
+        low, high = self._read(address, register, 2)
+        return low | (high << 8)
+
+    def write_word_data(self, address, register, value):
+        self._write(address, register, [value & 0xFF, (value >> 8) & 0xFF])
+
+    def read_i2c_block_data(self, address, register, length):
+        return self._read(address, register, length)
+
+    def write_i2c_block_data(self, address, register, data):
+        self._write(address, register, list(data))
+
+
+class SimulatedTemperatureDevice:
+    """The sensor's result register, reporting the thermal model plus seeded noise."""
+
+    def __init__(self, model, scale, noise=0.0, latency=0.0, seed=0, sleep=None):
+        self.model = model
+        self.scale = scale
+        self.noise = noise
+        self.latency = latency
+        self.sleep = sleep or time.sleep
+        self._rng = random.Random(seed)
+
+    def read_register(self, register, length):
+        if self.latency:
+            self.sleep(self.latency)
+        value = self.model.temperature
+        if self.noise:
+            value += self._rng.gauss(0.0, self.noise)
+        raw = int(round(value / self.scale)) & 0xFFFF
+        return [(raw >> 8) & 0xFF, raw & 0xFF][:length]
+
+
+class SimulatedGPIO(GPIO):
+    def __init__(self):
+        self.modes = {}
+        self.levels = {}
+        self.duty = {}
+
+    def setup(self, pin, mode, initial=0):
+        self.modes[pin] = mode
+        self.levels[pin] = int(bool(initial))
+
+    def write(self, pin, value):
+        self.levels[pin] = int(bool(value))
+
+    def read(self, pin):
+        return self.levels.get(pin, 0)
+
+    def set_pwm(self, pin, duty, frequency=None):
+        self.duty[pin] = max(0.0, min(1.0, duty))
+
+    def cleanup(self):
+        self.duty.clear()
+
+
+class SimulatedHeater(Heater):
+    def __init__(self, model):
+        self.model = model
+
+    def set_power(self, fraction):
+        self.model.set_power(fraction)
+
+    @property
+    def power(self):
+        return self.model.power
+
+
+def create(config, time_source=None, sleep=None):
+    """
+    Build the simulated Hal. Time and latencies follow the app's
+    virtual_clock unless `time_source`/`sleep` are given, so accelerated
+    runs heat up (and talk to the bus) faster too.
+    """
+    from virtualClock import virtual_clock
+
+    time_source = time_source or virtual_clock.now
+    sleep = sleep or virtual_clock.sleep
+    sim = config["sim"]
+    sensor = config["temperature"]
+    pins = config["gpio"]
+
+    model = ThermalModel(
+        ambient=sim["ambient"],
+        heater_watts=sim["heater_watts"],
+        heat_capacity=sim["heat_capacity"],
+        loss_w_per_k=sim["loss_w_per_k"],
+        time_source=time_source,
+    )
+    bus = SimulatedI2CBus(latency=sim["bus_latency"], sleep=sleep)
+    bus.attach(
+        sensor["address"],
+        SimulatedTemperatureDevice(
+            model,
+            sensor["scale"],
+            noise=sim["sensor_noise"],
+            latency=sim["sensor_latency"],
+            seed=sim["seed"],
+            sleep=sleep,
+        ),
+    )
+    gpio = SimulatedGPIO()
+
+    hal = Hal(
+        backend="sim",
+        bus=bus,
+        gpio=gpio,
+        heater=SimulatedHeater(model),
+        temperature=I2CTemperatureSensor(bus, sensor["address"], sensor["register"], sensor["scale"]),
+        led=MCP4441(bus, config["led"]["address"]),
+        motor=GpioMotor(gpio, pins["motor_enable_pin"], pins["motor_direction_pin"], pins["motor_pwm_hz"]),
+    )
+    hal.thermal_model = model
+    return hal
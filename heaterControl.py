@@ -0,0 +1,354 @@
+"""
+Heater control loop on its own thread.
+
+`HeaterController` runs a PID loop at a fixed period, independent of the
+Kivy main loop, so UI hitches never delay a heater update. Each assay stage
+has a setpoint profile (constant, or a repeating list of steps for PCR
+cycling). Every cycle's state is published to a thread-safe queue; the UI
+reads it on the 2 Hz tick through `subscribe_display()`.
+
+    from heaterControl import get_heater_controller
+
+    controller = get_heater_controller()      # started on first use
+    controller.set_stage("Heating")
+    controller.subscribe_display(self.update_heater_status)
+
+Safety: the heater is switched off when no stage is active, when the
+temperature exceeds `max_temperature`, and after repeated read failures.
+"""
+
+import queue
+import threading
+import weakref
+from collections import namedtuple
+from types import MethodType
+
+from clockService import TIER_2HZ, clock_service
+from hal.bus import LatencyHistogram
+from virtualClock import virtual_clock
+
+DEFAULT_PERIOD = 0.1
+DEFAULT_MAX_TEMPERATURE = 110.0
+MAX_READ_FAILURES = 5
+# A sample older than this many acquisition periods counts as a failed read.
+MAX_SAMPLE_AGE_PERIODS = 5
+# Jitter histogram edges (seconds): how late each cycle started.
+JITTER_BUCKETS = (0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1)
+
+ControlState = namedtuple("ControlState", "time stage setpoint temperature output fault")
+
+
+class SetpointProfile:
+    """
+    Setpoint over time within a stage: a list of (setpoint °C, seconds) steps,
+    optionally repeated (PCR cycling). The last step holds when not repeating.
+    """
+
+    def __init__(self, steps, repeat=False):
+        self.steps = [(float(setpoint), float(seconds)) for setpoint, seconds in steps]
+        self.repeat = repeat
+        self.period = sum(seconds for _, seconds in self.steps)
+
+    @classmethod
+    def constant(cls, setpoint):
+        return cls([(setpoint, 0)])
+
+    def setpoint_at(self, elapsed):
+        if self.repeat and self.period > 0:
+            elapsed %= self.period
+        for setpoint, seconds in self.steps:
+            if elapsed < seconds:
+                return setpoint
+            elapsed -= seconds
+        return self.steps[-1][0]
+
+
+# Setpoints per ProcessFlowWidget stage; stages not listed switch the heater off.
+DEFAULT_STAGE_PROFILES = {
+    "Preheating": SetpointProfile.constant(50.0),
+    "Heating": SetpointProfile.constant(95.0),
+    "Holding": SetpointProfile.constant(95.0),
+    "Cooling": SetpointProfile.constant(40.0),
+    "PCR Cycling": SetpointProfile([(95.0, 15), (60.0, 30), (72.0, 30)], repeat=True),
+}
+
+
+class PID:
+    """
+    PID with derivative on measurement and clamping anti-windup: the integral
+    only accumulates while the output is not saturated in the same direction.
+    """
+
+    def __init__(self, kp, ki, kd, output_limits=(0.0, 1.0)):
+        self.kp = kp
+        self.ki = ki
+        self.kd = kd
+        self.output_min, self.output_max = output_limits
+        self.reset()
+
+    def reset(self):
+        self.integral = 0.0
+        self._last_measurement = None
+
+    def update(self, setpoint, measurement, dt):
+        error = setpoint - measurement
+        derivative = 0.0
+        if self._last_measurement is not None and dt > 0:
+            derivative = -(measurement - self._last_measurement) / dt
+        self._last_measurement = measurement
+
+        unclamped = self.kp * error + self.integral + self.ki * error * dt + self.kd * derivative
+        output = min(self.output_max, max(self.output_min, unclamped))
+        saturated_high = unclamped > self.output_max and error > 0
+        saturated_low = unclamped < self.output_min and error < 0
+        if not (saturated_high or saturated_low):
+            self.integral += self.ki * error * dt
+        return output
+
+
+class HeaterController:
+    def __init__(
+        self,
+        heater,
+        measure,
+        profiles=None,
+        period=DEFAULT_PERIOD,
+        pid=None,
+        max_temperature=DEFAULT_MAX_TEMPERATURE,
+        time_source=None,
+        queue_size=256,
+        clock=None,
+    ):
+        """
+        `measure()` returns the current temperature in °C (e.g. the newest
+        acquisition sample). The loop is paced by `clock` (default
+        `virtual_clock`), so `period` is in virtual seconds.
+        """
+        self.heater = heater
+        self.measure = measure
+        self.profiles = dict(DEFAULT_STAGE_PROFILES if profiles is None else profiles)
+        self.period = period
+        self.pid = pid or PID(kp=0.2, ki=0.01, kd=0.1)
+        self.max_temperature = max_temperature
+        self.clock = clock or virtual_clock
+        self.time_source = time_source or self.clock.now
+        self.states = queue.Queue(maxsize=queue_size)
+        self.jitter = LatencyHistogram(JITTER_BUCKETS)
+        self.cycles = 0
+        self.fault = None
+        # Newest published state, for readers that only want the current value.
+        self.latest = None
+        self._stage = None
+        self._profile = None
+        self._stage_started = 0.0
+        # time_source() when pause_profile() froze the profile clock, else None.
+        self._paused_at = None
+        # Set by set_stage(); the control thread resets the PID itself before its next update.
+        self._reset_requested = False
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+
+    # --- Commands (any thread) ---
+    @property
+    def stage(self):
+        return self._stage
+
+    def set_stage(self, name, profile=None, started_at=None):
+        """
+        Follow the profile for stage `name`; unknown stages (or None) turn the
+        heater off. A `profile` is registered for `name` first. `started_at`
+        (in `time_source` seconds, default now) is where the profile's time 0
+        lies, for callers that enter a stage late.
+        """
+        with self._lock:
+            if profile is not None:
+                self.profiles[name] = profile
+            self._stage = name
+            self._profile = self.profiles.get(name)
+            self._stage_started = self.time_source() if started_at is None else started_at
+            self._paused_at = None
+            self._reset_requested = True
+
+    def pause_profile(self):
+        """Hold the current setpoint: the profile's clock stops until resume_profile()."""
+        with self._lock:
+            if self._paused_at is None:
+                self._paused_at = self.time_source()
+
+    def resume_profile(self):
+        """Continue the profile from where pause_profile() stopped it."""
+        with self._lock:
+            if self._paused_at is not None:
+                self._stage_started += self.time_source() - self._paused_at
+                self._paused_at = None
+
+    def set_setpoint(self, setpoint, stage="Manual"):
+        self.profiles[stage] = SetpointProfile.constant(setpoint)
+        self.set_stage(stage)
+
+    def clear_fault(self):
+        """Faults latch (the heater stays off) until cleared."""
+        self.fault = None
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="heater-control", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.heater.off()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    # --- Control thread ---
+    def _run(self):
+        failures = 0
+        reported = None
+        clock = self.clock
+        scheduled = clock.now()
+        last = None
+        while not self._stop.is_set():
+            self.jitter.record(max(0.0, clock.now() - scheduled))
+            now = self.time_source()
+            dt = self.period if last is None else now - last
+            last = now
+
+            with self._lock:
+                stage, profile, stage_started = self._stage, self._profile, self._stage_started
+                profile_now = self._paused_at
+                reset, self._reset_requested = self._reset_requested, False
+            if reset:
+                self.pid.reset()
+
+            try:
+                temperature = self.measure()
+                failures = 0
+            except Exception as e:
+                failures += 1
+                temperature = None
+                if failures == MAX_READ_FAILURES and self.fault is None:
+                    self.fault = f"temperature unavailable: {e}"
+
+            setpoint = None
+            output = 0.0
+            if temperature is not None and temperature > self.max_temperature and self.fault is None:
+                self.fault = f"over-temperature: {temperature:.1f} °C"
+            if self.fault != reported:
+                reported = self.fault
+                if reported is not None:
+                    print(f"[Warning] Heater off: {reported}")
+            if profile is not None and temperature is not None and self.fault is None:
+                if profile_now is None:
+                    profile_now = self.time_source()
+                setpoint = profile.setpoint_at(profile_now - stage_started)
+                output = self.pid.update(setpoint, temperature, dt)
+            self.heater.set_power(output)
+            self.cycles += 1
+            self._publish(ControlState(self.time_source(), stage, setpoint, temperature, output, self.fault))
+
+            scheduled += self.period
+            delay = scheduled - clock.now()
+            if delay < 0:
+                # Overran one or more periods: restart the schedule from now.
+                scheduled = clock.now()
+                delay = 0
+            clock.wait(delay, self._stop)
+        self.heater.off()
+
+    def _publish(self, state):
+        self.latest = state
+        # Never block the control loop on a slow consumer: drop the oldest state.
+        while True:
+            try:
+                self.states.put_nowait(state)
+                return
+            except queue.Full:
+                try:
+                    self.states.get_nowait()
+                except queue.Empty:
+                    pass
+
+    # --- UI side ---
+    def drain(self):
+        """All states published since the last drain, oldest first."""
+        states = []
+        while True:
+            try:
+                states.append(self.states.get_nowait())
+            except queue.Empty:
+                return states
+
+    def jitter_summary(self):
+        return f"heater-control period={self.period * 1000:.0f}ms cycles={self.cycles} jitter {self.jitter.summary()}"
+
+    def subscribe_display(self, callback, tier=TIER_2HZ, owner=None):
+        """
+        Call `callback(ControlState)` with the newest state on each `tier` tick
+        (when it changed). Leaves the `states` queue to loggers.
+        """
+        if isinstance(callback, MethodType):
+            ref = weakref.WeakMethod(callback)
+            owner = owner or callback.__self__
+        else:
+            ref = lambda: callback  # noqa: E731
+
+        delivered = [None]
+
+        def tick(dt):
+            state = self.latest
+            target = ref()
+            if state is not None and state is not delivered[0] and target is not None:
+                delivered[0] = state
+                target(state)
+
+        return clock_service.subscribe(tick, tier, owner=owner)
+
+
+_controller = None
+
+
+def get_heater_controller():
+    """
+    The shared controller on the HAL heater, measuring from the temperature
+    acquisition's newest sample. A stale sample (the sensor stopped
+    answering) is a failed read, so the heater goes off and the fault latches.
+    Started on first use.
+    """
+    global _controller
+    if _controller is None:
+        from hal import get_hal
+        from temperatureAcquisition import get_temperature_acquisition
+
+        acquisition = get_temperature_acquisition()
+
+        max_age = MAX_SAMPLE_AGE_PERIODS / acquisition.rate_hz
+
+        def measure():
+            last = acquisition.ring.last()
+            if last is None:
+                raise RuntimeError("no temperature sample yet")
+            sampled_at, value = last
+            age = acquisition.time_source() - sampled_at
+            if age > max_age:
+                raise RuntimeError(f"newest temperature sample is {age:.2f} s old")
+            return float(value)
+
+        _controller = HeaterController(get_hal().heater, measure).start()
+    return _controller
+
+
+def reset_heater_controller():
+    """Stop the shared controller (heater off) and forget it (app exit, tests)."""
+    global _controller
+    if _controller is not None:
+        _controller.stop()
+        _controller = None
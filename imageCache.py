@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Display-resolution image cache for large assets (instruction slides).
+
+The instruction PNGs are full-resolution photos, far bigger than the square
+panel they are shown in. `ImageCache` turns each (path, panel size) into a
+downscaled variant:
+
+    1. A worker thread decodes the source with Pillow, downscales it to the
+       size bucket and writes the variant to `.cache/images/` so later runs
+       only decode the small file.
+    2. The decoded pixels are handed back to the UI thread, which uploads them
+       to a Texture (GL calls must stay on the main thread).
+    3. Textures are kept in an LRU bounded by an estimate of GPU memory.
+
+Usage:
+    from imageCache import image_cache
+
+    image_cache.load("assets/instructionImage-Step1.png", panel_px, on_ready)
+
+Pre-generate the variants for a panel size:
+    python imageCache.py --size 512 assets/instructionImage-*.png
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+if __name__ == "__main__":
+    # The CLI has its own arguments; keep Kivy from parsing them.
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.clock import Clock
+from kivy.graphics.texture import Texture
+
+try:
+    from PIL import Image as PILImage
+except ImportError:
+    PILImage = None
+
+from traceRecorder import tracer
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, ".cache", "images")
+
+# Panel sizes are rounded up to a bucket so small resizes reuse a variant.
+SIZE_BUCKET = 128
+MIN_VARIANT_SIZE = 128
+MAX_VARIANT_SIZE = 2048
+
+DEFAULT_MAX_BYTES = 48 * 1024 * 1024
+
+
+def variant_size(px):
+    """Round a panel edge (in pixels) up to its variant bucket."""
+    px = max(MIN_VARIANT_SIZE, int(px))
+    bucket = -(-px // SIZE_BUCKET) * SIZE_BUCKET
+    return min(bucket, MAX_VARIANT_SIZE)
+
+
+def _source_path(path):
+    return path if os.path.isabs(path) else os.path.join(HERE, path)
+
+
+def variant_path(path, size):
+    """
+    Cache file for `path` at `size`. The name carries a hash of the source's
+    absolute path, mtime and file size, so same-named images in other folders
+    and replaced images never share a variant.
+    """
+    source = _source_path(path)
+    stat = os.stat(source)
+    key = f"{os.path.abspath(source)}\0{stat.st_mtime_ns}\0{stat.st_size}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(CACHE_DIR, f"{stem}_{digest}_{size}.png")
+
+
+def build_variant(path, size):
+    """
+    Return (width, height, rgba_bytes) for `path` fitted inside a size x size
+    square. Runs on the worker thread; never touches GL.
+    """
+    source = _source_path(path)
+    variant = variant_path(path, size)
+
+    if os.path.exists(variant):
+        with PILImage.open(variant) as img:
+            img = img.convert("RGBA")
+            return img.width, img.height, img.tobytes()
+
+    with PILImage.open(source) as img:
+        img = img.convert("RGBA")
+        img.thumbnail((size, size), PILImage.LANCZOS)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            img.save(variant, optimize=False)
+        except OSError as e:
+            print(f"[Warning] Could not write image variant {variant}: {e}")
+        return img.width, img.height, img.tobytes()
+
+
+class ImageCache:
+    """
+    LRU of uploaded textures keyed by (path, variant size).
+
+    `load()` calls back on the UI thread with the Texture, immediately when it
+    is resident, otherwise after a background decode. Concurrent requests for
+    the same key share one decode.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES, workers=1):
+        self.max_bytes = max_bytes
+        self._textures = OrderedDict()
+        self._bytes = 0
+        self._pending = {}
+        self._futures = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-decode")
+        if PILImage is None:
+            print("[Warning] Pillow is not installed; images load at full resolution on the UI thread.")
+
+    @property
+    def resident_bytes(self):
+        return self._bytes
+
+    def key_for(self, path, px):
+        return (path, variant_size(px))
+
+    def get(self, path, px):
+        """The resident texture for `path` at `px`, or None."""
+        key = self.key_for(path, px)
+        texture = self._textures.get(key)
+        if texture is not None:
+            self._textures.move_to_end(key)
+        return texture
+
+    def load(self, path, px, callback=None):
+        """
+        Make sure `path` is resident at the variant for `px`, then call
+        `callback(texture)` on the UI thread. Returns the texture when it was
+        already resident, otherwise None.
+        """
+        key = self.key_for(path, px)
+        texture = self.get(path, px)
+        if texture is not None:
+            if callback is not None:
+                callback(texture)
+            return texture
+
+        if PILImage is None:
+            texture = self._load_full(path)
+            if texture is not None:
+                self._store(key, texture)
+            if callback is not None:
+                callback(texture)
+            return texture
+
+        with self._lock:
+            callbacks = self._pending.get(key)
+            if callbacks is not None:
+                if callback is not None:
+                    callbacks.append(callback)
+                return None
+            self._pending[key] = [callback] if callback is not None else []
+
+        future = self._executor.submit(self._decode, path, key[1])
+        self._futures[key] = future
+        future.add_done_callback(lambda f, k=key: self._on_decoded(k, f))
+        return None
+
+    def prefetch(self, path, px):
+        """Start decoding `path` in the background without a callback."""
+        return self.load(path, px)
+
+    def is_pending(self, path, px):
+        return self.key_for(path, px) in self._pending
+
+    def cancel(self, path, px):
+        """
+        Withdraw a queued decode that nobody is waiting on. Decodes that already
+        started, or that have callbacks attached, are left alone.
+        """
+        key = self.key_for(path, px)
+        with self._lock:
+            if self._pending.get(key):
+                return False
+            future = self._futures.get(key)
+            if future is None or not future.cancel():
+                return False
+            self._pending.pop(key, None)
+            self._futures.pop(key, None)
+        return True
+
+    def discard(self, path, px=None):
+        """Drop resident textures for `path` (one variant, or all of them)."""
+        for key in list(self._textures):
+            if key[0] == path and (px is None or key[1] == variant_size(px)):
+                self._bytes -= self._texture_bytes(self._textures.pop(key))
+
+    def clear(self):
+        self._textures.clear()
+        self._bytes = 0
+
+    # --- Internals ---
+    @staticmethod
+    def _decode(path, size):
+        with tracer.span("decode image", "texture", path=path, size=size):
+            return build_variant(path, size)
+
+    def _on_decoded(self, key, future):
+        if future.cancelled():
+            return
+        # Worker thread: hop back to the UI thread for the texture upload.
+        Clock.schedule_once(lambda dt: self._upload(key, future), 0)
+
+    def _upload(self, key, future):
+        with self._lock:
+            callbacks = self._pending.pop(key, [])
+            self._futures.pop(key, None)
+
+        try:
+            width, height, pixels = future.result()
+        except (OSError, ValueError) as e:
+            print(f"[Warning] Could not decode {key[0]}: {e}")
+            texture = None
+        else:
+            with tracer.span("upload texture", "texture", path=key[0], size=[width, height]):
+                texture = Texture.create(size=(width, height), colorfmt="rgba")
+                texture.blit_buffer(pixels, colorfmt="rgba", bufferfmt="ubyte")
+                texture.flip_vertical()
+            self._store(key, texture)
+
+        for callback in callbacks:
+            callback(texture)
+
+    def _load_full(self, path):
+        from kivy.core.image import Image as CoreImage
+
+        try:
+            with tracer.span("load image", "texture", path=path):
+                return CoreImage(path).texture
+        except Exception as e:
+            print(f"[Warning] Could not load {path}: {e}")
+            return None
+
+    def _store(self, key, texture):
+        old = self._textures.pop(key, None)
+        if old is not None:
+            self._bytes -= self._texture_bytes(old)
+        self._textures[key] = texture
+        self._bytes += self._texture_bytes(texture)
+        # Never evict the texture that was just stored.
+        while self._bytes > self.max_bytes and len(self._textures) > 1:
+            _, evicted = self._textures.popitem(last=False)
+            self._bytes -= self._texture_bytes(evicted)
+
+    @staticmethod
+    def _texture_bytes(texture):
+        width, height = texture.size
+        return width * height * 4
+
+
+image_cache = ImageCache()
+
+
+def main(argv=None):
+    import argparse
+    import glob
+
+    parser = argparse.ArgumentParser(description="Pre-generate display-resolution image variants.")
+    parser.add_argument("paths", nargs="*", help="source images (default: assets/instructionImage-*.png)")
+    parser.add_argument("--size", type=int, action="append", help="panel edge in pixels (repeatable, default: 512)")
+    args = parser.parse_args(argv)
+
+    if PILImage is None:
+        parser.error("Pillow is required to generate image variants")
+
+    paths = args.paths or sorted(glob.glob(os.path.join("assets", "instructionImage-*.png")))
+    for size in args.size or [512]:
+        bucket = variant_size(size)
+        for path in paths:
+            width, height, _ = build_variant(path, bucket)
+            print(f"{variant_path(path, bucket)}  {width}x{height}")
+    return 0
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(main())
@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Opt-in layout instrumentation: finds widgets whose size keeps changing.
+
+A size binding that feeds back into layout (e.g. a `texture_size` ->
+`width` -> `text_size` chain, or a `do_layout` call inside a `children`
+binding) can make a widget change size on every frame instead of settling.
+`LayoutProbe` counts size changes and `do_layout` passes per widget per frame
+and flags every widget that changed size on more than `threshold` consecutive
+frames.
+
+In the app:
+    from layoutProbe import LayoutProbe
+
+    probe = LayoutProbe(threshold=10)
+    probe.install()          # instruments the whole Window tree
+    ...
+    probe.print_report()
+    probe.uninstall()
+
+Headless check of every screen (exit code 1 when a loop is found):
+    python layoutProbe.py                         # test_1124:MyApp
+    python layoutProbe.py --app 0113_GUI_testscreen:DemoApp --threshold 20
+"""
+
+import os
+import sys
+import weakref
+
+if __name__ == "__main__":
+    # Headless by default; the CLI has its own arguments.
+    os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.clock import Clock
+
+
+class _WidgetStats:
+    __slots__ = (
+        "ref", "uid", "changes", "layouts", "streak", "max_streak", "max_changes", "max_layouts",
+        "last_size", "reported", "path",
+    )
+
+    def __init__(self, widget, uid):
+        # Weak, so the probe never keeps removed screens/dialogs alive.
+        self.ref = weakref.ref(widget)
+        self.uid = uid
+        self.changes = 0
+        self.layouts = 0
+        self.streak = 0
+        self.max_streak = 0
+        self.max_changes = 0
+        self.max_layouts = 0
+        self.last_size = tuple(widget.size)
+        self.reported = False
+        self.path = None
+
+    @property
+    def widget(self):
+        return self.ref()
+
+
+class LayoutProbe:
+    """
+    Counts size changes and layout passes per widget per frame.
+
+    `threshold`: consecutive frames with a size change before a widget is
+    reported. `rescan_interval`: seconds between walks of the tree to pick up
+    widgets added after `install()`.
+    """
+
+    def __init__(self, root=None, threshold=10, rescan_interval=0.5):
+        self.root = root
+        self.threshold = threshold
+        self.rescan_interval = rescan_interval
+        self.frames = 0
+        self.loops = []
+        self._stats = {}
+        self._patched = {}
+        self._frame_event = None
+        self._rescan_event = None
+
+    # --- Lifecycle ---
+    def install(self):
+        if self.root is None:
+            from kivy.core.window import Window
+
+            self.root = Window
+        self.rescan()
+        self._frame_event = Clock.schedule_interval(self._end_frame, 0)
+        self._rescan_event = Clock.schedule_interval(lambda dt: self.rescan(), self.rescan_interval)
+        return self
+
+    def uninstall(self):
+        for event in (self._frame_event, self._rescan_event):
+            if event is not None:
+                event.cancel()
+        self._frame_event = self._rescan_event = None
+        for stats in self._stats.values():
+            widget = stats.widget
+            if widget is not None:
+                widget.unbind_uid("size", stats.uid)
+        self._stats.clear()
+        for cls, original in self._patched.items():
+            cls.do_layout = original
+        self._patched.clear()
+
+    def reset(self):
+        """Forget streaks and findings (e.g. after switching screens)."""
+        self.frames = 0
+        self.loops = []
+        for stats in self._stats.values():
+            stats.changes = stats.layouts = stats.streak = stats.max_streak = stats.max_changes = stats.max_layouts = 0
+            stats.reported = False
+
+    def rescan(self):
+        # Forget widgets that were garbage collected (their ids can be reused).
+        for key in [key for key, stats in self._stats.items() if stats.widget is None]:
+            del self._stats[key]
+        # The Window is not a Widget, so walk its children (root, dialogs, overlays).
+        tops = self.root.children if not hasattr(self.root, "walk") else [self.root]
+        for top in list(tops):
+            for widget in top.walk(restrict=True):
+                stats = self._stats.get(id(widget))
+                if stats is None or stats.widget is not widget:
+                    self._watch(widget)
+
+    # --- Instrumentation ---
+    def _watch(self, widget):
+        uid = widget.fbind("size", self._on_size)
+        self._stats[id(widget)] = _WidgetStats(widget, uid)
+        self._patch_layout(type(widget))
+
+    def _patch_layout(self, cls):
+        # Wrap the do_layout the class actually uses, once per defining class.
+        for klass in cls.__mro__:
+            if "do_layout" in klass.__dict__:
+                break
+        else:
+            return
+        if klass in self._patched:
+            return
+        original = klass.__dict__["do_layout"]
+        probe = self
+
+        def do_layout(widget, *args, **kwargs):
+            stats = probe._stats.get(id(widget))
+            if stats is not None:
+                stats.layouts += 1
+            return original(widget, *args, **kwargs)
+
+        self._patched[klass] = original
+        klass.do_layout = do_layout
+
+    def _on_size(self, widget, size):
+        stats = self._stats.get(id(widget))
+        if stats is not None:
+            stats.changes += 1
+            stats.last_size = tuple(size)
+
+    def _end_frame(self, dt):
+        self.frames += 1
+        for stats in self._stats.values():
+            stats.max_layouts = max(stats.max_layouts, stats.layouts)
+            if stats.changes:
+                stats.streak += 1
+                stats.max_streak = max(stats.max_streak, stats.streak)
+                stats.max_changes = max(stats.max_changes, stats.changes)
+                if stats.streak > self.threshold and not stats.reported:
+                    stats.reported = True
+                    stats.path = self.describe(stats.widget)
+                    self.loops.append(stats)
+            else:
+                stats.streak = 0
+            stats.changes = 0
+            stats.layouts = 0
+
+    # --- Reporting ---
+    def describe(self, widget):
+        """Class path from the root, e.g. `MDScreen > uni_centerBox > BoxLayout`."""
+        names = []
+        while widget is not None and widget is not self.root:
+            names.append(type(widget).__name__)
+            parent = widget.parent
+            widget = parent if parent is not widget else None
+        return " > ".join(reversed(names)) or type(self.root).__name__
+
+    def report(self):
+        return [
+            {
+                "widget": stats.path,
+                "consecutive_frames": stats.max_streak,
+                "max_changes_per_frame": stats.max_changes,
+                "max_layouts_per_frame": stats.max_layouts,
+                "size": stats.last_size,
+            }
+            for stats in self.loops
+        ]
+
+    def print_report(self, label=""):
+        prefix = f"[{label}] " if label else ""
+        if not self.loops:
+            print(f"{prefix}no layout loops in {self.frames} frames ({len(self._stats)} widgets)")
+            return
+        for entry in self.report():
+            print(
+                f"{prefix}[Warning] size changed on {entry['consecutive_frames']} consecutive frames "
+                f"(up to {entry['max_changes_per_frame']}/frame, {entry['max_layouts_per_frame']} layout passes/frame, "
+                f"now {entry['size']}): {entry['widget']}"
+            )
+
+
+# ---------------------------------------------------------------------------
+# Headless all-screens check
+# ---------------------------------------------------------------------------
+def check_app(module_name, app_name, threshold, settle, frames):
+    """Visit every screen of the app's root manager and probe it. Returns all findings."""
+    import importlib
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, here)
+    os.chdir(here)
+    app_cls = getattr(importlib.import_module(module_name), app_name)
+    findings = {}
+
+    class ProbeApp(app_cls):
+        def on_start(self):
+            super().on_start()
+            manager = self.root
+            names = list(getattr(manager, "registered_names", None) or getattr(manager, "screen_names", []))
+            self._probe = LayoutProbe(threshold=threshold).install()
+            self._queue = names
+            Clock.schedule_once(self._next_screen, settle)
+
+        def _next_screen(self, dt):
+            if not self._queue:
+                self._probe.uninstall()
+                self.stop()
+                return
+            name = self._queue.pop(0)
+            try:
+                self.root.current = name
+            except Exception as e:
+                print(f"[Warning] could not open screen '{name}': {e}")
+                Clock.schedule_once(self._next_screen, 0)
+                return
+            # Let the transition finish, then measure the settled screen.
+            Clock.schedule_once(lambda dt: self._start_measure(name), settle)
+
+        def _start_measure(self, name):
+            self._probe.rescan()
+            self._probe.reset()
+            self._measured = name
+            self._frames_left = frames
+            Clock.schedule_interval(self._count_frame, 0)
+
+        def _count_frame(self, dt):
+            self._frames_left -= 1
+            if self._frames_left > 0:
+                return True
+            self._probe.print_report(self._measured)
+            findings[self._measured] = self._probe.report()
+            Clock.schedule_once(self._next_screen, 0)
+            return False
+
+    ProbeApp().run()
+    return findings
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Report widgets whose size keeps changing on every screen.")
+    parser.add_argument("--app", default="test_1124:MyApp", help="module:AppClass to run (default: test_1124:MyApp)")
+    parser.add_argument("--threshold", type=int, default=10, help="consecutive frames with size changes that count as a loop")
+    parser.add_argument("--frames", type=int, default=120, help="frames to observe per screen")
+    parser.add_argument("--settle", type=float, default=1.0, help="seconds to wait after switching screens")
+    args = parser.parse_args(argv)
+
+    module_name, _, app_name = args.app.partition(":")
+    if not app_name:
+        parser.error("--app must look like module:AppClass")
+
+    findings = check_app(module_name, app_name, args.threshold, args.settle, args.frames)
+    loops = sum(len(entries) for entries in findings.values())
+    print(f"{len(findings)} screens checked, {loops} layout loop(s) found")
+    return 1 if loops else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,13 +9,14 @@ from kivymd.uix.screen import MDScreen
 from kivy.metrics import dp
 from kivy.uix.anchorlayout import AnchorLayout
 from kivymd.uix.scrollview import MDScrollView
-from kivy.graphics import BoxShadow, Color
+from kivy.graphics import BoxShadow, Color, InstructionGroup
 from kivy.clock import Clock
 #from kivy.core.window import Window
 
 from mdWidgets import (
     add_debug_outline
 )
+from shadowCache import ShadowBox
 
 
 class UserCard(MDCard):
@@ -25,6 +26,61 @@ class UserCard(MDCard):
         self.on_press_cb = on_press_cb
         self.on_release_cb = on_release_cb
         self.on_move_out_cb = on_move_out_cb
+        # The theme finishes setting the elevation shadow after __init__.
+        Clock.schedule_once(self._use_cached_shadow, 0)
+
+    def _use_cached_shadow(self, *args):
+        # Swap MDCard's elevation BoxShadow for the shared cached texture; every
+        # card has the same shadow, so it is rendered once for the whole carousel.
+        before = self.canvas.before
+        box_shadow = next((i for i in before.children if isinstance(i, BoxShadow)), None)
+        if box_shadow is None:
+            return
+        # The detached BoxShadow stays bound to the card's properties by the
+        # kv rule, so it still tells us the current elevation shadow.
+        self._box_shadow = box_shadow
+        self._shadow_key = None
+        self._shadow_group = InstructionGroup()
+        before.insert(before.indexof(box_shadow), self._shadow_group)
+        before.remove(box_shadow)
+        self._rebuild_cached_shadow()
+        # Hover/press feedback changes the elevation: switch to that level's cached shadow.
+        trigger = Clock.create_trigger(self._rebuild_cached_shadow, -1)
+        self.bind(
+            pos=self._update_cached_shadow,
+            size=self._update_cached_shadow,
+            elevation_level=trigger,
+            shadow_softness=trigger,
+            shadow_offset=trigger,
+            shadow_radius=trigger,
+            radius=trigger,
+        )
+
+    def _rebuild_cached_shadow(self, *args):
+        box_shadow = self._box_shadow
+        key = (
+            tuple(box_shadow.offset),
+            box_shadow.blur_radius,
+            box_shadow.spread_radius[0],
+            tuple(box_shadow.border_radius),
+        )
+        if key == self._shadow_key:
+            return
+        self._shadow_key = key
+        self.cached_shadow = ShadowBox(
+            pos=self.pos,
+            size=self.size,
+            offset=box_shadow.offset,
+            blur_radius=box_shadow.blur_radius,
+            spread_radius=box_shadow.spread_radius[0],
+            border_radius=box_shadow.border_radius,
+        )
+        self._shadow_group.clear()
+        self._shadow_group.add(self.cached_shadow.image)
+
+    def _update_cached_shadow(self, *args):
+        self.cached_shadow.pos = self.pos
+        self.cached_shadow.size = self.size
 
     def on_touch_down(self, touch):
         if self.collide_point(*touch.pos):
@@ -299,15 +355,14 @@ class LockScreen(MDScreen):
         self.carousel_layout.add_widget(card_anchor)
         self.user_cards.append(card)
 
-    def add_inner_shadow(self, widget, blur_radius=dp(18), spread=dp(-10), color=(0, 0, 0, 0.18)):
+    def add_inner_shadow(self, widget, blur_radius=dp(18), color=(0, 0, 0, 0.18)):
         with widget.canvas.after:
             shadow_color = Color(*color)
-            inset_shadow = BoxShadow(
+            inset_shadow = ShadowBox(
                 pos=widget.pos,
                 size=widget.size,
                 offset=(0, 0),
                 blur_radius=blur_radius,
-                spread=spread,
                 inset=True,
                 border_radius=(dp(12), dp(12), dp(12), dp(12)),
             )
@@ -0,0 +1,356 @@
+from kivy.clock import Clock
+from kivy.core.text import Label as CoreLabel
+from kivy.core.window import Window
+from kivy.metrics import dp
+from kivy.uix.widget import Widget
+
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.button import MDButton, MDButtonText
+from kivymd.uix.dialog import MDDialog
+from kivymd.uix.label import MDLabel
+
+from traceRecorder import tracer
+
+
+# ---------------------------------------------------------------------------
+# Dialog pool
+# ---------------------------------------------------------------------------
+class DialogPool:
+    """
+    Keeps built confirm/completion dialogs and hands out one that is not
+    currently showing, so opening a dialog only rebinds its text and
+    callbacks instead of rebuilding the MDDialog tree.
+    """
+
+    def __init__(self):
+        self._dialogs = {}
+
+    def acquire(self, kind, build):
+        for dialog in self._dialogs.get(kind, []):
+            # A dismissed dialog stays on the Window until its hide animation ends.
+            if dialog.parent is None and not dialog._is_open:
+                return dialog
+        with tracer.span(f"build {kind} dialog", "dialog"):
+            dialog = build()
+        self._dialogs.setdefault(kind, []).append(dialog)
+        return dialog
+
+    def prewarm(self):
+        """Build one dialog of each kind ahead of the first open."""
+        if not self._dialogs.get("confirm"):
+            self.acquire("confirm", _build_confirm_dialog)
+        if not self._dialogs.get("completed"):
+            self.acquire("completed", _build_completed_dialog)
+
+    def size(self, kind=None):
+        if kind is not None:
+            return len(self._dialogs.get(kind, []))
+        return sum(len(dialogs) for dialogs in self._dialogs.values())
+
+
+dialog_pool = DialogPool()
+
+
+# ---------------------------------------------------------------------------
+# Dialog helpers
+# ---------------------------------------------------------------------------
+_CONFIRM_ONLY_KWARGS = [
+    "title",
+    "text",
+    "type",
+    "buttons",
+    "completion_title",
+    "completion_text",
+    "completion_callback",
+]
+
+
+def confirmOverlay(confirm_callback, **kwargs):
+    """
+    Return a confirmation dialog, reusing a pooled one when possible.
+    In KivyMD 2.0, MDDialog doesn't accept title/text/type/buttons in __init__.
+    We'll build the dialog content manually.
+    """
+    dialog_kwargs = {k: v for k, v in kwargs.items() if k not in _CONFIRM_ONLY_KWARGS}
+    if dialog_kwargs:
+        # Custom MDDialog options can't be reapplied to a pooled dialog.
+        dialog = _build_confirm_dialog(**dialog_kwargs)
+    else:
+        dialog = dialog_pool.acquire("confirm", _build_confirm_dialog)
+
+    dialog.confirm_callback = confirm_callback
+    dialog.completion_kwargs = {
+        "confirm_callback": kwargs.get("completion_callback"),
+        "title": kwargs.get("completion_title", "Experiment Aborted"),
+        "text": kwargs.get(
+            "completion_text", "Please remove and discard the test sample."
+        ),
+    }
+    dialog.title_label.text = kwargs.get("title", "Confirm Action")
+    dialog.text_label.text = kwargs.get("text", "Are you sure you want to stop the test?")
+    return dialog
+
+
+def actionCompletedOverlay(
+    confirm_callback=None, title="Action Completed", text="Your action has been completed.", **kwargs
+):
+    """
+    Lightweight overlay shown after the user confirms an action.
+    Keeps the same sizing/centering approach as confirmOverlay.
+    """
+    dialog_kwargs = {k: v for k, v in kwargs.items() if k not in ["title", "text", "type", "buttons"]}
+    if dialog_kwargs:
+        dialog = _build_completed_dialog(**dialog_kwargs)
+    else:
+        dialog = dialog_pool.acquire("completed", _build_completed_dialog)
+
+    dialog.confirm_callback = confirm_callback
+    dialog.title_label.text = title
+    dialog.text_label.text = text
+    return dialog
+
+
+# ---------------------------------------------------------------------------
+# Single-pass dialog layout
+# ---------------------------------------------------------------------------
+DIALOG_MAX_WIDTH = dp(400)
+DIALOG_WIDTH_RATIO = 0.8
+CONTENT_PADDING = dp(24)
+CONTENT_SPACING = dp(12)
+BUTTON_ROW_TOP_PADDING = dp(8)
+# Fallback for MDDialog's own kv around content_container (spacers and
+# padding), used when a dialog has no `container` id to measure.
+DIALOG_CHROME_HEIGHT = dp(24) + dp(16) + dp(16) + dp(24)
+DIALOG_CHROME_WIDTH = dp(24) * 2
+
+
+class _DialogContent(MDBoxLayout):
+    """Dialog body that counts its layout passes (see `layout_dialog`)."""
+
+    layout_passes = 0
+
+    def do_layout(self, *args):
+        self.layout_passes += 1
+        super().do_layout(*args)
+
+
+def _measure_label(label, width):
+    core = CoreLabel(
+        text=label.text,
+        font_size=label.font_size,
+        font_name=label.font_name,
+        bold=label.bold,
+        italic=label.italic,
+        line_height=label.line_height,
+        halign=label.halign,
+        text_size=(width, None),
+    )
+    return core.render()[1] if label.text else 0
+
+
+def layout_dialog(dialog, *args):
+    """
+    Size and center `dialog` in one pass before it is shown.
+
+    Label heights are measured with CoreLabel at the final wrap width (the
+    dialog is 80% of the window, capped at DIALOG_MAX_WIDTH), so the dialog
+    opens at its final height and position instead of settling over several
+    frames. `dialog.content.layout_passes` counts the body's layout passes
+    since this call.
+    """
+    width = min(Window.width * DIALOG_WIDTH_RATIO, DIALOG_MAX_WIDTH)
+    chrome_width, chrome_height = dialog.chrome_size
+    text_width = max(0, width - chrome_width - CONTENT_PADDING * 2)
+
+    label_heights = []
+    for label in (dialog.title_label, dialog.text_label):
+        label.text_size = (text_width, None)
+        label_heights.append(_measure_label(label, text_width))
+
+    button_height = max((c.height for c in dialog.button_container.children if isinstance(c, MDButton)), default=0)
+    content_height = (
+        CONTENT_PADDING * 2
+        + sum(label_heights)
+        + CONTENT_SPACING * 2
+        + BUTTON_ROW_TOP_PADDING
+        + button_height
+    )
+
+    # Give the body and its rows their final size up front: a dialog that was
+    # never shown would otherwise lay its labels out at the empty container's
+    # width first and settle over several passes.
+    content = dialog.content
+    content.size = (width - chrome_width, content_height)
+    for label, height in zip((dialog.title_label, dialog.text_label), label_heights):
+        label.size = (text_width, height)
+    dialog.button_container.size = (text_width, BUTTON_ROW_TOP_PADDING + button_height)
+    ids = getattr(dialog, "ids", {})
+    if "container" in ids and "content_container" in ids:
+        # MDDialog's own containers (see _measure_chrome).
+        ids.container.parent.width = width
+        ids.container.width = width
+        ids.content_container.width = width - chrome_width
+
+    content.layout_passes = 0
+    dialog.size = (width, content_height + chrome_height)
+    dialog.center = (Window.width / 2, Window.height / 2)
+
+
+def _measure_chrome(dialog):
+    """
+    (width, height) MDDialog's kv adds around an empty content_container,
+    measured from `dialog.ids` so it follows the installed KivyMD.
+    """
+    ids = getattr(dialog, "ids", {})
+    if "container" not in ids or "content_container" not in ids:
+        return DIALOG_CHROME_WIDTH, DIALOG_CHROME_HEIGHT
+    container = ids.container
+    # Settles minimum_height, which the kv binds the container's height to.
+    container.do_layout()
+    padding_left, _, padding_right, _ = container.padding
+    return padding_left + padding_right, container.height - ids.content_container.height
+
+
+def _build_dialog_shell(**dialog_kwargs):
+    dialog = MDDialog(**dialog_kwargs)
+    dialog.chrome_size = _measure_chrome(dialog)
+
+    # Geometry is computed by layout_dialog, not by the Window's size hints.
+    dialog.size_hint = (None, None)
+    dialog.pos_hint = {}
+
+    if hasattr(dialog, "padding"):
+        dialog.padding = [0, 0, 0, 0]
+    if hasattr(dialog, "spacing"):
+        dialog.spacing = 0
+
+    content = _DialogContent(
+        orientation="vertical",
+        spacing=CONTENT_SPACING,
+        padding=[CONTENT_PADDING, CONTENT_PADDING, CONTENT_PADDING, CONTENT_PADDING],
+        adaptive_height=True,
+        size_hint=(1, None),
+        pos_hint={"x": 0, "y": 0},
+    )
+
+    title_label = MDLabel(
+        text="",
+        theme_text_color="Primary",
+        font_size="20sp",
+        bold=True,
+        adaptive_height=True,
+        halign="center",
+        valign="middle",
+        size_hint_x=1,
+        text_size=(None, None),
+    )
+    content.add_widget(title_label)
+
+    text_label = MDLabel(
+        text="",
+        theme_text_color="Secondary",
+        font_size="16sp",
+        adaptive_height=True,
+        halign="center",
+        valign="middle",
+        size_hint_x=1,
+        text_size=(None, None),
+    )
+    content.add_widget(text_label)
+
+    button_container = MDBoxLayout(
+        orientation="horizontal",
+        spacing="12dp",
+        adaptive_height=True,
+        size_hint_x=1,
+        padding=[0, BUTTON_ROW_TOP_PADDING, 0, 0],
+    )
+    content.add_widget(button_container)
+
+    if hasattr(dialog, "ids") and "content_container" in dialog.ids:
+        dialog.ids.content_container.add_widget(content)
+    else:
+        dialog.add_widget(content)
+
+    dialog.content = content
+    dialog.title_label = title_label
+    dialog.text_label = text_label
+    dialog.button_container = button_container
+    dialog.confirm_callback = None
+
+    def relayout_on_resize(*args):
+        layout_dialog(dialog)
+
+    dialog.bind(
+        on_pre_open=layout_dialog,
+        on_open=lambda *_: Window.bind(size=relayout_on_resize),
+        on_dismiss=lambda *_: Window.unbind(size=relayout_on_resize),
+    )
+    return dialog
+
+
+def _build_confirm_dialog(**dialog_kwargs):
+    dialog = _build_dialog_shell(**dialog_kwargs)
+    dialog.completion_kwargs = None
+
+    cancel_btn = MDButton(style="elevated", on_release=lambda *_: dialog.dismiss())
+    cancel_btn.add_widget(MDButtonText(text="No", font_style="Title"))
+
+    # Callbacks are read from the dialog at release time, so pooled dialogs
+    # only need their attributes rebound.
+    ok_btn = MDButton(
+        style="elevated",
+        on_release=lambda *_: _on_confirm(dialog, dialog.confirm_callback, dialog.completion_kwargs),
+        theme_bg_color="Custom",
+        md_bg_color=(0.8, 0.2, 0.2, 1),
+    )
+    ok_btn.elevation = 4
+    ok_btn.add_widget(
+        MDButtonText(
+            theme_text_color="Custom",
+            font_style="Title",
+            text_color=(1, 1, 1, 1),
+            text="Abort Test",
+        )
+    )
+
+    dialog.button_container.add_widget(Widget(size_hint_x=1))
+    dialog.button_container.add_widget(cancel_btn)
+    dialog.button_container.add_widget(ok_btn)
+    dialog.button_container.add_widget(Widget(size_hint_x=1))
+    return dialog
+
+
+def _build_completed_dialog(**dialog_kwargs):
+    dialog = _build_dialog_shell(**dialog_kwargs)
+
+    ok_btn = MDButton(
+        style="elevated",
+        on_release=lambda *_: _on_completed(dialog, dialog.confirm_callback),
+    )
+    ok_btn.add_widget(MDButtonText(text="OK", font_style="Title"))
+
+    dialog.button_container.add_widget(Widget(size_hint_x=1))
+    dialog.button_container.add_widget(ok_btn)
+    dialog.button_container.add_widget(Widget(size_hint_x=1))
+    return dialog
+
+
+def _on_completed(dialog, callback):
+    dialog.dismiss()
+    if callback:
+        callback()
+
+
+def _on_confirm(dialog, callback, completion_kwargs=None):
+    dialog.dismiss()
+
+    def open_completion_overlay(dt):
+        completion_dialog = actionCompletedOverlay(**(completion_kwargs or {}))
+        completion_dialog.open()
+
+    try:
+        if callback:
+            callback()
+    finally:
+        Clock.schedule_once(open_completion_overlay, 0.05)
@@ -0,0 +1,102 @@
+from kivy.metrics import dp
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.image import Image
+from kivy.uix.widget import Widget
+
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.button import MDButton, MDButtonIcon, MDButtonText
+from kivymd.uix.dropdownitem import MDDropDownItem, MDDropDownItemText
+from kivymd.uix.label import MDLabel
+from kivymd.uix.menu import MDDropdownMenu
+
+
+# ---------------------------------------------------------------------------
+# Export tab
+# ---------------------------------------------------------------------------
+def build_export_tab(qr_image_path="assets/sampleQR.png"):
+    root = MDBoxLayout(orientation="vertical", spacing=dp(16))
+
+    header_row = MDBoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(40))
+    left_group = MDBoxLayout(orientation="horizontal", size_hint=(None, 1), spacing=dp(12))
+    left_group.bind(minimum_width=left_group.setter("width"))
+    header_label = MDLabel(
+        text="Export Method:",
+        halign="left",
+        valign="middle",
+        size_hint=(None, 1),
+        adaptive_size=True,
+        shorten=True,
+        shorten_from="right",
+    )
+    header_label.bind(texture_size=lambda instance, size: setattr(instance, "width", size[0]))
+
+    dropdown = MDDropDownItem(size_hint=(None, None))
+    dropdown_text = MDDropDownItemText(text="QR Code")
+    dropdown.add_widget(dropdown_text)
+    dropdown.width = dp(160)
+    left_group.add_widget(header_label)
+    left_group.add_widget(dropdown)
+    header_row.add_widget(left_group)
+    header_row.add_widget(Widget())
+    root.add_widget(header_row)
+
+    content_holder = MDBoxLayout(orientation="vertical", size_hint=(1, 1))
+    root.add_widget(content_holder)
+
+    qr_container = MDBoxLayout(orientation="vertical", spacing=dp(16))
+    qr_container.add_widget(AnchorLayout(size_hint=(1, None), height=dp(200)))
+    qr_image = Image(
+        source=qr_image_path,
+        allow_stretch=True,
+        keep_ratio=True,
+        size_hint=(None, None),
+        size=(dp(180), dp(180)),
+    )
+    qr_container.children[0].add_widget(qr_image)
+
+    qr_instructions = MDLabel(
+        text="Scan with your mobile device.\nYou will be redirected to a portal where your results will be available for download.",
+        halign="center",
+        valign="top",
+    )
+    qr_instructions.bind(size=lambda instance, size: setattr(instance, "text_size", size))
+    qr_container.add_widget(qr_instructions)
+
+    usb_container = MDBoxLayout(orientation="vertical", spacing=dp(16))
+    usb_note = MDLabel(
+        text="Make sure your device is properly connected.",
+        halign="center",
+        valign="middle",
+    )
+    usb_note.bind(size=lambda instance, size: setattr(instance, "text_size", size))
+    usb_button = MDButton(MDButtonIcon(icon="usb"), style="elevated", size_hint=(None, None))
+    usb_label = MDButtonText(text="Export To USB")
+    usb_button.add_widget(usb_label)
+
+    def _resize_usb_button(*_):
+        usb_button.width = usb_label.texture_size[0] + dp(60)
+        usb_button.height = max(usb_label.texture_size[1] + dp(20), dp(48))
+
+    usb_label.bind(texture_size=_resize_usb_button)
+    _resize_usb_button()
+    usb_container.add_widget(AnchorLayout(size_hint=(1, None), height=dp(56)))
+    usb_container.children[0].add_widget(usb_button)
+    usb_container.add_widget(usb_note)
+
+    def set_export_view(value):
+        dropdown_text.text = value
+        content_holder.clear_widgets()
+        if value == "USB":
+            content_holder.add_widget(usb_container)
+        else:
+            content_holder.add_widget(qr_container)
+
+    menu_items = [
+        {"text": "QR Code", "on_release": lambda *_: set_export_view("QR Code")},
+        {"text": "USB", "on_release": lambda *_: set_export_view("USB")},
+    ]
+    menu = MDDropdownMenu(caller=dropdown, items=menu_items, width_mult=3)
+    dropdown.on_release = menu.open
+
+    set_export_view("QR Code")
+    return root
@@ -0,0 +1,669 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional
+
+from kivy.animation import Animation
+from kivy.clock import Clock
+from kivy.graphics import (
+    Color,
+    Ellipse,
+    RoundedRectangle,
+    StencilPop,
+    StencilPush,
+    StencilUse,
+)
+from kivy.metrics import dp
+from kivy.properties import BooleanProperty, StringProperty
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.behaviors import ButtonBehavior
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.image import Image
+from kivy.uix.label import Label
+from kivy.uix.relativelayout import RelativeLayout
+
+from imageCache import image_cache, variant_size
+from mdWidgets import uni_centerBox
+
+
+# ---------------------------------------------------------------------------
+# Instruction overlay
+# ---------------------------------------------------------------------------
+@dataclass
+class InstructionPanel:
+    """Represents a single slide in the instruction overlay."""
+
+    title: str = ""
+    body: str = ""
+    image: Optional[str] = None
+
+
+class InstructionNavButton(ButtonBehavior, RelativeLayout):
+    """
+    Arrow control used to move forward/backward through the instruction slides.
+    """
+
+    disabled = BooleanProperty(False)
+    direction = StringProperty("left")
+
+    def __init__(self, direction="left", **kwargs):
+        kwargs.setdefault("size_hint", (None, 1))
+        kwargs.setdefault("width", dp(72))
+        super().__init__(**kwargs)
+        self.direction = direction
+
+        self.ripple_alpha = 0
+        self.ripple_pos = (0, 0)
+        self.ripple_radius = 0
+
+        self.active_color = (0.13, 0.34, 0.75, 1)
+        self.inactive_color = (0.7, 0.7, 0.7, 0.55)
+        self.active_arrow_color = (1, 1, 1, 1)
+        self.inactive_arrow_color = (0.25, 0.25, 0.25, 1)
+
+        with self.canvas.before:
+            self.bg_color_instruction = Color(*self._current_bg_color())
+            # Draw background in local widget coordinates to avoid layout offsets.
+            self.bg = RoundedRectangle(pos=(0, 0), size=self.size, radius=[dp(22)] * 4)
+
+        with self.canvas:
+            StencilPush()
+            self.stencil_shape = RoundedRectangle(pos=(0, 0), size=self.size, radius=[dp(22)] * 4)
+            StencilUse()
+
+            self.ripple_color_instruction = Color(1, 1, 1, self.ripple_alpha)
+            self.ripple = Ellipse(size=(0, 0))
+
+            StencilPop()
+
+        arrow_src = "assets/LNav.png" if self.direction == "left" else "assets/RNav.png"
+        self.arrow_image = Image(
+            source=arrow_src,
+            allow_stretch=True,
+            keep_ratio=True,
+            color=self._current_arrow_color(),
+            size_hint=(0.75, 0.75),
+            pos_hint={"center_x": 0.5, "center_y": 0.5},
+        )
+        self.add_widget(self.arrow_image)
+
+        self.bind(pos=self._update_graphics, size=self._update_graphics, disabled=self._refresh_colors)
+
+    def _current_bg_color(self):
+        return self.inactive_color if self.disabled else self.active_color
+
+    def _current_arrow_color(self):
+        return self.inactive_arrow_color if self.disabled else self.active_arrow_color
+
+    def _refresh_colors(self, *args):
+        self.bg_color_instruction.rgba = self._current_bg_color()
+        self.arrow_image.color = self._current_arrow_color()
+
+    def _update_graphics(self, *args):
+        self.bg.pos = (0, 0)
+        self.bg.size = self.size
+        # Image centers via pos_hint; no manual text_size needed.
+        self.stencil_shape.pos = (0, 0)
+        self.stencil_shape.size = self.size
+
+        self.ripple_color_instruction.rgba = (1, 1, 1, self.ripple_alpha)
+        r = self.ripple_radius
+        self.ripple.size = (r * 2, r * 2)
+        self.ripple.pos = (self.ripple_pos[0] - r, self.ripple_pos[1] - r)
+
+    def reset_ripple(self, *args):
+        self.ripple_radius = 0
+        self.ripple_alpha = 0
+        self._update_graphics()
+
+    def on_touch_down(self, touch):
+        if self.disabled:
+            return False
+        if self.collide_point(*touch.pos):
+            self.ripple_pos = (touch.x - self.x, touch.y - self.y)
+            self.ripple_radius = 0
+            self.ripple_alpha = 0.35
+            max_r = max(self.width, self.height) * 1.2
+
+            expand = Animation(ripple_radius=max_r, d=0.23, t="out_quad")
+            fade = Animation(ripple_alpha=0, d=0.18, t="out_quad")
+            anim = expand + fade
+            anim.bind(on_progress=lambda *a: self._update_graphics())
+            anim.bind(on_complete=self.reset_ripple)
+            anim.start(self)
+
+        return super().on_touch_down(touch)
+
+    def on_touch_up(self, touch):
+        if self.disabled:
+            return False
+        return super().on_touch_up(touch)
+
+
+class OverlayCloseButton(ButtonBehavior, RelativeLayout):
+    """Circular close control that sits in the top-left of the overlay."""
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault("size_hint", (None, None))
+        kwargs.setdefault("size", (dp(64), dp(64)))
+        super().__init__(**kwargs)
+
+        self.ripple_alpha = 0
+        self.ripple_pos = (0, 0)
+        self.ripple_radius = 0
+
+        with self.canvas.before:
+            Color(0.86, 0.24, 0.24, 1)
+            self.circle = Ellipse(pos=self.pos, size=self.size)
+
+        with self.canvas:
+            StencilPush()
+            self.stencil_shape = Ellipse(pos=(0, 0), size=self.size)
+            StencilUse()
+
+            self.ripple_color_instruction = Color(1, 1, 1, self.ripple_alpha)
+            self.ripple = Ellipse(size=(0, 0))
+
+            StencilPop()
+
+        self.x_image = Image(
+            source="assets/x.png",
+            allow_stretch=True,
+            keep_ratio=True,
+            size_hint=(0.8, 0.8),
+            pos_hint={"center_x": 0.5, "center_y": 0.5},
+        )
+        self.add_widget(self.x_image)
+
+        self.bind(pos=self._update_graphics, size=self._update_graphics)
+
+    def _update_graphics(self, *args):
+        self.circle.pos = (0, 0)
+        self.circle.size = self.size
+        self.stencil_shape.pos = (0, 0)
+        self.stencil_shape.size = self.size
+
+        self.ripple_color_instruction.rgba = (1, 1, 1, self.ripple_alpha)
+        r = self.ripple_radius
+        self.ripple.size = (r * 2, r * 2)
+        self.ripple.pos = (self.ripple_pos[0] - r, self.ripple_pos[1] - r)
+
+    def reset_ripple(self, *args):
+        self.ripple_radius = 0
+        self.ripple_alpha = 0
+        self._update_graphics()
+
+    def on_touch_down(self, touch):
+        if not self.collide_point(*touch.pos):
+            return super().on_touch_down(touch)
+
+        self.ripple_pos = (touch.x - self.x, touch.y - self.y)
+        self.ripple_radius = 0
+        self.ripple_alpha = 0.35
+
+        max_r = max(self.width, self.height) * 1.2
+        expand = Animation(ripple_radius=max_r, d=0.23, t="out_quad")
+        fade = Animation(ripple_alpha=0, d=0.18, t="out_quad")
+        anim = expand + fade
+        anim.bind(on_progress=lambda *a: self._update_graphics())
+        anim.bind(on_complete=self.reset_ripple)
+        anim.start(self)
+
+        return super().on_touch_down(touch)
+
+
+class MultiStepInstructionOverlay(RelativeLayout):
+    """
+    Fullscreen overlay used to present a multi-step instruction flow.
+
+    Each slide is an InstructionPanel with title, body, and optional image. The
+    overlay renders the current slide and exposes next/previous controls plus a
+    close button.
+
+    Images for slides within `prefetch_window` of the current one are decoded
+    in the background; images more than one slide beyond that are evicted from
+    the image cache.
+
+    The overlay can be kept and reopened: closing only animates it out and
+    removes it from its parent, and `show(parent)` brings it back.
+    """
+
+    def __init__(self, instructions=None, on_close=None, prefetch_window=1, **kwargs):
+        kwargs.setdefault("size_hint", (1, 1))
+        kwargs.setdefault("pos_hint", {"x": 0, "y": 0})
+        super().__init__(**kwargs)
+
+        self.instructions = instructions or []
+        self.current_index = 0
+        self.on_close = on_close
+        self.prefetch_window = prefetch_window
+        self._resize_event = None
+        self._is_animating = False
+        self._image_path = None
+        self._image_bucket = None
+        self._panel_px = 0
+
+        with self.canvas.before:
+            self.backdrop_color = Color(0, 0, 0, 0.0)
+            self.backdrop = RoundedRectangle(pos=self.pos, size=self.size)
+
+        self.bind(pos=self._update_backdrop, size=self._update_backdrop)
+
+        self.close_btn = OverlayCloseButton(pos_hint={"x": 0.02, "top": 0.97})
+        self.close_btn.bind(on_release=self.close_overlay)
+        self.add_widget(self.close_btn)
+
+        self.wrapper = AnchorLayout(
+            anchor_x="center",
+            anchor_y="center",
+            size_hint=(0.94, None),
+            pos_hint={"center_x": 0.5, "center_y": 0.5},
+            height=dp(520),
+            opacity=0,
+        )
+        self.add_widget(self.wrapper)
+
+        self.row = BoxLayout(
+            orientation="horizontal",
+            spacing=dp(20),
+            size_hint=(None, None),
+        )
+        self.wrapper.add_widget(self.row)
+
+        self.left_nav = InstructionNavButton(direction="left", size_hint=(None, None))
+        self.left_nav.bind(on_release=self.previous_slide)
+        self.row.add_widget(self.left_nav)
+
+        self.content_holder = BoxLayout(orientation="horizontal", spacing=dp(20), size_hint=(None, None))
+        self.row.add_widget(self.content_holder)
+
+        self.right_nav = InstructionNavButton(direction="right", size_hint=(None, None))
+        self.right_nav.bind(on_release=self.next_slide)
+        self.row.add_widget(self.right_nav)
+
+        self.left_container = uni_centerBox(size_hint=(None, None))
+        self.left_container.content.padding = [dp(24), dp(24), dp(24), dp(24)]
+        self.left_container.content.spacing = dp(10)
+        self.content_holder.add_widget(self.left_container)
+        self.left_container.bind(size=self._schedule_resize)
+
+        self.left_content_anchor = AnchorLayout(anchor_x="left", anchor_y="top", size_hint=(1, 1))
+        self.left_content_box = BoxLayout(orientation="vertical", size_hint=(1, None), spacing=dp(10))
+        self.left_content_box.bind(minimum_height=self.left_content_box.setter("height"))
+
+        self.title_label = Label(
+            text="",
+            font_size="22sp",
+            bold=True,
+            color=(0, 0, 0, 1),
+            halign="left",
+            valign="top",
+            size_hint_y=None,
+            text_size=(0, 0),
+        )
+        self.body_label = Label(
+            text="",
+            font_size="18sp",
+            color=(0, 0, 0, 1),
+            halign="left",
+            valign="top",
+            size_hint_y=None,
+            text_size=(0, 0),
+            markup=True,
+        )
+        self._bind_label_wrapping(self.title_label)
+        self._bind_label_wrapping(self.body_label)
+
+        self.left_content_box.add_widget(self.title_label)
+        self.left_content_box.add_widget(self.body_label)
+        self.left_content_anchor.add_widget(self.left_content_box)
+        self.left_container.add_widget(self.left_content_anchor)
+
+        self.right_container = uni_centerBox(size_hint=(None, None))
+        self.right_container.content.padding = [dp(10), dp(10), dp(10), dp(10)]
+        self.right_container.content.spacing = dp(0)
+        self.content_holder.add_widget(self.right_container)
+        self.right_container.bind(size=self._schedule_resize)
+
+        self.right_display = RelativeLayout(size_hint=(1, 1))
+        self.right_container.add_widget(self.right_display)
+
+        self.image_widget = Image(
+            allow_stretch=True,
+            keep_ratio=True,
+            size_hint=(1, 1),
+            pos_hint={"x": 0, "y": 0},
+        )
+        self.placeholder_label = Label(
+            text="[Title]",
+            font_size="22sp",
+            color=(0, 0, 0, 0.7),
+            halign="center",
+            valign="middle",
+            size_hint=(1, 1),
+            text_size=(0, 0),
+        )
+        self.placeholder_label.bind(size=self._update_placeholder_text_size)
+
+        self.right_display.add_widget(self.image_widget)
+        self.right_display.add_widget(self.placeholder_label)
+
+        self.opacity = 0
+        self.wrapper.bind(size=self._schedule_resize)
+        Clock.schedule_once(lambda dt: self._resize_containers(), 0)
+        Clock.schedule_once(lambda dt: self._animate_in(), 0)
+
+        self._update_slide_content()
+        self._touch_start = None
+        self._touch_pos = None
+
+    def _bind_label_wrapping(self, label):
+        def update_text_size(*args):
+            label.text_size = (label.width, None)
+
+        def update_height(instance, texture_size):
+            instance.height = texture_size[1]
+
+        label.bind(size=update_text_size, texture_size=update_height)
+
+    def _update_placeholder_text_size(self, instance, size):
+        instance.text_size = size
+
+    def _update_backdrop(self, *args):
+        self.backdrop.pos = self.pos
+        self.backdrop.size = self.size
+        # maintain a soft, dialog-like dim
+        self.backdrop.radius = [0]
+
+    def set_instructions(self, instructions):
+        """Replace the current instruction list and reset to the first slide."""
+        self.instructions = instructions or []
+        self.current_index = 0
+        self._update_slide_content()
+
+    def next_slide(self, *args):
+        if not self.instructions or self._is_animating:
+            return
+        if self.current_index < len(self.instructions) - 1:
+            self._animate_slide_change(self.current_index + 1)
+
+    def previous_slide(self, *args):
+        if not self.instructions or self._is_animating:
+            return
+        if self.current_index > 0:
+            self._animate_slide_change(self.current_index - 1)
+
+    def _update_slide_content(self):
+        if not self.instructions:
+            self.title_label.text = ""
+            self.body_label.text = ""
+            self._image_path = None
+            self.image_widget.texture = None
+            self.image_widget.opacity = 0
+            self.placeholder_label.opacity = 1
+            self.placeholder_label.text = "[Title]"
+            self.left_nav.disabled = True
+            self.right_nav.disabled = True
+            return
+
+        slide = self.instructions[self.current_index]
+        self.title_label.text = slide.title
+        self.body_label.text = slide.body
+
+        if slide.image:
+            self.placeholder_label.opacity = 0
+            self._show_image(slide.image)
+        else:
+            self._image_path = None
+            self.image_widget.texture = None
+            self.image_widget.opacity = 0
+            self.placeholder_label.text = slide.title or "[Title]"
+            self.placeholder_label.opacity = 1
+
+        self.left_nav.disabled = self.current_index == 0
+        self.right_nav.disabled = self.current_index >= len(self.instructions) - 1
+        self._prefetch_neighbors()
+
+    # --- Slide images ---
+    def _show_image(self, path):
+        """
+        Show `path` from the display-resolution cache. Until the decoded texture
+        arrives the image stays hidden; it is never decoded on the UI thread.
+        """
+        self._image_path = path
+        if not self._panel_px:
+            # Not laid out yet; _resize_containers loads it at the real size.
+            self.image_widget.opacity = 0
+            return
+        self._image_bucket = variant_size(self._panel_px)
+        if image_cache.load(path, self._panel_px, partial(self._on_image_ready, path)) is None:
+            self.image_widget.opacity = 0
+
+    def _on_image_ready(self, path, texture):
+        if path != self._image_path or texture is None:
+            return
+        self.image_widget.texture = texture
+        self.image_widget.opacity = 1
+
+    def _update_image_panel_px(self, square_size):
+        padding = self.right_container.content.padding
+        self._panel_px = max(0, square_size - max(padding[0] + padding[2], padding[1] + padding[3]))
+        if self._panel_px and variant_size(self._panel_px) != self._image_bucket:
+            if self._image_path:
+                self._show_image(self._image_path)
+            self._image_bucket = variant_size(self._panel_px)
+            self._prefetch_neighbors()
+
+    def _prefetch_neighbors(self):
+        """
+        Queue decodes for slides within `prefetch_window` of the current one,
+        nearest first, and cancel pending decodes outside the window. Decoded
+        images are kept one slide past the window, so paging back and forth
+        doesn't decode again, and evicted beyond that.
+        """
+        if not self._panel_px or not self.instructions:
+            return
+        window = max(0, int(self.prefetch_window))
+        low = max(0, self.current_index - window)
+        high = min(len(self.instructions) - 1, self.current_index + window)
+
+        wanted = []
+        for distance in range(window + 1):
+            for index in (self.current_index + distance, self.current_index - distance):
+                if low <= index <= high:
+                    image = self.instructions[index].image
+                    if image and image not in wanted:
+                        wanted.append(image)
+
+        for image in wanted:
+            image_cache.prefetch(image, self._panel_px)
+
+        kept = {
+            slide.image
+            for index, slide in enumerate(self.instructions)
+            if slide.image and abs(index - self.current_index) <= window + 1
+        }
+        for slide in self.instructions:
+            if slide.image and slide.image not in wanted:
+                image_cache.cancel(slide.image, self._panel_px)
+                if slide.image not in kept:
+                    image_cache.discard(slide.image)
+
+    def _animate_slide_change(self, target_index):
+        if target_index == self.current_index:
+            return
+        self._is_animating = True
+
+        def _apply_update(*_):
+            self.current_index = target_index
+            self._update_slide_content()
+            fade_in = Animation(opacity=1, d=0.1, t="out_quad")
+            fade_in.start(self.left_content_box)
+            fade_in.start(self.right_display)
+            fade_in.bind(on_complete=lambda *_: setattr(self, "_is_animating", False))
+
+        fade_out = Animation(opacity=0, d=0.08, t="out_quad")
+        fade_out.bind(on_complete=_apply_update)
+        fade_out.start(self.left_content_box)
+        fade_out.start(self.right_display)
+
+    def show(self, parent=None):
+        """Re-attach a closed overlay (to `parent` if given) and animate it in."""
+        if parent is not None and self.parent is not parent:
+            if self.parent:
+                self.parent.remove_widget(self)
+            parent.add_widget(self)
+        self._is_animating = False
+        self._touch_start = None
+        self._touch_pos = None
+        self.left_content_box.opacity = 1
+        self.right_display.opacity = 1
+        # Put the wrapper back at its resting position before rising in again.
+        self.do_layout()
+        self._animate_in()
+
+    @property
+    def is_open(self):
+        return self.parent is not None
+
+    def close_overlay(self, *args):
+        self._animate_out()
+
+    def on_touch_down(self, touch):
+        """
+        Always consume touches so widgets behind the overlay are not interactive.
+        """
+        # Tap outside the content to dismiss, similar to confirmOverlay behavior.
+        if not self.row.collide_point(*touch.pos) and not self.close_btn.collide_point(*touch.pos):
+            self.close_overlay()
+            return True
+
+        # Let children (nav/buttons) handle it, but stop propagation to layers beneath.
+        if self.row.collide_point(*touch.pos):
+            self._touch_start = touch.pos
+            self._touch_pos = touch.pos
+        super().on_touch_down(touch)
+        return True
+
+    def on_touch_move(self, touch):
+        if self._touch_start:
+            self._touch_pos = touch.pos
+        return super().on_touch_move(touch)
+
+    def on_touch_up(self, touch):
+        if self._touch_start and self._touch_pos:
+            dx = self._touch_pos[0] - self._touch_start[0]
+            dy = self._touch_pos[1] - self._touch_start[1]
+            if abs(dx) > dp(60) and abs(dx) > abs(dy):
+                if dx < 0:
+                    self.next_slide()
+                else:
+                    self.previous_slide()
+        self._touch_start = None
+        self._touch_pos = None
+        return super().on_touch_up(touch)
+
+    # --- Layout helpers ---
+    def _schedule_resize(self, *args):
+        if self._resize_event is None:
+            self._resize_event = Clock.schedule_once(self._resize_containers, 0)
+
+    def _resize_containers(self, *args):
+        """
+        Keeps the left/right content containers square, constrained by the wrapper
+        height and available width between nav buttons. Debounced to avoid layout loops.
+        """
+        self._resize_event = None
+
+        available_width = max(
+            0,
+            self.wrapper.width
+            - self.left_nav.width
+            - self.right_nav.width
+            - self.row.spacing * 2,
+        )
+        square_size = min(available_width / 2.0, self.wrapper.height)
+        square_size = max(square_size, 0)
+
+        def _apply_size(widget, size):
+            if abs(widget.width - size) > 0.5 or abs(widget.height - size) > 0.5:
+                widget.size_hint = (None, None)
+                widget.width = size
+                widget.height = size
+
+        _apply_size(self.left_container, square_size)
+        _apply_size(self.right_container, square_size)
+        self._update_image_panel_px(square_size)
+
+        if abs(self.content_holder.height - square_size) > 0.5:
+            self.content_holder.size_hint = (None, None)
+            self.content_holder.height = square_size
+            self.content_holder.width = square_size * 2 + self.row.spacing
+
+        # Stretch nav arrows to match the square block height for visual alignment.
+        # Keep nav backgrounds consistent: fixed width, match content (left container) height, force redraw.
+        nav_height = self.left_container.height
+        nav_size = (dp(72), nav_height)
+
+        self.left_nav.size_hint = (None, None)
+        self.left_nav.size = nav_size
+        self.left_nav._update_graphics()
+
+        self.right_nav.size_hint = (None, None)
+        self.right_nav.size = nav_size
+        self.right_nav._update_graphics()
+
+        # Sync row and wrapper height to nav/content block height for vertical centering.
+        if abs(self.row.height - nav_height) > 0.5:
+            self.row.height = nav_height
+        if abs(self.wrapper.height - nav_height) > 0.5:
+            self.wrapper.height = nav_height
+
+        # Update the row width/height so AnchorLayout keeps it centered.
+        row_width = (
+            self.left_nav.width
+            + self.row.spacing
+            + self.content_holder.width
+            + self.row.spacing
+            + self.right_nav.width
+        )
+        if abs(self.row.width - row_width) > 0.5:
+            self.row.width = row_width
+        if abs(self.row.height - square_size) > 0.5:
+            self.row.height = square_size
+
+    # --- Animations ---
+    def _animate_in(self):
+        # Backdrop fade-in
+        Animation.cancel_all(self, "opacity")
+        Animation.cancel_all(self.wrapper, "opacity", "y")
+        Animation.cancel_all(self.backdrop_color)
+        target_y = self.wrapper.y
+        self.wrapper.y = target_y - dp(24)
+        self.opacity = 0
+        self.wrapper.opacity = 0
+
+        fade_in = Animation(opacity=1, d=0.18, t="out_quad")
+        rise_in = Animation(opacity=1, y=target_y, d=0.2, t="out_quad")
+        fade_bg = Animation(rgba=(0, 0, 0, 0.6), d=0.18, t="out_quad")
+
+        fade_in.start(self)
+        rise_in.start(self.wrapper)
+        fade_bg.start(self.backdrop_color)
+
+    def _animate_out(self):
+        def _finish(*_):
+            if callable(self.on_close):
+                self.on_close()
+            if self.parent:
+                self.parent.remove_widget(self)
+
+        Animation.cancel_all(self, "opacity")
+        Animation.cancel_all(self.wrapper, "opacity", "y")
+        fade_out = Animation(opacity=0, d=0.15, t="out_quad")
+        drop_out = Animation(opacity=0, y=self.wrapper.y - dp(20), d=0.15, t="out_quad")
+        fade_bg = Animation(rgba=(0, 0, 0, 0.0), d=0.15, t="out_quad")
+
+        fade_out.bind(on_complete=_finish)
+        fade_out.start(self)
+        drop_out.start(self.wrapper)
+        fade_bg.start(self.backdrop_color)
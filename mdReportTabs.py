@@ -0,0 +1,196 @@
+from kivy.metrics import dp
+from kivy.uix.anchorlayout import AnchorLayout
+from kivy.uix.scrollview import ScrollView
+
+from kivymd.uix.boxlayout import MDBoxLayout
+from kivymd.uix.label import MDLabel
+from kivymd.uix.list import MDListItemLeadingIcon
+
+
+# ---------------------------------------------------------------------------
+# User report builders
+# ---------------------------------------------------------------------------
+def build_simple_tab(title):
+    box = MDBoxLayout(orientation="vertical")
+    label = MDLabel(
+        text=title,
+        halign="center",
+        valign="middle",
+        theme_text_color="Secondary",
+    )
+    label.bind(size=lambda instance, size: setattr(instance, "text_size", size))
+    box.add_widget(label)
+    return box
+
+
+def build_result_summary(result):
+    icon_map = {
+        "high tolerance": "liquor",
+        "LOW tolerance": "glass-wine",
+        "extremely low tolerance": "glass-cocktail-off",
+        "NON-VALID RESULTS": "alert-remove",
+    }
+    normalized = " ".join(result.strip().lower().split())
+    icon_map_normalized = {k.lower(): v for k, v in icon_map.items()}
+    icon_name = icon_map.get(result, icon_map_normalized.get(normalized, "help-circle"))
+
+    styles = {
+        "high tolerance": ((0.2, 0.6, 0.3, 1), "High Tolerance"),
+        "low tolerance": ((0.82, 0.55, 0.2, 1), "Low Tolerance"),
+        "extremely low tolerance": ((0.85, 0.2, 0.2, 1), "Extremely Low Tolerance"),
+        "non-valid results": ((0.45, 0.45, 0.45, 1), "Non-Valid Results"),
+    }
+    result_color, result_text = styles.get(normalized, ((0.2, 0.3, 0.7, 1), result))
+
+    center_block = MDBoxLayout(
+        orientation="vertical",
+        spacing=dp(4),
+        size_hint=(None, None),
+        padding=dp(0),
+    )
+    center_block.bind(minimum_height=center_block.setter("height"))
+    center_block.bind(minimum_width=center_block.setter("width"))
+    result_title = MDLabel(
+        text="This Result:",
+        halign="center",
+        valign="middle",
+        theme_text_color="Custom",
+        text_color=(0.2, 0.3, 0.7, 1),
+        bold=True,
+        padding=dp(0),
+        size_hint=(None, None),
+        text_size=(None, None),
+        adaptive_size=True,
+        shorten=True,
+        shorten_from="right",
+    )
+    result_title.font_size = "24sp"
+    result_title.bind(texture_size=lambda instance, size: setattr(instance, "size", size))
+    center_block.add_widget(result_title)
+
+    result_row = MDBoxLayout(orientation="horizontal", spacing=dp(8), adaptive_size=True)
+    result_row.bind(minimum_width=result_row.setter("width"))
+    result_row.bind(minimum_height=result_row.setter("height"))
+    icon = MDListItemLeadingIcon(icon=icon_name)
+    icon.theme_text_color = "Custom"
+    icon.text_color = result_color
+    icon.size_hint = (None, None)
+    icon.font_size = "40sp"
+    icon.size = (dp(36), dp(36))
+
+    result_label = MDLabel(
+        text=result_text,
+        halign="left",
+        valign="bottom",
+        theme_text_color="Custom",
+        text_color=result_color,
+        font_style="Title",
+        size_hint=(None, None),
+        text_size=(None, None),
+        adaptive_size=True,
+        shorten=True,
+        shorten_from="right",
+    )
+    result_label.font_size = "36sp"
+    result_label.bind(texture_size=lambda instance, size: setattr(instance, "size", size))
+
+    result_row.add_widget(icon)
+    result_row.add_widget(result_label)
+    result_anchor = AnchorLayout(anchor_x="center", anchor_y="center", size_hint=(1, None))
+    result_row.bind(height=lambda instance, value: setattr(result_anchor, "height", value))
+    result_anchor.height = result_row.height
+    result_anchor.add_widget(result_row)
+    center_block.add_widget(result_anchor)
+    return center_block
+
+
+def build_test_results_tab(project, time_str, result):
+    root = MDBoxLayout(orientation="vertical", spacing=dp(16))
+    header_row = MDBoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(32))
+    project_label = MDLabel(
+        text=project,
+        halign="left",
+        valign="middle",
+        theme_text_color="Primary",
+    )
+    date_label = MDLabel(
+        text=time_str,
+        halign="right",
+        valign="middle",
+        theme_text_color="Primary",
+    )
+    header_row.add_widget(project_label)
+    header_row.add_widget(date_label)
+    root.add_widget(header_row)
+
+    result_center = AnchorLayout(anchor_x="center", anchor_y="top", size_hint=(1, 1))
+    result_center.add_widget(build_result_summary(result))
+    root.add_widget(result_center)
+    return root
+
+
+def build_result_details_tab(result):
+    details_map = {
+        "high tolerance": (
+            "Your ALDH2 gene is functioning normally, which means your body can properly break down alcohol efficiently. You are less likely to experience flushing or discomfort after drinking. \n\n[b]Warning:[/b] Alcohol can still harm your liver, brain, and overall health with excessive use. \n\n[b]Tip:[/b] Enjoy responsibly! The CDC recommends limiting to 1 drink per day for women and 2 for men. Staying hydrated and giving your body rest days from alcohol is key to long-term health. "
+        ),
+        "low tolerance": (
+            "Your ALDH2 gene carries a variant that reduces your body's ability to break down alcohol efficiently. This can make you flush or feel unwell after even small amounts of alcohol. You may experience facial flushing, nausea, or rapid heartbeat after drinking. \n\n[b]Warning:[/b] Regular alcohol consumption can increase your risk of health issues over time, including liver damage, esophageal cancer, and heart issues. \n\n[b]Tip:[/b] It's strongly advised to limit alcohol consumption. If you choose to drink, keep it to small, occasional amounts. Take it slow, eat beforehand, and stay hydrated to help your body process it more safely."
+        ),
+        "extremely low tolerance": (
+            "Your ALDH2 gene has two inactive copies, meaning your body has a severely impaired ability to process alcohol. Even small amounts of alcohol can lead to a dangerous buildup of acetaldehyde, a toxic and carcinogenic substance that your body can't easily remove. \n\n[b]Warning:[/b] Drinking may cause strong flushing, dizziness, nausea, or heart palpitations — and long-term use can significantly increase your risk of cancer, liver damage, and cardiovascular diseases. \n\n[b]Tip:[/b] The safest choice is to avoid alcohol entirely. If possible, choose non-alcoholic beverages and celebrate with alternatives that protect your long-term health. Your body will thank you for it!"
+        ),
+        "non-valid results": (
+            "This result could not be interpreted. Please re-run the test or consult support if the issue persists."
+        ),
+    }
+    normalized = " ".join(result.strip().lower().split())
+    details_text = details_map.get(normalized, "No details available for this result.")
+
+    root = MDBoxLayout(orientation="vertical", spacing=dp(12))
+
+    scroll = ScrollView(
+        size_hint=(1, 1),
+        do_scroll_x=False,
+        do_scroll_y=True,
+        scroll_type=["bars", "content"],
+        bar_width=dp(6),
+        bar_color=(0.2, 0.3, 0.7, 0.7),
+        bar_inactive_color=(0.2, 0.3, 0.7, 0.35),
+    )
+    scroll.scroll_y = 1
+
+    scroll_content = MDBoxLayout(
+        orientation="vertical",
+        size_hint_y=None,
+        padding=[0, dp(4), dp(8), dp(8)],
+        spacing=dp(16),
+    )
+    scroll_content.bind(minimum_height=scroll_content.setter("height"))
+
+    result_summary = build_result_summary(result)
+    result_wrapper = AnchorLayout(anchor_x="center", anchor_y="top", size_hint=(1, None))
+    result_wrapper.height = result_summary.height
+    result_summary.bind(height=lambda instance, value: setattr(result_wrapper, "height", value))
+    result_wrapper.add_widget(result_summary)
+    scroll_content.add_widget(result_wrapper)
+
+    details_label = MDLabel(
+        text=details_text,
+        halign="left",
+        valign="top",
+        theme_text_color="Primary",
+        size_hint_y=None,
+        markup=True,
+    )
+    details_label.bind(
+        width=lambda instance, value: setattr(instance, "text_size", (value, None))
+    )
+    details_label.bind(
+        texture_size=lambda instance, size: setattr(instance, "height", size[1])
+    )
+
+    scroll_content.add_widget(details_label)
+    scroll.add_widget(scroll_content)
+    root.add_widget(scroll)
+    return root
@@ -1,14 +1,12 @@
-from datetime import datetime
-from dataclasses import dataclass
-from typing import Optional
+import math
+from importlib import import_module
 
 from kivy.animation import Animation
 from kivy.clock import Clock
-from kivy.core.window import Window
 from kivy.graphics import (
-    BoxShadow,
     Color,
     Ellipse,
+    InstructionGroup,
     Line,
     RoundedRectangle,
     StencilPop,
@@ -16,309 +14,94 @@ from kivy.graphics import (
     StencilUse,
 )
 from kivy.metrics import dp
-from kivy.properties import BooleanProperty, ListProperty, StringProperty
-from kivy.uix.anchorlayout import AnchorLayout
+from kivy.properties import BooleanProperty, ListProperty, NumericProperty, StringProperty
 from kivy.uix.behaviors import ButtonBehavior
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.image import Image
 from kivy.uix.label import Label
 from kivy.uix.relativelayout import RelativeLayout
 from kivy.uix.widget import Widget
-from kivy.uix.scrollview import ScrollView
 
-from kivymd.uix.boxlayout import MDBoxLayout
 from kivymd.uix.button import MDButton, MDButtonIcon, MDButtonText
-from kivymd.uix.dialog import MDDialog
-from kivymd.uix.label import MDLabel
-from kivymd.uix.list import MDListItemLeadingIcon
-from kivymd.uix.dropdownitem import MDDropDownItem, MDDropDownItemText
-from kivymd.uix.menu import MDDropdownMenu
+
+from clockService import TIER_1HZ, TIER_FRAME, clock_service
+from shadowCache import ShadowBox
+from virtualClock import virtual_clock
 
 
 # ---------------------------------------------------------------------------
-# Dialog helpers
+# Lazily imported feature modules
 # ---------------------------------------------------------------------------
-def confirmOverlay(confirm_callback, **kwargs):
-    """
-    Create and return a confirmation dialog.
-    In KivyMD 2.0, MDDialog doesn't accept title/text/type/buttons in __init__.
-    We'll build the dialog content manually.
-    """
-    dialog_kwargs = {
-        k: v
-        for k, v in kwargs.items()
-        if k
-        not in [
-            "title",
-            "text",
-            "type",
-            "buttons",
-            "completion_title",
-            "completion_text",
-            "completion_callback",
-        ]
-    }
-    dialog = MDDialog(**dialog_kwargs)
-
-    dialog.size_hint = (0.8, None)
-    dialog.size_hint_max_x = dp(400)
-    dialog.pos_hint = {"center_x": 0.5, "center_y": 0.5}
-
-    if hasattr(dialog, "padding"):
-        dialog.padding = [0, 0, 0, 0]
-    if hasattr(dialog, "spacing"):
-        dialog.spacing = 0
-
-    completion_kwargs = {
-        "confirm_callback": kwargs.get("completion_callback"),
-        "title": kwargs.get("completion_title", "Experiment Aborted"),
-        "text": kwargs.get(
-            "completion_text", "Please remove and discard the test sample."
-        ),
-    }
-
-    cancel_btn = MDButton(style="elevated", on_release=lambda *_: dialog.dismiss())
-    cancel_btn.add_widget(MDButtonText(text="No", font_style="Title"))
-
-    ok_btn = MDButton(
-        style="elevated",
-        on_release=lambda *_: _on_confirm(dialog, confirm_callback, completion_kwargs),
-        theme_bg_color="Custom",
-        md_bg_color=(0.8, 0.2, 0.2, 1),
-    )
-    ok_btn.elevation = 4
-    ok_btn.add_widget(
-        MDButtonText(
-            theme_text_color="Custom",
-            font_style="Title",
-            text_color=(1, 1, 1, 1),
-            text="Abort Test",
-        )
-    )
-
-    padding_val = dp(24)
-    content = MDBoxLayout(
-        orientation="vertical",
-        spacing="12dp",
-        padding=[padding_val, padding_val, padding_val, padding_val],
-        adaptive_height=True,
-        size_hint=(1, None),
-        pos_hint={"x": 0, "y": 0},
-    )
-
-    title_label = MDLabel(
-        text=kwargs.get("title", "Confirm Action"),
-        theme_text_color="Primary",
-        font_size="20sp",
-        bold=True,
-        adaptive_height=True,
-        halign="center",
-        valign="middle",
-        size_hint_x=1,
-        text_size=(None, None),
-    )
-
-    def set_title_text_size(instance, value):
-        if value > 0:
-            title_label.text_size = (value, None)
-
-    def update_title_size():
-        if title_label.width > 0:
-            title_label.text_size = (title_label.width, None)
-
-    title_label.bind(width=set_title_text_size)
-    content.add_widget(title_label)
-
-    text_label = MDLabel(
-        text=kwargs.get("text", "Are you sure you want to stop the test?"),
-        theme_text_color="Secondary",
-        font_size="16sp",
-        adaptive_height=True,
-        halign="center",
-        valign="middle",
-        size_hint_x=1,
-        text_size=(None, None),
-    )
-
-    def set_text_text_size(instance, value):
-        if value > 0:
-            text_label.text_size = (value, None)
-
-    def update_text_size():
-        if text_label.width > 0:
-            text_label.text_size = (text_label.width, None)
-
-    text_label.bind(width=set_text_text_size)
-    content.add_widget(text_label)
-
-    button_container = MDBoxLayout(
-        orientation="horizontal",
-        spacing="12dp",
-        adaptive_height=True,
-        size_hint_x=1,
-        padding=[0, dp(8), 0, 0],
-    )
-    spacer = Widget(size_hint_x=1)
-    button_container.add_widget(spacer)
-    button_container.add_widget(cancel_btn)
-    button_container.add_widget(ok_btn)
-    spacer2 = Widget(size_hint_x=1)
-    button_container.add_widget(spacer2)
-    content.add_widget(button_container)
-
-    if hasattr(dialog, "ids") and "content_container" in dialog.ids:
-        dialog.ids.content_container.add_widget(content)
-    else:
-        dialog.add_widget(content)
-
-    def update_dialog_height(*args):
-        if content.height > 0:
-            dialog.height = content.height
-
-    content.bind(height=update_dialog_height)
-
-    def ensure_centered(dt):
-        if dialog.parent:
-            dialog.pos_hint = {"center_x": 0.5, "center_y": 0.5}
-            if dialog.width > 0 and dialog.height > 0:
-                dialog.center = (Window.width / 2, Window.height / 2)
-            update_title_size()
-            update_text_size()
-
-    Clock.schedule_once(ensure_centered, 0.05)
-    Clock.schedule_once(ensure_centered, 0.15)
-    Clock.schedule_once(ensure_centered, 0.3)
-
-    return dialog
-
-
-def actionCompletedOverlay(
-    confirm_callback=None, title="Action Completed", text="Your action has been completed.", **kwargs
-):
+# The layout containers and buttons below are the lightweight core. Dialogs,
+# report builders, the export tab and the instruction overlay pull in most of
+# the KivyMD surface, so they live in their own modules and are only imported
+# the first time one of these names is accessed (PEP 562).
+_LAZY_EXPORTS = {
+    "confirmOverlay": "mdDialogs",
+    "actionCompletedOverlay": "mdDialogs",
+    "dialog_pool": "mdDialogs",
+    "build_simple_tab": "mdReportTabs",
+    "build_result_summary": "mdReportTabs",
+    "build_test_results_tab": "mdReportTabs",
+    "build_result_details_tab": "mdReportTabs",
+    "build_export_tab": "mdExportTab",
+    "InstructionPanel": "mdInstructionOverlay",
+    "InstructionNavButton": "mdInstructionOverlay",
+    "OverlayCloseButton": "mdInstructionOverlay",
+    "MultiStepInstructionOverlay": "mdInstructionOverlay",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
+
+# ---------------------------------------------------------------------------
+# Coalesced geometry updates
+# ---------------------------------------------------------------------------
+# "requested" counts pos/size notifications, "applied" counts canvas geometry
+# recomputes. Compare the two around a resize to benchmark the coalescing.
+geometry_counters = {"requested": 0, "applied": 0}
+
+
+def reset_geometry_counters():
+    geometry_counters["requested"] = 0
+    geometry_counters["applied"] = 0
+
+
+class DeferredGraphicsMixin:
     """
-    Lightweight overlay shown after the user confirms an action.
-    Keeps the same sizing/centering approach as confirmOverlay.
+    Recomputes canvas geometry at most once per frame.
+
+    Bind pos/size (of the widget or any child it draws for) to
+    `mark_graphics_dirty` and put the geometry code in `update_graphics`.
+    Each widget owns one `Clock.create_trigger(..., -1)`, so any number of
+    notifications within a frame collapse into a single update before the
+    next draw.
     """
-    dialog_kwargs = {k: v for k, v in kwargs.items() if k not in ["title", "text", "type", "buttons"]}
-    dialog = MDDialog(**dialog_kwargs)
-
-    dialog.size_hint = (0.8, None)
-    dialog.size_hint_max_x = dp(400)
-    dialog.pos_hint = {"center_x": 0.5, "center_y": 0.5}
-
-    if hasattr(dialog, "padding"):
-        dialog.padding = [0, 0, 0, 0]
-    if hasattr(dialog, "spacing"):
-        dialog.spacing = 0
-
-    padding_val = dp(24)
-    content = MDBoxLayout(
-        orientation="vertical",
-        spacing="12dp",
-        padding=[padding_val, padding_val, padding_val, padding_val],
-        adaptive_height=True,
-        size_hint=(1, None),
-        pos_hint={"x": 0, "y": 0},
-    )
-
-    title_label = MDLabel(
-        text=title,
-        theme_text_color="Primary",
-        font_size="20sp",
-        bold=True,
-        adaptive_height=True,
-        halign="center",
-        valign="middle",
-        size_hint_x=1,
-        text_size=(None, None),
-    )
-
-    def set_title_text_size(instance, value):
-        if value > 0:
-            title_label.text_size = (value, None)
-
-    title_label.bind(width=set_title_text_size)
-    content.add_widget(title_label)
-
-    text_label = MDLabel(
-        text=text,
-        theme_text_color="Secondary",
-        font_size="16sp",
-        adaptive_height=True,
-        halign="center",
-        valign="middle",
-        size_hint_x=1,
-        text_size=(None, None),
-    )
-
-    def set_text_text_size(instance, value):
-        if value > 0:
-            text_label.text_size = (value, None)
-
-    text_label.bind(width=set_text_text_size)
-    content.add_widget(text_label)
-
-    ok_btn = MDButton(
-        style="elevated",
-        on_release=lambda *_: _on_completed(dialog, confirm_callback),
-    )
-    ok_btn.add_widget(MDButtonText(text="OK", font_style="Title"))
-
-    button_container = MDBoxLayout(
-        orientation="horizontal",
-        spacing="12dp",
-        adaptive_height=True,
-        size_hint_x=1,
-        padding=[0, dp(8), 0, 0],
-    )
-    button_container.add_widget(Widget(size_hint_x=1))
-    button_container.add_widget(ok_btn)
-    button_container.add_widget(Widget(size_hint_x=1))
-    content.add_widget(button_container)
-
-    if hasattr(dialog, "ids") and "content_container" in dialog.ids:
-        dialog.ids.content_container.add_widget(content)
-    else:
-        dialog.add_widget(content)
-
-    def update_dialog_height(*args):
-        if content.height > 0:
-            dialog.height = content.height
-
-    content.bind(height=update_dialog_height)
-
-    def ensure_centered(dt):
-        if dialog.parent:
-            dialog.pos_hint = {"center_x": 0.5, "center_y": 0.5}
-            if dialog.width > 0 and dialog.height > 0:
-                dialog.center = (Window.width / 2, Window.height / 2)
-            title_label.text_size = (title_label.width, None)
-            text_label.text_size = (text_label.width, None)
-
-    Clock.schedule_once(ensure_centered, 0.05)
-    Clock.schedule_once(ensure_centered, 0.15)
-
-    return dialog
-
-
-def _on_completed(dialog, callback):
-    dialog.dismiss()
-    if callback:
-        callback()
-
-
-def _on_confirm(dialog, callback, completion_kwargs=None):
-    dialog.dismiss()
-
-    def open_completion_overlay(dt):
-        completion_dialog = actionCompletedOverlay(**(completion_kwargs or {}))
-        completion_dialog.open()
-
-    try:
-        if callback:
-            callback()
-    finally:
-        Clock.schedule_once(open_completion_overlay, 0.05)
+
+    def mark_graphics_dirty(self, *args):
+        geometry_counters["requested"] += 1
+        trigger = self.__dict__.get("_graphics_trigger")
+        if trigger is None:
+            trigger = self._graphics_trigger = Clock.create_trigger(self._flush_graphics, -1)
+        trigger()
+
+    def _flush_graphics(self, dt):
+        geometry_counters["applied"] += 1
+        self.update_graphics()
+
+    def update_graphics(self, *args):
+        pass
 
 
 # ---------------------------------------------------------------------------
@@ -569,7 +352,7 @@ class RippleButton(ButtonBehavior, Widget):
         anim.start(self)
 
 
-class uni_centerBox(RelativeLayout):
+class uni_centerBox(DeferredGraphicsMixin, RelativeLayout):
     bg_color = ListProperty([1, 1, 1, 1])
     radius = ListProperty([25, 25, 25, 25])
 
@@ -579,12 +362,10 @@ class uni_centerBox(RelativeLayout):
         with self.canvas.before:
             self.shadow_color = Color(0, 0, 0, 0.10)
 
-            self.shadow = BoxShadow(
+            self.shadow = ShadowBox(
                 pos=self.pos,
                 size=self.size,
-                radius=self.radius,
                 offset=(0, 0),
-                spread=dp(20),
                 blur_radius=dp(16),
                 border_radius=(20, 20, 20, 20),
             )
@@ -605,15 +386,13 @@ class uni_centerBox(RelativeLayout):
         )
 
         super().add_widget(self.content)
-        self.bind(pos=self.update_rect, size=self.update_rect, x=self.update_rect, y=self.update_rect)
-
-        def delayed_update(dt):
-            self.update_rect()
-            Clock.schedule_once(lambda dt2: self.update_rect(), 0.05)
-
-        Clock.schedule_once(delayed_update, 0.1)
+        self.bind(pos=self.mark_graphics_dirty, size=self.mark_graphics_dirty)
+        self.mark_graphics_dirty()
 
     def update_rect(self, *args):
+        self.update_graphics()
+
+    def update_graphics(self, *args):
         if self.size[0] == 0 or self.size[1] == 0:
             return
 
@@ -629,7 +408,7 @@ class uni_centerBox(RelativeLayout):
         return super().add_widget(widget, *args, **kwargs)
 
 
-class FolderTabButton(ButtonBehavior, BoxLayout):
+class FolderTabButton(DeferredGraphicsMixin, ButtonBehavior, BoxLayout):
     text = StringProperty("")
     selected = BooleanProperty(False)
     disabled = BooleanProperty(False)
@@ -654,14 +433,14 @@ class FolderTabButton(ButtonBehavior, BoxLayout):
         self.label.bind(size=self._update_label_text_size)
         self.add_widget(self.label)
 
-        self.bind(pos=self._update_bg, size=self._update_bg)
+        self.bind(pos=self.mark_graphics_dirty, size=self.mark_graphics_dirty)
         self.bind(selected=self._refresh_style, disabled=self._refresh_style)
         self._refresh_style()
 
     def _update_label_text_size(self, instance, size):
         instance.text_size = size
 
-    def _update_bg(self, *args):
+    def update_graphics(self, *args):
         self.bg_rect.pos = self.pos
         self.bg_rect.size = self.size
 
@@ -685,9 +464,14 @@ class FolderTabButton(ButtonBehavior, BoxLayout):
 class uni_folderContainer(uni_centerBox):
     """
     Folder-style container with a header row of tabs and a main content region.
+
+    Tab content may be a widget or a builder callable returning one. Builders
+    run the first time their tab is selected and the result is cached. With
+    `prebuild_adjacent=True` the neighbouring tabs are built one per idle
+    callback (`prebuild_delay` seconds) after a selection.
     """
 
-    def __init__(self, tabs=None, **kwargs):
+    def __init__(self, tabs=None, prebuild_adjacent=False, prebuild_delay=0.5, **kwargs):
         super().__init__(**kwargs)
 
         self.content.padding = [0, 0, 0, 0]
@@ -723,8 +507,12 @@ class uni_folderContainer(uni_centerBox):
 
         self.tab_buttons = []
         self.tab_contents = []
+        self.tab_builders = []
         self.tab_enabled = []
         self.current_index = 0
+        self.prebuild_adjacent = prebuild_adjacent
+        self.prebuild_delay = prebuild_delay
+        self._prebuild_event = None
         self._swipe_start = None
         self._swipe_pos = None
 
@@ -747,10 +535,16 @@ class uni_folderContainer(uni_centerBox):
         return placeholder
 
     def set_tabs(self, tabs):
+        """
+        `tabs` is a list of `(title, content, enabled?)`. `content` is a widget,
+        a builder callable (built on first select), or None for a placeholder.
+        """
         self.tabs_row.clear_widgets()
         self.tab_buttons = []
         self.tab_contents = []
+        self.tab_builders = []
         self.tab_enabled = []
+        self._cancel_prebuild()
 
         normalized_tabs = list(tabs or [])
         while len(normalized_tabs) < 3:
@@ -771,8 +565,11 @@ class uni_folderContainer(uni_centerBox):
             else:
                 title = str(tab)
 
+            builder = None
             if content is None:
                 content = self._build_placeholder(title or " ")
+            elif callable(content) and not isinstance(content, Widget):
+                builder, content = content, None
 
             button = FolderTabButton(text=title)
             button.disabled = not enabled
@@ -782,6 +579,7 @@ class uni_folderContainer(uni_centerBox):
             self.tabs_row.add_widget(button)
             self.tab_buttons.append(button)
             self.tab_contents.append(content)
+            self.tab_builders.append(builder)
             self.tab_enabled.append(enabled)
 
         # Defer initial highlight placement until layout has sizes.
@@ -799,7 +597,7 @@ class uni_folderContainer(uni_centerBox):
             button.selected = i == index
 
         self.content_area.clear_widgets()
-        content = self.tab_contents[index]
+        content = self.get_tab_content(index)
         if content.parent:
             content.parent.remove_widget(content)
         self.content_area.add_widget(content)
@@ -814,6 +612,44 @@ class uni_folderContainer(uni_centerBox):
             else:
                 animate = False
         self._move_highlight(index, animate=animate)
+        self._schedule_prebuild()
+
+    # --- Lazy tab content ---
+    def is_tab_built(self, index):
+        return self.tab_contents[index] is not None
+
+    def get_tab_content(self, index):
+        """Return the tab's widget, running its builder on first use."""
+        content = self.tab_contents[index]
+        if content is None:
+            builder = self.tab_builders[index]
+            try:
+                content = builder()
+            except Exception as e:
+                print(f"[Warning] Building tab '{self.tab_buttons[index].text}' failed: {e}")
+                content = self._build_placeholder(self.tab_buttons[index].text or " ")
+            self.tab_contents[index] = content
+            self.tab_builders[index] = None
+        return content
+
+    def _schedule_prebuild(self):
+        self._cancel_prebuild()
+        if self.prebuild_adjacent:
+            self._prebuild_event = Clock.schedule_once(self._prebuild_next, self.prebuild_delay)
+
+    def _cancel_prebuild(self):
+        if self._prebuild_event is not None:
+            self._prebuild_event.cancel()
+            self._prebuild_event = None
+
+    def _prebuild_next(self, dt):
+        # One tab per callback so a slow builder never stacks up in a single frame.
+        self._prebuild_event = None
+        for index in (self.current_index + 1, self.current_index - 1):
+            if 0 <= index < len(self.tab_contents) and self.tab_enabled[index] and not self.is_tab_built(index):
+                self.get_tab_content(index)
+                self._schedule_prebuild()
+                return
 
     def _update_highlight_position(self, *args):
         if not self.tab_buttons:
@@ -898,823 +734,6 @@ def add_debug_outline(widget, color=(1, 0, 0, 1), line_width=1.5):
     widget.bind(pos=update_debug_line, size=update_debug_line)
 
 
-def build_simple_tab(title):
-    box = MDBoxLayout(orientation="vertical")
-    label = MDLabel(
-        text=title,
-        halign="center",
-        valign="middle",
-        theme_text_color="Secondary",
-    )
-    label.bind(size=lambda instance, size: setattr(instance, "text_size", size))
-    box.add_widget(label)
-    return box
-
-
-def build_result_summary(result):
-    icon_map = {
-        "high tolerance": "liquor",
-        "LOW tolerance": "glass-wine",
-        "extremely low tolerance": "glass-cocktail-off",
-        "NON-VALID RESULTS": "alert-remove",
-    }
-    normalized = " ".join(result.strip().lower().split())
-    icon_map_normalized = {k.lower(): v for k, v in icon_map.items()}
-    icon_name = icon_map.get(result, icon_map_normalized.get(normalized, "help-circle"))
-
-    styles = {
-        "high tolerance": ((0.2, 0.6, 0.3, 1), "High Tolerance"),
-        "low tolerance": ((0.82, 0.55, 0.2, 1), "Low Tolerance"),
-        "extremely low tolerance": ((0.85, 0.2, 0.2, 1), "Extremely Low Tolerance"),
-        "non-valid results": ((0.45, 0.45, 0.45, 1), "Non-Valid Results"),
-    }
-    result_color, result_text = styles.get(normalized, ((0.2, 0.3, 0.7, 1), result))
-
-    center_block = MDBoxLayout(
-        orientation="vertical",
-        spacing=dp(4),
-        size_hint=(None, None),
-        padding=dp(0),
-    )
-    center_block.bind(minimum_height=center_block.setter("height"))
-    center_block.bind(minimum_width=center_block.setter("width"))
-    result_title = MDLabel(
-        text="This Result:",
-        halign="center",
-        valign="middle",
-        theme_text_color="Custom",
-        text_color=(0.2, 0.3, 0.7, 1),
-        bold=True,
-        padding=dp(0),
-        size_hint=(None, None),
-        text_size=(None, None),
-        adaptive_size=True,
-        shorten=True,
-        shorten_from="right",
-    )
-    result_title.font_size = "24sp"
-    result_title.bind(texture_size=lambda instance, size: setattr(instance, "size", size))
-    center_block.add_widget(result_title)
-
-    result_row = MDBoxLayout(orientation="horizontal", spacing=dp(8), adaptive_size=True)
-    result_row.bind(minimum_width=result_row.setter("width"))
-    result_row.bind(minimum_height=result_row.setter("height"))
-    icon = MDListItemLeadingIcon(icon=icon_name)
-    icon.theme_text_color = "Custom"
-    icon.text_color = result_color
-    icon.size_hint = (None, None)
-    icon.font_size = "40sp"
-    icon.size = (dp(36), dp(36))
-
-    result_label = MDLabel(
-        text=result_text,
-        halign="left",
-        valign="bottom",
-        theme_text_color="Custom",
-        text_color=result_color,
-        font_style="Title",
-        size_hint=(None, None),
-        text_size=(None, None),
-        adaptive_size=True,
-        shorten=True,
-        shorten_from="right",
-    )
-    result_label.font_size = "36sp"
-    result_label.bind(texture_size=lambda instance, size: setattr(instance, "size", size))
-
-    result_row.add_widget(icon)
-    result_row.add_widget(result_label)
-    result_anchor = AnchorLayout(anchor_x="center", anchor_y="center", size_hint=(1, None))
-    result_row.bind(height=lambda instance, value: setattr(result_anchor, "height", value))
-    result_anchor.height = result_row.height
-    result_anchor.add_widget(result_row)
-    center_block.add_widget(result_anchor)
-    return center_block
-
-
-def build_test_results_tab(project, time_str, result):
-    root = MDBoxLayout(orientation="vertical", spacing=dp(16))
-    header_row = MDBoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(32))
-    project_label = MDLabel(
-        text=project,
-        halign="left",
-        valign="middle",
-        theme_text_color="Primary",
-    )
-    date_label = MDLabel(
-        text=time_str,
-        halign="right",
-        valign="middle",
-        theme_text_color="Primary",
-    )
-    header_row.add_widget(project_label)
-    header_row.add_widget(date_label)
-    root.add_widget(header_row)
-
-    result_center = AnchorLayout(anchor_x="center", anchor_y="top", size_hint=(1, 1))
-    result_center.add_widget(build_result_summary(result))
-    root.add_widget(result_center)
-    return root
-
-
-def build_result_details_tab(result):
-    details_map = {
-        "high tolerance": (
-            "Your ALDH2 gene is functioning normally, which means your body can properly break down alcohol efficiently. You are less likely to experience flushing or discomfort after drinking. \n\n[b]Warning:[/b] Alcohol can still harm your liver, brain, and overall health with excessive use. \n\n[b]Tip:[/b] Enjoy responsibly! The CDC recommends limiting to 1 drink per day for women and 2 for men. Staying hydrated and giving your body rest days from alcohol is key to long-term health. "
-        ),
-        "low tolerance": (
-            "Your ALDH2 gene carries a variant that reduces your body's ability to break down alcohol efficiently. This can make you flush or feel unwell after even small amounts of alcohol. You may experience facial flushing, nausea, or rapid heartbeat after drinking. \n\n[b]Warning:[/b] Regular alcohol consumption can increase your risk of health issues over time, including liver damage, esophageal cancer, and heart issues. \n\n[b]Tip:[/b] It's strongly advised to limit alcohol consumption. If you choose to drink, keep it to small, occasional amounts. Take it slow, eat beforehand, and stay hydrated to help your body process it more safely."
-        ),
-        "extremely low tolerance": (
-            "Your ALDH2 gene has two inactive copies, meaning your body has a severely impaired ability to process alcohol. Even small amounts of alcohol can lead to a dangerous buildup of acetaldehyde, a toxic and carcinogenic substance that your body can't easily remove. \n\n[b]Warning:[/b] Drinking may cause strong flushing, dizziness, nausea, or heart palpitations — and long-term use can significantly increase your risk of cancer, liver damage, and cardiovascular diseases. \n\n[b]Tip:[/b] The safest choice is to avoid alcohol entirely. If possible, choose non-alcoholic beverages and celebrate with alternatives that protect your long-term health. Your body will thank you for it!"
-        ),
-        "non-valid results": (
-            "This result could not be interpreted. Please re-run the test or consult support if the issue persists."
-        ),
-    }
-    normalized = " ".join(result.strip().lower().split())
-    details_text = details_map.get(normalized, "No details available for this result.")
-
-    root = MDBoxLayout(orientation="vertical", spacing=dp(12))
-
-    scroll = ScrollView(
-        size_hint=(1, 1),
-        do_scroll_x=False,
-        do_scroll_y=True,
-        scroll_type=["bars", "content"],
-        bar_width=dp(6),
-        bar_color=(0.2, 0.3, 0.7, 0.7),
-        bar_inactive_color=(0.2, 0.3, 0.7, 0.35),
-    )
-    scroll.scroll_y = 1
-
-    scroll_content = MDBoxLayout(
-        orientation="vertical",
-        size_hint_y=None,
-        padding=[0, dp(4), dp(8), dp(8)],
-        spacing=dp(16),
-    )
-    scroll_content.bind(minimum_height=scroll_content.setter("height"))
-
-    result_summary = build_result_summary(result)
-    result_wrapper = AnchorLayout(anchor_x="center", anchor_y="top", size_hint=(1, None))
-    result_wrapper.height = result_summary.height
-    result_summary.bind(height=lambda instance, value: setattr(result_wrapper, "height", value))
-    result_wrapper.add_widget(result_summary)
-    scroll_content.add_widget(result_wrapper)
-
-    details_label = MDLabel(
-        text=details_text,
-        halign="left",
-        valign="top",
-        theme_text_color="Primary",
-        size_hint_y=None,
-        markup=True,
-    )
-    details_label.bind(
-        width=lambda instance, value: setattr(instance, "text_size", (value, None))
-    )
-    details_label.bind(
-        texture_size=lambda instance, size: setattr(instance, "height", size[1])
-    )
-
-    scroll_content.add_widget(details_label)
-    scroll.add_widget(scroll_content)
-    root.add_widget(scroll)
-    return root
-
-
-def build_export_tab(qr_image_path="assets/sampleQR.png"):
-    root = MDBoxLayout(orientation="vertical", spacing=dp(16))
-
-    header_row = MDBoxLayout(orientation="horizontal", size_hint=(1, None), height=dp(40))
-    left_group = MDBoxLayout(orientation="horizontal", size_hint=(None, 1), spacing=dp(12))
-    left_group.bind(minimum_width=left_group.setter("width"))
-    header_label = MDLabel(
-        text="Export Method:",
-        halign="left",
-        valign="middle",
-        size_hint=(None, 1),
-        adaptive_size=True,
-        shorten=True,
-        shorten_from="right",
-    )
-    header_label.bind(texture_size=lambda instance, size: setattr(instance, "width", size[0]))
-
-    dropdown = MDDropDownItem(size_hint=(None, None))
-    dropdown_text = MDDropDownItemText(text="QR Code")
-    dropdown.add_widget(dropdown_text)
-    dropdown.width = dp(160)
-    left_group.add_widget(header_label)
-    left_group.add_widget(dropdown)
-    header_row.add_widget(left_group)
-    header_row.add_widget(Widget())
-    root.add_widget(header_row)
-
-    content_holder = MDBoxLayout(orientation="vertical", size_hint=(1, 1))
-    root.add_widget(content_holder)
-
-    qr_container = MDBoxLayout(orientation="vertical", spacing=dp(16))
-    qr_container.add_widget(AnchorLayout(size_hint=(1, None), height=dp(200)))
-    qr_image = Image(
-        source=qr_image_path,
-        allow_stretch=True,
-        keep_ratio=True,
-        size_hint=(None, None),
-        size=(dp(180), dp(180)),
-    )
-    qr_container.children[0].add_widget(qr_image)
-
-    qr_instructions = MDLabel(
-        text="Scan with your mobile device.\nYou will be redirected to a portal where your results will be available for download.",
-        halign="center",
-        valign="top",
-    )
-    qr_instructions.bind(size=lambda instance, size: setattr(instance, "text_size", size))
-    qr_container.add_widget(qr_instructions)
-
-    usb_container = MDBoxLayout(orientation="vertical", spacing=dp(16))
-    usb_note = MDLabel(
-        text="Make sure your device is properly connected.",
-        halign="center",
-        valign="middle",
-    )
-    usb_note.bind(size=lambda instance, size: setattr(instance, "text_size", size))
-    usb_button = MDButton(MDButtonIcon(icon="usb"), style="elevated", size_hint=(None, None))
-    usb_label = MDButtonText(text="Export To USB")
-    usb_button.add_widget(usb_label)
-
-    def _resize_usb_button(*_):
-        usb_button.width = usb_label.texture_size[0] + dp(60)
-        usb_button.height = max(usb_label.texture_size[1] + dp(20), dp(48))
-
-    usb_label.bind(texture_size=_resize_usb_button)
-    _resize_usb_button()
-    usb_container.add_widget(AnchorLayout(size_hint=(1, None), height=dp(56)))
-    usb_container.children[0].add_widget(usb_button)
-    usb_container.add_widget(usb_note)
-
-    def set_export_view(value):
-        dropdown_text.text = value
-        content_holder.clear_widgets()
-        if value == "USB":
-            content_holder.add_widget(usb_container)
-        else:
-            content_holder.add_widget(qr_container)
-
-    menu_items = [
-        {"text": "QR Code", "on_release": lambda *_: set_export_view("QR Code")},
-        {"text": "USB", "on_release": lambda *_: set_export_view("USB")},
-    ]
-    menu = MDDropdownMenu(caller=dropdown, items=menu_items, width_mult=3)
-    dropdown.on_release = menu.open
-
-    set_export_view("QR Code")
-    return root
-
-
-@dataclass
-class InstructionPanel:
-    """Represents a single slide in the instruction overlay."""
-
-    title: str = ""
-    body: str = ""
-    image: Optional[str] = None
-
-
-class InstructionNavButton(ButtonBehavior, RelativeLayout):
-    """
-    Arrow control used to move forward/backward through the instruction slides.
-    """
-
-    disabled = BooleanProperty(False)
-    direction = StringProperty("left")
-
-    def __init__(self, direction="left", **kwargs):
-        kwargs.setdefault("size_hint", (None, 1))
-        kwargs.setdefault("width", dp(72))
-        super().__init__(**kwargs)
-        self.direction = direction
-
-        self.ripple_alpha = 0
-        self.ripple_pos = (0, 0)
-        self.ripple_radius = 0
-
-        self.active_color = (0.13, 0.34, 0.75, 1)
-        self.inactive_color = (0.7, 0.7, 0.7, 0.55)
-        self.active_arrow_color = (1, 1, 1, 1)
-        self.inactive_arrow_color = (0.25, 0.25, 0.25, 1)
-
-        with self.canvas.before:
-            self.bg_color_instruction = Color(*self._current_bg_color())
-            # Draw background in local widget coordinates to avoid layout offsets.
-            self.bg = RoundedRectangle(pos=(0, 0), size=self.size, radius=[dp(22)] * 4)
-
-        with self.canvas:
-            StencilPush()
-            self.stencil_shape = RoundedRectangle(pos=(0, 0), size=self.size, radius=[dp(22)] * 4)
-            StencilUse()
-
-            self.ripple_color_instruction = Color(1, 1, 1, self.ripple_alpha)
-            self.ripple = Ellipse(size=(0, 0))
-
-            StencilPop()
-
-        arrow_src = "assets/LNav.png" if self.direction == "left" else "assets/RNav.png"
-        self.arrow_image = Image(
-            source=arrow_src,
-            allow_stretch=True,
-            keep_ratio=True,
-            color=self._current_arrow_color(),
-            size_hint=(0.75, 0.75),
-            pos_hint={"center_x": 0.5, "center_y": 0.5},
-        )
-        self.add_widget(self.arrow_image)
-
-        self.bind(pos=self._update_graphics, size=self._update_graphics, disabled=self._refresh_colors)
-
-    def _current_bg_color(self):
-        return self.inactive_color if self.disabled else self.active_color
-
-    def _current_arrow_color(self):
-        return self.inactive_arrow_color if self.disabled else self.active_arrow_color
-
-    def _refresh_colors(self, *args):
-        self.bg_color_instruction.rgba = self._current_bg_color()
-        self.arrow_image.color = self._current_arrow_color()
-
-    def _update_graphics(self, *args):
-        self.bg.pos = (0, 0)
-        self.bg.size = self.size
-        # Image centers via pos_hint; no manual text_size needed.
-        self.stencil_shape.pos = (0, 0)
-        self.stencil_shape.size = self.size
-
-        self.ripple_color_instruction.rgba = (1, 1, 1, self.ripple_alpha)
-        r = self.ripple_radius
-        self.ripple.size = (r * 2, r * 2)
-        self.ripple.pos = (self.ripple_pos[0] - r, self.ripple_pos[1] - r)
-
-    def reset_ripple(self, *args):
-        self.ripple_radius = 0
-        self.ripple_alpha = 0
-        self._update_graphics()
-
-    def on_touch_down(self, touch):
-        if self.disabled:
-            return False
-        if self.collide_point(*touch.pos):
-            self.ripple_pos = (touch.x - self.x, touch.y - self.y)
-            self.ripple_radius = 0
-            self.ripple_alpha = 0.35
-            max_r = max(self.width, self.height) * 1.2
-
-            expand = Animation(ripple_radius=max_r, d=0.23, t="out_quad")
-            fade = Animation(ripple_alpha=0, d=0.18, t="out_quad")
-            anim = expand + fade
-            anim.bind(on_progress=lambda *a: self._update_graphics())
-            anim.bind(on_complete=self.reset_ripple)
-            anim.start(self)
-
-        return super().on_touch_down(touch)
-
-    def on_touch_up(self, touch):
-        if self.disabled:
-            return False
-        return super().on_touch_up(touch)
-
-
-class OverlayCloseButton(ButtonBehavior, RelativeLayout):
-    """Circular close control that sits in the top-left of the overlay."""
-
-    def __init__(self, **kwargs):
-        kwargs.setdefault("size_hint", (None, None))
-        kwargs.setdefault("size", (dp(64), dp(64)))
-        super().__init__(**kwargs)
-
-        self.ripple_alpha = 0
-        self.ripple_pos = (0, 0)
-        self.ripple_radius = 0
-
-        with self.canvas.before:
-            Color(0.86, 0.24, 0.24, 1)
-            self.circle = Ellipse(pos=self.pos, size=self.size)
-
-        with self.canvas:
-            StencilPush()
-            self.stencil_shape = Ellipse(pos=(0, 0), size=self.size)
-            StencilUse()
-
-            self.ripple_color_instruction = Color(1, 1, 1, self.ripple_alpha)
-            self.ripple = Ellipse(size=(0, 0))
-
-            StencilPop()
-
-        self.x_image = Image(
-            source="assets/x.png",
-            allow_stretch=True,
-            keep_ratio=True,
-            size_hint=(0.8, 0.8),
-            pos_hint={"center_x": 0.5, "center_y": 0.5},
-        )
-        self.add_widget(self.x_image)
-
-        self.bind(pos=self._update_graphics, size=self._update_graphics)
-
-    def _update_graphics(self, *args):
-        self.circle.pos = (0, 0)
-        self.circle.size = self.size
-        self.stencil_shape.pos = (0, 0)
-        self.stencil_shape.size = self.size
-
-        self.ripple_color_instruction.rgba = (1, 1, 1, self.ripple_alpha)
-        r = self.ripple_radius
-        self.ripple.size = (r * 2, r * 2)
-        self.ripple.pos = (self.ripple_pos[0] - r, self.ripple_pos[1] - r)
-
-    def reset_ripple(self, *args):
-        self.ripple_radius = 0
-        self.ripple_alpha = 0
-        self._update_graphics()
-
-    def on_touch_down(self, touch):
-        if not self.collide_point(*touch.pos):
-            return super().on_touch_down(touch)
-
-        self.ripple_pos = (touch.x - self.x, touch.y - self.y)
-        self.ripple_radius = 0
-        self.ripple_alpha = 0.35
-
-        max_r = max(self.width, self.height) * 1.2
-        expand = Animation(ripple_radius=max_r, d=0.23, t="out_quad")
-        fade = Animation(ripple_alpha=0, d=0.18, t="out_quad")
-        anim = expand + fade
-        anim.bind(on_progress=lambda *a: self._update_graphics())
-        anim.bind(on_complete=self.reset_ripple)
-        anim.start(self)
-
-        return super().on_touch_down(touch)
-
-
-class MultiStepInstructionOverlay(RelativeLayout):
-    """
-    Fullscreen overlay used to present a multi-step instruction flow.
-
-    Each slide is an InstructionPanel with title, body, and optional image. The
-    overlay renders the current slide and exposes next/previous controls plus a
-    close button.
-    """
-
-    def __init__(self, instructions=None, on_close=None, **kwargs):
-        kwargs.setdefault("size_hint", (1, 1))
-        kwargs.setdefault("pos_hint", {"x": 0, "y": 0})
-        super().__init__(**kwargs)
-
-        self.instructions = instructions or []
-        self.current_index = 0
-        self.on_close = on_close
-        self._resize_event = None
-        self._is_animating = False
-
-        with self.canvas.before:
-            self.backdrop_color = Color(0, 0, 0, 0.0)
-            self.backdrop = RoundedRectangle(pos=self.pos, size=self.size)
-
-        self.bind(pos=self._update_backdrop, size=self._update_backdrop)
-
-        self.close_btn = OverlayCloseButton(pos_hint={"x": 0.02, "top": 0.97})
-        self.close_btn.bind(on_release=self.close_overlay)
-        self.add_widget(self.close_btn)
-
-        self.wrapper = AnchorLayout(
-            anchor_x="center",
-            anchor_y="center",
-            size_hint=(0.94, None),
-            pos_hint={"center_x": 0.5, "center_y": 0.5},
-            height=dp(520),
-            opacity=0,
-        )
-        self.add_widget(self.wrapper)
-
-        self.row = BoxLayout(
-            orientation="horizontal",
-            spacing=dp(20),
-            size_hint=(None, None),
-        )
-        self.wrapper.add_widget(self.row)
-
-        self.left_nav = InstructionNavButton(direction="left", size_hint=(None, None))
-        self.left_nav.bind(on_release=self.previous_slide)
-        self.row.add_widget(self.left_nav)
-
-        self.content_holder = BoxLayout(orientation="horizontal", spacing=dp(20), size_hint=(None, None))
-        self.row.add_widget(self.content_holder)
-
-        self.right_nav = InstructionNavButton(direction="right", size_hint=(None, None))
-        self.right_nav.bind(on_release=self.next_slide)
-        self.row.add_widget(self.right_nav)
-
-        self.left_container = uni_centerBox(size_hint=(None, None))
-        self.left_container.content.padding = [dp(24), dp(24), dp(24), dp(24)]
-        self.left_container.content.spacing = dp(10)
-        self.content_holder.add_widget(self.left_container)
-        self.left_container.bind(size=self._schedule_resize)
-
-        self.left_content_anchor = AnchorLayout(anchor_x="left", anchor_y="top", size_hint=(1, 1))
-        self.left_content_box = BoxLayout(orientation="vertical", size_hint=(1, None), spacing=dp(10))
-        self.left_content_box.bind(minimum_height=self.left_content_box.setter("height"))
-
-        self.title_label = Label(
-            text="",
-            font_size="22sp",
-            bold=True,
-            color=(0, 0, 0, 1),
-            halign="left",
-            valign="top",
-            size_hint_y=None,
-            text_size=(0, 0),
-        )
-        self.body_label = Label(
-            text="",
-            font_size="18sp",
-            color=(0, 0, 0, 1),
-            halign="left",
-            valign="top",
-            size_hint_y=None,
-            text_size=(0, 0),
-            markup=True,
-        )
-        self._bind_label_wrapping(self.title_label)
-        self._bind_label_wrapping(self.body_label)
-
-        self.left_content_box.add_widget(self.title_label)
-        self.left_content_box.add_widget(self.body_label)
-        self.left_content_anchor.add_widget(self.left_content_box)
-        self.left_container.add_widget(self.left_content_anchor)
-
-        self.right_container = uni_centerBox(size_hint=(None, None))
-        self.right_container.content.padding = [dp(10), dp(10), dp(10), dp(10)]
-        self.right_container.content.spacing = dp(0)
-        self.content_holder.add_widget(self.right_container)
-        self.right_container.bind(size=self._schedule_resize)
-
-        self.right_display = RelativeLayout(size_hint=(1, 1))
-        self.right_container.add_widget(self.right_display)
-
-        self.image_widget = Image(
-            allow_stretch=True,
-            keep_ratio=True,
-            size_hint=(1, 1),
-            pos_hint={"x": 0, "y": 0},
-        )
-        self.placeholder_label = Label(
-            text="[Title]",
-            font_size="22sp",
-            color=(0, 0, 0, 0.7),
-            halign="center",
-            valign="middle",
-            size_hint=(1, 1),
-            text_size=(0, 0),
-        )
-        self.placeholder_label.bind(size=self._update_placeholder_text_size)
-
-        self.right_display.add_widget(self.image_widget)
-        self.right_display.add_widget(self.placeholder_label)
-
-        self.opacity = 0
-        self.wrapper.bind(size=self._schedule_resize)
-        Clock.schedule_once(lambda dt: self._resize_containers(), 0)
-        Clock.schedule_once(lambda dt: self._animate_in(), 0)
-
-        self._update_slide_content()
-        self._touch_start = None
-        self._touch_pos = None
-
-    def _bind_label_wrapping(self, label):
-        def update_text_size(*args):
-            label.text_size = (label.width, None)
-
-        def update_height(instance, texture_size):
-            instance.height = texture_size[1]
-
-        label.bind(size=update_text_size, texture_size=update_height)
-
-    def _update_placeholder_text_size(self, instance, size):
-        instance.text_size = size
-
-    def _update_backdrop(self, *args):
-        self.backdrop.pos = self.pos
-        self.backdrop.size = self.size
-        # maintain a soft, dialog-like dim
-        self.backdrop.radius = [0]
-
-    def set_instructions(self, instructions):
-        """Replace the current instruction list and reset to the first slide."""
-        self.instructions = instructions or []
-        self.current_index = 0
-        self._update_slide_content()
-
-    def next_slide(self, *args):
-        if not self.instructions or self._is_animating:
-            return
-        if self.current_index < len(self.instructions) - 1:
-            self._animate_slide_change(self.current_index + 1)
-
-    def previous_slide(self, *args):
-        if not self.instructions or self._is_animating:
-            return
-        if self.current_index > 0:
-            self._animate_slide_change(self.current_index - 1)
-
-    def _update_slide_content(self):
-        if not self.instructions:
-            self.title_label.text = ""
-            self.body_label.text = ""
-            self.image_widget.source = ""
-            self.image_widget.opacity = 0
-            self.placeholder_label.opacity = 1
-            self.placeholder_label.text = "[Title]"
-            self.left_nav.disabled = True
-            self.right_nav.disabled = True
-            return
-
-        slide = self.instructions[self.current_index]
-        self.title_label.text = slide.title
-        self.body_label.text = slide.body
-
-        if slide.image:
-            self.image_widget.source = slide.image
-            self.image_widget.opacity = 1
-            self.placeholder_label.opacity = 0
-        else:
-            self.image_widget.source = ""
-            self.image_widget.opacity = 0
-            self.placeholder_label.text = slide.title or "[Title]"
-            self.placeholder_label.opacity = 1
-
-        self.left_nav.disabled = self.current_index == 0
-        self.right_nav.disabled = self.current_index >= len(self.instructions) - 1
-
-    def _animate_slide_change(self, target_index):
-        if target_index == self.current_index:
-            return
-        self._is_animating = True
-
-        def _apply_update(*_):
-            self.current_index = target_index
-            self._update_slide_content()
-            fade_in = Animation(opacity=1, d=0.1, t="out_quad")
-            fade_in.start(self.left_content_box)
-            fade_in.start(self.right_display)
-            fade_in.bind(on_complete=lambda *_: setattr(self, "_is_animating", False))
-
-        fade_out = Animation(opacity=0, d=0.08, t="out_quad")
-        fade_out.bind(on_complete=_apply_update)
-        fade_out.start(self.left_content_box)
-        fade_out.start(self.right_display)
-
-    def close_overlay(self, *args):
-        self._animate_out()
-
-    def on_touch_down(self, touch):
-        """
-        Always consume touches so widgets behind the overlay are not interactive.
-        """
-        # Tap outside the content to dismiss, similar to confirmOverlay behavior.
-        if not self.row.collide_point(*touch.pos) and not self.close_btn.collide_point(*touch.pos):
-            self.close_overlay()
-            return True
-
-        # Let children (nav/buttons) handle it, but stop propagation to layers beneath.
-        if self.row.collide_point(*touch.pos):
-            self._touch_start = touch.pos
-            self._touch_pos = touch.pos
-        super().on_touch_down(touch)
-        return True
-
-    def on_touch_move(self, touch):
-        if self._touch_start:
-            self._touch_pos = touch.pos
-        return super().on_touch_move(touch)
-
-    def on_touch_up(self, touch):
-        if self._touch_start and self._touch_pos:
-            dx = self._touch_pos[0] - self._touch_start[0]
-            dy = self._touch_pos[1] - self._touch_start[1]
-            if abs(dx) > dp(60) and abs(dx) > abs(dy):
-                if dx < 0:
-                    self.next_slide()
-                else:
-                    self.previous_slide()
-        self._touch_start = None
-        self._touch_pos = None
-        return super().on_touch_up(touch)
-
-    # --- Layout helpers ---
-    def _schedule_resize(self, *args):
-        if self._resize_event is None:
-            self._resize_event = Clock.schedule_once(self._resize_containers, 0)
-
-    def _resize_containers(self, *args):
-        """
-        Keeps the left/right content containers square, constrained by the wrapper
-        height and available width between nav buttons. Debounced to avoid layout loops.
-        """
-        self._resize_event = None
-
-        available_width = max(
-            0,
-            self.wrapper.width
-            - self.left_nav.width
-            - self.right_nav.width
-            - self.row.spacing * 2,
-        )
-        square_size = min(available_width / 2.0, self.wrapper.height)
-        square_size = max(square_size, 0)
-
-        def _apply_size(widget, size):
-            if abs(widget.width - size) > 0.5 or abs(widget.height - size) > 0.5:
-                widget.size_hint = (None, None)
-                widget.width = size
-                widget.height = size
-
-        _apply_size(self.left_container, square_size)
-        _apply_size(self.right_container, square_size)
-
-        if abs(self.content_holder.height - square_size) > 0.5:
-            self.content_holder.size_hint = (None, None)
-            self.content_holder.height = square_size
-            self.content_holder.width = square_size * 2 + self.row.spacing
-
-        # Stretch nav arrows to match the square block height for visual alignment.
-        # Keep nav backgrounds consistent: fixed width, match content (left container) height, force redraw.
-        nav_height = self.left_container.height
-        nav_size = (dp(72), nav_height)
-
-        self.left_nav.size_hint = (None, None)
-        self.left_nav.size = nav_size
-        self.left_nav._update_graphics()
-
-        self.right_nav.size_hint = (None, None)
-        self.right_nav.size = nav_size
-        self.right_nav._update_graphics()
-
-        # Sync row and wrapper height to nav/content block height for vertical centering.
-        if abs(self.row.height - nav_height) > 0.5:
-            self.row.height = nav_height
-        if abs(self.wrapper.height - nav_height) > 0.5:
-            self.wrapper.height = nav_height
-
-        # Update the row width/height so AnchorLayout keeps it centered.
-        row_width = (
-            self.left_nav.width
-            + self.row.spacing
-            + self.content_holder.width
-            + self.row.spacing
-            + self.right_nav.width
-        )
-        if abs(self.row.width - row_width) > 0.5:
-            self.row.width = row_width
-        if abs(self.row.height - square_size) > 0.5:
-            self.row.height = square_size
-
-    # --- Animations ---
-    def _animate_in(self):
-        # Backdrop fade-in
-        Animation.cancel_all(self, "opacity")
-        Animation.cancel_all(self.wrapper, "opacity", "y")
-        target_y = self.wrapper.y
-        self.wrapper.y = target_y - dp(24)
-        self.opacity = 0
-        self.wrapper.opacity = 0
-
-        fade_in = Animation(opacity=1, d=0.18, t="out_quad")
-        rise_in = Animation(opacity=1, y=target_y, d=0.2, t="out_quad")
-        fade_bg = Animation(rgba=(0, 0, 0, 0.6), d=0.18, t="out_quad")
-
-        fade_in.start(self)
-        rise_in.start(self.wrapper)
-        fade_bg.start(self.backdrop_color)
-
-    def _animate_out(self):
-        def _finish(*_):
-            if callable(self.on_close):
-                self.on_close()
-            if self.parent:
-                self.parent.remove_widget(self)
-
-        Animation.cancel_all(self, "opacity")
-        Animation.cancel_all(self.wrapper, "opacity", "y")
-        fade_out = Animation(opacity=0, d=0.15, t="out_quad")
-        drop_out = Animation(opacity=0, y=self.wrapper.y - dp(20), d=0.15, t="out_quad")
-        fade_bg = Animation(rgba=(0, 0, 0, 0.0), d=0.15, t="out_quad")
-
-        fade_out.bind(on_complete=_finish)
-        fade_out.start(self)
-        drop_out.start(self.wrapper)
-        fade_bg.start(self.backdrop_color)
-
-
 class RoundedLabelBox(BoxLayout):
     """A pill-shaped background box for date and time."""
 
@@ -1743,7 +762,7 @@ class RoundedLabelBox(BoxLayout):
         self.bg.size = self.size
 
 
-class uni_lowerContainer(BoxLayout):
+class uni_lowerContainer(DeferredGraphicsMixin, BoxLayout):
     def __init__(self, left_text=None, right_text=None, **kwargs):
         kwargs.setdefault("size_hint_x", 1)
         kwargs.setdefault("size_hint_y", None)
@@ -1770,12 +789,11 @@ class uni_lowerContainer(BoxLayout):
 
         with self.left_box.canvas.before:
             self.left_shadow_color = Color(0, 0, 0, 0.1)
-            self.left_shadow = BoxShadow(
+            self.left_shadow = ShadowBox(
                 pos=self.left_box.pos,
                 size=self.left_box.size,
                 offset=(0, -2),
                 blur_radius=dp(16),
-                spread=dp(8),
                 border_radius=(0, 16, 0, 0),
             )
 
@@ -1786,13 +804,7 @@ class uni_lowerContainer(BoxLayout):
                 radius=[0, 16, 0, 0],
             )
 
-        def update_left_box_graphics(*args):
-            self.left_shadow.pos = self.left_box.pos
-            self.left_shadow.size = self.left_box.size
-            self.left_bg.pos = self.left_box.pos
-            self.left_bg.size = self.left_box.size
-
-        self.left_box.bind(pos=update_left_box_graphics, size=update_left_box_graphics)
+        self.left_box.bind(pos=self.mark_graphics_dirty, size=self.mark_graphics_dirty)
         self.left_frame.add_widget(self.left_box)
 
         self.left_box.bind(children=lambda *args: self.update_left_width(), size=lambda *args: self.update_left_width())
@@ -1842,13 +854,19 @@ class uni_lowerContainer(BoxLayout):
         self.add_widget(center)
         self.add_widget(self.right_frame)
 
-        Clock.schedule_interval(self.update_clock, 1)
+        # Shared 1 Hz tick; the strings are formatted once for every footer.
+        self._clock_event = clock_service.subscribe(self.update_clock, TIER_1HZ)
         self.update_clock(0)
 
+    def update_graphics(self, *args):
+        self.left_shadow.pos = self.left_box.pos
+        self.left_shadow.size = self.left_box.size
+        self.left_bg.pos = self.left_box.pos
+        self.left_bg.size = self.left_box.size
+
     def update_clock(self, dt):
-        now = datetime.now()
-        self.date_box.set_text(now.strftime("%b %d, %Y"))
-        self.time_box.set_text(now.strftime("%I:%M %p"))
+        self.date_box.set_text(clock_service.strftime("%b %d, %Y"))
+        self.time_box.set_text(clock_service.strftime("%I:%M %p"))
 
     def update_left_width(self, *args):
         total_width = 0
@@ -1867,7 +885,7 @@ class uni_lowerContainer(BoxLayout):
         self.right_box.width = total_width
 
 
-class uni_upperContainer(RelativeLayout):
+class uni_upperContainer(DeferredGraphicsMixin, RelativeLayout):
     def __init__(self, title="New_Test_Name", **kwargs):
         if "size_hint" not in kwargs:
             kwargs.setdefault("size_hint_x", 1)
@@ -1882,7 +900,7 @@ class uni_upperContainer(RelativeLayout):
             Color(1, 1, 1, 1)
             self.bg = RoundedRectangle(radius=[dp(20)])
 
-        self.bind(pos=self._update_bg, size=self._update_bg)
+        self.bind(size=self.mark_graphics_dirty)
 
         row = BoxLayout(
             orientation="horizontal",
@@ -1907,7 +925,7 @@ class uni_upperContainer(RelativeLayout):
             Color(0.95, 0.95, 1, 1)
             self.title_bg = RoundedRectangle(radius=[dp(30)])
 
-        self.title_container.bind(pos=self._update_title_bg, size=self._update_title_bg)
+        self.title_container.bind(size=self.mark_graphics_dirty)
 
         self.title_label = Label(
             text=title,
@@ -1919,10 +937,6 @@ class uni_upperContainer(RelativeLayout):
             text_size=(None, None),
         )
 
-        def update_title_text_size(instance, value):
-            self.title_label.text_size = (self.title_container.width, self.title_container.height)
-
-        self.title_container.bind(size=update_title_text_size, width=update_title_text_size, height=update_title_text_size)
         self.title_container.add_widget(self.title_label)
 
         self.right_slot = BoxLayout(
@@ -1930,21 +944,66 @@ class uni_upperContainer(RelativeLayout):
         )
         row.add_widget(self.right_slot)
 
-    def _update_bg(self, *args):
+    def on_touch_down(self, touch):
+        # Hidden gesture: triple-tap the title to toggle the frame profiler overlay.
+        if touch.is_triple_tap and self.title_container.collide_point(*self.to_local(*touch.pos)):
+            from frameProfiler import toggle_profiler_overlay
+
+            toggle_profiler_overlay()
+            return True
+        return super().on_touch_down(touch)
+
+    def update_graphics(self, *args):
+        # Both backgrounds are drawn in their RelativeLayout's local coordinates.
         self.bg.pos = (0, 0)
         self.bg.size = self.size
-
-    def _update_title_bg(self, *args):
         self.title_bg.pos = (0, 0)
         self.title_bg.size = self.title_container.size
+        self.title_label.text_size = self.title_container.size
 
 
 class LoadingBar(RelativeLayout):
-    def __init__(self, total_time, **kwargs):
+    """
+    Horizontal progress bar with a "Time Remaining" label.
+
+    Modes:
+        "monotonic" (default) - progress is read from a monotonic start
+            timestamp, so late or dropped ticks never make the bar drift.
+            The fill is interpolated on the frame tier, which is paused with
+            the rest of the screen's UI ticks while the screen is hidden.
+        "tick" - legacy behaviour, `elapsed` advances once per 1 Hz tick.
+
+    `progress_source` is an optional callable returning the elapsed seconds;
+    it replaces the built-in start timestamp. `engine` (a runEngine.RunEngine)
+    sets both it and `total_time`, and stops the bar when the run is paused,
+    aborted or completed. `time_source` returns the current time in seconds
+    (default `virtual_clock.now`, so accelerated runs fill faster).
+
+    Label text is only re-rendered when the shown second or percent changes.
+    """
+
+    def __init__(self, total_time=None, mode="monotonic", progress_source=None, time_source=None, engine=None, **kwargs):
         super().__init__(**kwargs)
 
+        if mode not in ("monotonic", "tick"):
+            raise ValueError(f"Unknown LoadingBar mode: {mode!r}")
+        if engine is not None:
+            total_time = engine.protocol.duration
+        elif total_time is None:
+            raise ValueError("LoadingBar needs a total_time or an engine")
+
         self.total_time = total_time
+        self.engine = None
         self.elapsed = 0
+        self.mode = mode
+        self.progress_source = progress_source
+        self.time_source = time_source or virtual_clock.now
+        self.started_at = self.time_source()
+
+        self._shown_percent = None
+        self._shown_remaining = None
+        self._bar_width = 0
+        self._bar_height = 0
 
         self.size_hint_x = 1
         self.size_hint_y = None
@@ -1995,7 +1054,48 @@ class LoadingBar(RelativeLayout):
         self.bind(pos=self._update_graphics)
         self.bind(size=self._update_graphics)
 
-        self._event = Clock.schedule_interval(self.update_progress, 1)
+        self._event = None
+        self._subscribe()
+        self._update_labels()
+        if engine is not None:
+            self.follow_engine(engine)
+
+    def _subscribe(self):
+        if self._event is None or not self._event.active:
+            tier = TIER_1HZ if self.mode == "tick" else TIER_FRAME
+            self._event = clock_service.subscribe(self.update_progress, tier)
+
+    def start(self):
+        """Restart the bar from zero at the current time."""
+        self.started_at = self.time_source()
+        self.elapsed = 0
+        self._subscribe()
+        self.update_progress(0)
+
+    def follow_engine(self, engine):
+        """Show `engine`'s run instead of the bar's own timer."""
+        from runEngine import EVENT_STATE
+
+        self.engine = engine
+        self.total_time = engine.protocol.duration
+        self.progress_source = lambda: engine.elapsed
+        self._engine_observer = engine.add_observer(self._on_run_event, kinds=(EVENT_STATE,))
+
+    def _on_run_event(self, event):
+        from runEngine import ABORTED, RUNNING
+
+        if event.state == RUNNING:
+            self._shown_remaining = None
+            self._subscribe()
+            return
+        # Paused or finished: draw the final position once, then stop ticking.
+        self._event.cancel()
+        self.elapsed = max(0, min(self.progress_source(), self.total_time))
+        self._update_fill()
+        self._update_labels()
+        if event.state == ABORTED:
+            self._shown_remaining = None
+            self.time_label.text = "Test Aborted"
 
     def _update_graphics(self, *args):
         bar_y = 0
@@ -2004,12 +1104,14 @@ class LoadingBar(RelativeLayout):
         bar_width = min(self.bar_max_width, self.width * 0.9)
         bar_x = (self.width - bar_width) / 2
 
+        self._bar_width = bar_width
+        self._bar_height = bar_height
+
         self.bg_rect.pos = (bar_x, bar_y)
         self.bg_rect.size = (bar_width, bar_height)
 
-        progress_width = (self.elapsed / self.total_time) * bar_width
         self.fg_rect.pos = (bar_x, bar_y)
-        self.fg_rect.size = (progress_width, bar_height)
+        self._update_fill()
 
         self.percent_label.pos = (bar_x, bar_y)
         self.percent_label.size = (bar_width, bar_height)
@@ -2019,24 +1121,180 @@ class LoadingBar(RelativeLayout):
         self.time_label.size = (self.width, dp(40))
         self.time_label.text_size = (self.width, dp(40))
 
+    def _update_fill(self):
+        progress_width = (self.elapsed / self.total_time) * self._bar_width
+        if self.fg_rect.size[0] != progress_width or self.fg_rect.size[1] != self._bar_height:
+            self.fg_rect.size = (progress_width, self._bar_height)
+
+    def _update_labels(self):
+        percentage = min(int(self.elapsed / self.total_time * 100), 100)
+        if percentage != self._shown_percent:
+            self._shown_percent = percentage
+            self.percent_label.text = f"{percentage}%"
+
+        # Count down in whole seconds; the label flips once a second has fully elapsed.
+        remaining = max(0, math.ceil(self.total_time - self.elapsed))
+        if remaining != self._shown_remaining:
+            self._shown_remaining = remaining
+            mm = remaining // 60
+            ss = remaining % 60
+            self.time_label.text = f"Time Remaining: {mm:02d}:{ss:02d}"
+
     def update_progress(self, dt):
-        if self.elapsed < self.total_time:
-            self.elapsed += 1
+        if self.mode == "tick":
+            if self.elapsed < self.total_time:
+                # dt is larger than one tick when resuming from a paused screen
+                self.elapsed += max(1, int(round(dt)))
+        elif self.get_root_window() is None:
+            # Detached (e.g. screen removed from the manager): nothing to draw.
+            return
+        elif self.progress_source is not None:
+            self.elapsed = self.progress_source()
         else:
+            self.elapsed = self.time_source() - self.started_at
+
+        self.elapsed = max(0, min(self.elapsed, self.total_time))
+        if self.elapsed >= self.total_time:
+            # Full: stop ticking; start() or a resumed engine run subscribes again.
             self._event.cancel()
 
-        self.elapsed = min(self.elapsed, self.total_time)
-        progress_ratio = self.elapsed / self.total_time
+        self._update_fill()
+        self._update_labels()
+
+
+class ProgressRing(Widget):
+    """
+    Circular progress indicator drawn in retained mode.
+
+    All canvas instructions are created once; progress, resize and stage
+    changes only mutate `angle_end`, positions and colors. `progress` (0-1) is
+    the target value and the fill eases towards it at display rate.
+    """
+
+    progress = NumericProperty(0)
+    display_progress = NumericProperty(0)
+    stages = ListProperty([])
+    current_stage = NumericProperty(0)
+    animation_duration = NumericProperty(0.35)
+    ring_inset = NumericProperty(20)
+
+    track_color = ListProperty([0.9, 0.9, 0.9, 1])
+    fill_color = ListProperty([0.3, 0.5, 0.9, 1])
+    border_color = ListProperty([0, 0, 0, 1])
+    stage_colors = ListProperty([[0.86, 0.86, 0.86, 1], [0.92, 0.92, 0.92, 1]])
+    active_stage_color = ListProperty([0.78, 0.84, 0.96, 1])
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self._stage_segments = []
+
+        with self.canvas:
+            self.track_color_instruction = Color(*self.track_color)
+            self.track = Ellipse(pos=self.pos, size=(0, 0))
+
+            self.stage_group = InstructionGroup()
+
+            self.fill_color_instruction = Color(*self.fill_color)
+            self.fill = Ellipse(pos=self.pos, size=(0, 0), angle_start=0, angle_end=0)
 
-        percentage = min(int(progress_ratio * 100), 100)
-        self.percent_label.text = f"{percentage}%"
+            self.border_color_instruction = Color(*self.border_color)
+            self.border = Line(circle=(0, 0, 0), width=2)
 
-        remaining = max(0, self.total_time - self.elapsed)
-        mm = remaining // 60
-        ss = remaining % 60
-        self.time_label.text = f"Time Remaining: {mm:02d}:{ss:02d}"
+        self._build_stage_segments()
+
+        self.bind(pos=self.update_canvas, size=self.update_canvas)
+        self.bind(stages=self._on_stages_changed, current_stage=self._refresh_stage_colors)
+        self.bind(
+            track_color=self._refresh_colors,
+            fill_color=self._refresh_colors,
+            border_color=self._refresh_colors,
+            stage_colors=self._refresh_stage_colors,
+            active_stage_color=self._refresh_stage_colors,
+        )
+        self.display_progress = self.progress
+        self.update_canvas()
+        self.engine = None
+
+    def follow_engine(self, engine):
+        """
+        Highlight `engine`'s current stage and fill with that stage's progress.
+        Uses the protocol's stage names unless `stages` is already set; a
+        trailing extra stage is highlighted once the run completes.
+        """
+        self.engine = engine
+        if not self.stages:
+            self.stages = engine.protocol.stage_names
+        self._engine_observer = engine.add_observer(self._on_run_event)
+
+    def _on_run_event(self, event):
+        from runEngine import COMPLETED
+
+        if event.state == COMPLETED:
+            self.current_stage = min(len(self.engine.protocol.stages), len(self.stages) - 1)
+            self.progress = 1
+        elif event.stage is not None:
+            self.current_stage = event.stage_index
+            self.progress = self.engine.stage_elapsed / event.stage.duration
+
+    def on_progress(self, instance, value):
+        Animation.cancel_all(self, "display_progress")
+        target = min(max(value, 0), 1)
+        if self.animation_duration <= 0 or target < self.display_progress:
+            # Resets (e.g. a new stage) jump instead of sweeping backwards.
+            self.display_progress = target
+        else:
+            Animation(display_progress=target, d=self.animation_duration, t="out_quad").start(self)
+
+    def on_display_progress(self, instance, value):
+        self.fill.angle_end = 360 * value
+
+    def update_canvas(self, *args):
+        radius = max(min(self.width, self.height) / 2 - self.ring_inset, 0)
+        pos = (self.center_x - radius, self.center_y - radius)
+        size = (radius * 2, radius * 2)
+
+        self.track.pos = pos
+        self.track.size = size
+        for _color, segment in self._stage_segments:
+            segment.pos = pos
+            segment.size = size
+        self.fill.pos = pos
+        self.fill.size = size
+        self.border.circle = (self.center_x, self.center_y, radius)
+
+    def _on_stages_changed(self, *args):
+        # Only rebuilt when the stage list itself changes, never per frame.
+        self._build_stage_segments()
+        self.update_canvas()
+
+    def _build_stage_segments(self):
+        self.stage_group.clear()
+        self._stage_segments = []
+        count = len(self.stages)
+        if count == 0:
+            return
+        span = 360 / count
+        for index in range(count):
+            color = Color()
+            segment = Ellipse(angle_start=index * span, angle_end=(index + 1) * span)
+            self.stage_group.add(color)
+            self.stage_group.add(segment)
+            self._stage_segments.append((color, segment))
+        self._refresh_stage_colors()
+
+    def _refresh_stage_colors(self, *args):
+        palette = self.stage_colors or [self.track_color]
+        for index, (color, _segment) in enumerate(self._stage_segments):
+            if index == self.current_stage:
+                color.rgba = self.active_stage_color
+            else:
+                color.rgba = palette[index % len(palette)]
 
-        self._update_graphics()
+    def _refresh_colors(self, *args):
+        self.track_color_instruction.rgba = self.track_color
+        self.fill_color_instruction.rgba = self.fill_color
+        self.border_color_instruction.rgba = self.border_color
 
 
 class genButton(MDButton):
@@ -2058,12 +1316,23 @@ class genButton(MDButton):
         self.bind(on_release=self.open_overlay)
         self.bind(children=lambda *_: self.update_size())
         self.update_size()
+
+        if on_confirm:
+            # Build the pooled dialogs while idle so the first tap opens in a single frame.
+            Clock.schedule_once(self._prewarm_dialogs, 1)
+
+    def _prewarm_dialogs(self, dt):
+        from mdDialogs import dialog_pool
+
+        dialog_pool.prewarm()
     
     def open_overlay(self, *args):
         if not self.on_confirm:
             return
             
         try:
+            from mdDialogs import confirmOverlay
+
             dialog = confirmOverlay(confirm_callback=self.on_confirm)
             dialog.open()
         except Exception as e:
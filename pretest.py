@@ -9,6 +9,7 @@ from kivymd.uix.label import MDLabel
 from kivymd.uix.button import MDButton, MDButtonText, MDButtonIcon
 from kivymd.uix.textfield import MDTextField, MDTextFieldLeadingIcon, MDTextFieldHintText
 
+from screenLifecycle import ScreenLifecycleMixin
 from mdWidgets import (
     StatusHeader,
     uni_centerBox,
@@ -18,8 +19,6 @@ from mdWidgets import (
     uni_homeButton,
     genButton,
     LoadingBar,
-    InstructionPanel,
-    MultiStepInstructionOverlay,
 )
 
 
@@ -40,7 +39,7 @@ def add_debug_outline(widget, color=(1, 0, 0, 1), line_width=1.5):
             width=line_width,
         )
 
-class pretest(MDScreen):
+class pretest(ScreenLifecycleMixin, MDScreen):
     def on_confirm(self):
         print("Confirmation accepted!")
 
@@ -183,28 +182,38 @@ class pretest(MDScreen):
         print(f"Starting test: {name}")
 
     def on_view_instructions(self, *args):
+        # Imported on demand so the overlay's KivyMD surface isn't paid at screen import
+        from mdInstructionOverlay import MultiStepInstructionOverlay
+
         slides = self._build_instruction_slides()
 
-        if getattr(self, "instruction_overlay", None) and self.instruction_overlay.parent:
-            self.remove_widget(self.instruction_overlay)
+        # Built once per screen and reopened afterwards; its textures stay cached.
+        overlay = getattr(self, "instruction_overlay", None)
+        if overlay is None:
+            self.instruction_overlay = MultiStepInstructionOverlay(
+                instructions=slides,
+                on_close=self._dismiss_instruction_overlay,
+            )
+            self.add_widget(self.instruction_overlay)
+            return
 
-        self.instruction_overlay = MultiStepInstructionOverlay(
-            instructions=slides,
-            on_close=self._dismiss_instruction_overlay,
-        )
-        self.add_widget(self.instruction_overlay)
+        overlay.set_instructions(slides)
+        overlay.show(self)
 
     # --- Instruction overlay helpers ---
     def _dismiss_instruction_overlay(self, *args):
-        if getattr(self, "instruction_overlay", None) and self.instruction_overlay.parent:
-            self.remove_widget(self.instruction_overlay)
-        self.instruction_overlay = None
+        # The overlay detaches itself; the instance is kept for the next open.
+        overlay = getattr(self, "instruction_overlay", None)
+        if overlay is not None and overlay.parent:
+            self.remove_widget(overlay)
 
     def _build_instruction_slides(self):
         """
         Returns the list of instruction panels shown in the multi-step overlay.
         Add/update steps here; image paths are optional.
         """
+        from mdInstructionOverlay import InstructionPanel
+
         return [
             InstructionPanel(
                 title="Introduction",
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+End-to-end assay run benchmark at accelerated time.
+
+Each run launches test_1124 in a fresh headless process with the simulated
+HAL and POCT_SPEED set, opens the test screen, and waits for the run engine
+to finish and the report screen to be shown. The following marks are
+recorded, in real ms since the run started:
+
+    completed     - RunEngine reached "completed"
+    report        - the report screen became current
+    aborted       - RunEngine reached "aborted" (with --abort-at)
+
+With --abort-at the run is aborted at that fraction of the protocol instead;
+the run passes when the engine ends "aborted", the heater is off and the
+report screen is never shown.
+
+Usage:
+    python runBenchmark.py                        # speeds 10, 100 and fast
+    python runBenchmark.py -n 3 fast              # one speed, three runs
+    python runBenchmark.py --abort-at 0.5 fast    # abort path
+    python runBenchmark.py -o bench/run           # writes bench/run.json
+
+Exits with code 1 if any run failed, so it doubles as a regression test.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+DEFAULT_SPEEDS = ["10", "100", "fast"]
+
+RESULT_PREFIX = "RUNBENCH "
+
+
+# ---------------------------------------------------------------------------
+# Child process: one run at the speed given by POCT_SPEED
+# ---------------------------------------------------------------------------
+def run_child(abort_at, timeout):
+    from kivy.clock import Clock
+
+    sys.path.insert(0, HERE)
+    os.chdir(HERE)
+    import test_1124
+    from heaterControl import get_heater_controller
+    from runEngine import ABORTED, COMPLETED, EVENT_STATE, RUNNING
+    from virtualClock import virtual_clock
+
+    result = {"speed": repr(virtual_clock), "marks": {}, "ok": False}
+    started = [None]
+
+    def mark(name):
+        result["marks"][name] = (time.perf_counter() - started[0]) * 1000.0
+
+    class BenchApp(test_1124.MyApp):
+        def on_start(self):
+            super().on_start()
+            self.root.bind(current=self._on_screen)
+            self.screen = self.root.get_screen("test")
+            self.engine = self.screen.engine
+            self.engine.add_observer(self._on_run_state, kinds=(EVENT_STATE,))
+            Clock.schedule_once(self._open_test, 0)
+            Clock.schedule_once(lambda dt: self._finish("timeout"), timeout)
+
+        def _open_test(self, dt):
+            self.root.current = "test"
+            if abort_at is not None:
+                Clock.schedule_interval(self._maybe_abort, 0)
+
+        def _maybe_abort(self, dt):
+            if self.engine.progress >= abort_at:
+                self.screen.on_confirm()
+                return False
+
+        def _on_run_state(self, event):
+            if event.state == RUNNING and started[0] is None:
+                started[0] = time.perf_counter()
+            elif event.state == COMPLETED:
+                mark("completed")
+                if abort_at is not None:
+                    self._finish("completed although an abort was requested")
+            elif event.state == ABORTED:
+                mark("aborted")
+                # Let a wrong hand-off show up before checking
+                Clock.schedule_once(lambda dt: self._check_abort(), 0.5)
+
+        def _on_screen(self, manager, current):
+            if current == "report" and started[0] is not None:
+                mark("report")
+                self._finish(None if abort_at is None else "report shown after abort")
+
+        def _check_abort(self):
+            heater = get_heater_controller()
+            if self.root.current == "report":
+                self._finish("report shown after abort")
+            elif heater.stage is not None:
+                self._finish(f"heater still following stage {heater.stage!r}")
+            else:
+                self._finish(None)
+
+        def _finish(self, error):
+            if "finished" in result:
+                return
+            result["finished"] = True
+            result["ok"] = error is None
+            result["error"] = error
+            result["virtual_elapsed"] = self.engine.elapsed
+            result["state"] = self.engine.state
+            self.stop()
+
+    BenchApp().run()
+    result.pop("finished", None)
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+# ---------------------------------------------------------------------------
+# Parent process: repeat per speed, report
+# ---------------------------------------------------------------------------
+def run_once(speed, abort_at, video_driver, timeout):
+    env = dict(os.environ)
+    env.setdefault("SDL_VIDEODRIVER", video_driver)
+    env["KIVY_NO_ARGS"] = "1"
+    env["KIVY_NO_CONSOLELOG"] = "1"
+    env["POCT_HAL"] = "sim"
+    env["POCT_SPEED"] = speed
+    command = [sys.executable, os.path.abspath(__file__), "--child", "--timeout", str(timeout)]
+    if abort_at is not None:
+        command += ["--abort-at", str(abort_at)]
+    proc = subprocess.run(command, cwd=HERE, env=env, capture_output=True, text=True, timeout=timeout + 60)
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    tail = "\n".join((proc.stderr or proc.stdout).splitlines()[-10:])
+    raise RuntimeError(f"speed {speed} exited with {proc.returncode} without a result:\n{tail}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the assay end to end at accelerated time.")
+    parser.add_argument("speeds", nargs="*", help="POCT_SPEED values: 1, 10, 100 or fast (default: %s)" % ", ".join(DEFAULT_SPEEDS))
+    parser.add_argument("-n", "--runs", type=int, default=1, help="runs per speed")
+    parser.add_argument("--abort-at", type=float, help="abort at this fraction of the protocol (0-1) instead of finishing")
+    parser.add_argument("-o", "--output", help="write a JSON report to OUTPUT.json")
+    parser.add_argument("--video-driver", default="offscreen", help="SDL_VIDEODRIVER for the child processes (offscreen or dummy)")
+    parser.add_argument("--timeout", type=float, default=120, help="seconds before a run is abandoned")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        run_child(args.abort_at, args.timeout)
+        return 0
+
+    results = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "abort_at": args.abort_at,
+        "speeds": {},
+    }
+    failed = False
+    for speed in args.speeds or DEFAULT_SPEEDS:
+        runs = []
+        for run in range(args.runs):
+            try:
+                outcome = run_once(speed, args.abort_at, args.video_driver, args.timeout)
+            except (RuntimeError, subprocess.TimeoutExpired) as e:
+                print(f"[Warning] speed {speed} run {run}: {e}")
+                failed = True
+                continue
+            runs.append(outcome)
+            if not outcome["ok"]:
+                print(f"[Warning] speed {speed} run {run}: {outcome['error']}")
+                failed = True
+        results["speeds"][speed] = runs
+
+        mark = "aborted" if args.abort_at is not None else "report"
+        times = [r["marks"][mark] for r in runs if r["ok"] and mark in r["marks"]]
+        if times:
+            print(f"{speed:>6s}  {mark} after median {statistics.median(times):9.1f} ms  (min {min(times):.1f}, max {max(times):.1f}, ok {len(times)}/{args.runs})")
+
+    if args.output:
+        out_dir = os.path.dirname(args.output)
+        if out_dir:
+            os.makedirs(out_dir, exist_ok=True)
+        with open(args.output + ".json", "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Report written to {args.output}.json")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
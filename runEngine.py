@@ -0,0 +1,390 @@
+"""
+Assay run engine.
+
+A run follows a `Protocol`: an ordered list of `Stage`s, each with a duration,
+an optional heater setpoint and an optional acquisition plan. `RunEngine` is
+the state machine that owns the run (idle -> running <-> paused -> completed
+or aborted); screens and widgets only observe it.
+
+    engine = RunEngine(ASSAY_PROTOCOL, heater=get_heater_controller())
+    engine.add_observer(self.on_run_event)      # RunEvent per state/stage/acquisition
+    engine.attach_clock()                       # advance on the shared 2 Hz tick
+    engine.start()
+
+    LoadingBar(engine=engine)                   # mdWidgets widgets follow an engine
+
+The engine never touches widgets, and only uses the Kivy clock after
+`attach_clock()`. `update()` advances it from `time_source`, so it also runs
+headless (`run_headless()`) and at any time scale.
+"""
+
+import bisect
+import time
+import weakref
+from collections import namedtuple
+from types import MethodType
+
+from clockService import TIER_2HZ, clock_service
+from heaterControl import SetpointProfile
+from virtualClock import virtual_clock
+
+# Run states
+IDLE = "idle"
+RUNNING = "running"
+PAUSED = "paused"
+COMPLETED = "completed"
+ABORTED = "aborted"
+FINISHED_STATES = (COMPLETED, ABORTED)
+
+# Event kinds
+EVENT_STATE = "state"          # the run changed state
+EVENT_STAGE = "stage"          # a stage was entered (data["time"]: its scheduled start)
+EVENT_ACQUIRE = "acquire"      # a capture in the stage's plan is due (data: time, kind, number)
+EVENT_PROGRESS = "progress"    # sent after every update() while running
+
+RunEvent = namedtuple("RunEvent", "kind state elapsed stage_index stage data")
+
+
+class AcquisitionPlan:
+    """
+    Capture `kind` every `interval` seconds of a stage, starting at `offset`
+    (default: one interval in, so the first capture follows a full interval).
+    """
+
+    def __init__(self, interval, kind="fluorescence", offset=None):
+        if interval <= 0:
+            raise ValueError("Acquisition interval must be positive")
+        self.interval = float(interval)
+        self.kind = kind
+        self.offset = self.interval if offset is None else float(offset)
+
+    def times(self, duration):
+        """Capture times within a stage of `duration` seconds."""
+        times = []
+        t = self.offset
+        while t <= duration + 1e-9:
+            times.append(t)
+            t += self.interval
+        return times
+
+
+class Stage:
+    """
+    One protocol step. `setpoint` is a temperature in °C, a
+    heaterControl.SetpointProfile, or None for heater off.
+    """
+
+    def __init__(self, name, duration, setpoint=None, acquisition=None):
+        if duration <= 0:
+            raise ValueError(f"Stage {name!r} needs a positive duration")
+        self.name = name
+        self.duration = float(duration)
+        self.setpoint = setpoint
+        self.acquisition = acquisition
+
+    def profile(self):
+        if self.setpoint is None or isinstance(self.setpoint, SetpointProfile):
+            return self.setpoint
+        return SetpointProfile.constant(self.setpoint)
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, {self.duration:g}s, setpoint={self.setpoint!r})"
+
+
+class Protocol:
+    def __init__(self, name, stages):
+        self.name = name
+        self.stages = list(stages)
+        if not self.stages:
+            raise ValueError(f"Protocol {name!r} has no stages")
+        self.starts = []
+        total = 0.0
+        for stage in self.stages:
+            self.starts.append(total)
+            total += stage.duration
+        self.duration = total
+
+        # (run time, stage index, kind, capture number within the stage), in time order
+        self.acquisitions = []
+        for index, (stage, start) in enumerate(zip(self.stages, self.starts)):
+            if stage.acquisition is not None:
+                for number, t in enumerate(stage.acquisition.times(stage.duration)):
+                    self.acquisitions.append((start + t, index, stage.acquisition.kind, number))
+
+    @property
+    def stage_names(self):
+        return [stage.name for stage in self.stages]
+
+    def stage_index_at(self, elapsed):
+        return max(0, min(bisect.bisect_right(self.starts, elapsed) - 1, len(self.stages) - 1))
+
+
+# Stages of the ProcessFlowWidget demo (10 s each).
+DEMO_PROTOCOL = Protocol(
+    "Demo",
+    [
+        Stage("Preheating", 10, setpoint=50.0),
+        Stage("Heating", 10, setpoint=95.0),
+        Stage("Holding", 10, setpoint=95.0),
+        Stage("Cooling", 10, setpoint=40.0),
+        Stage("PCR Cycling", 10, setpoint=SetpointProfile([(95.0, 15), (60.0, 30), (72.0, 30)], repeat=True),
+              acquisition=AcquisitionPlan(5)),
+    ],
+)
+
+# The full 5 minute assay run by the test screen.
+ASSAY_PROTOCOL = Protocol(
+    "Assay",
+    [
+        Stage("Preheating", 30, setpoint=50.0),
+        Stage("Heating", 60, setpoint=95.0),
+        Stage("Holding", 60, setpoint=95.0),
+        Stage("PCR Cycling", 120, setpoint=SetpointProfile([(95.0, 15), (60.0, 30), (72.0, 30)], repeat=True),
+              acquisition=AcquisitionPlan(15)),
+        Stage("Cooling", 30, setpoint=40.0),
+    ],
+)
+
+
+class _Observer:
+    def __init__(self, engine, callback, kinds):
+        self.engine = engine
+        self.kinds = kinds
+        if isinstance(callback, MethodType):
+            self._ref = weakref.WeakMethod(callback)
+        else:
+            self._ref = lambda: callback  # noqa: E731
+
+    def resolve(self):
+        return self._ref()
+
+    def cancel(self):
+        if self in self.engine._observers:
+            self.engine._observers.remove(self)
+
+
+class RunEngine:
+    """
+    Commands (`start`, `pause`, `resume`, `abort`) and `update()` are meant
+    to be called from one thread - the UI thread when `attach_clock()` is used.
+    Observers are called synchronously on that thread.
+    """
+
+    def __init__(self, protocol, heater=None, time_source=None):
+        self.protocol = protocol
+        self.heater = heater
+        self.time_source = time_source or virtual_clock.now
+        self.state = IDLE
+        self.stage_index = None
+        self.abort_reason = None
+        self.acquired = 0
+        self._next_acquisition = 0
+        self._elapsed_before = 0.0
+        self._resumed_at = None
+        self._observers = []
+        self._tick = None
+        self._drives_clock = False
+
+    # --- Observers ---
+    def add_observer(self, callback, kinds=None):
+        """
+        Call `callback(RunEvent)` for every event, or only for the event kinds
+        in `kinds`. Bound methods are held weakly. Returns a handle with
+        `cancel()`.
+        """
+        observer = _Observer(self, callback, tuple(kinds) if kinds else None)
+        self._observers.append(observer)
+        return observer
+
+    def _emit(self, kind, data=None):
+        stage = self.stage
+        event = RunEvent(kind, self.state, self.elapsed, self.stage_index, stage, data)
+        for observer in list(self._observers):
+            if observer.kinds is not None and kind not in observer.kinds:
+                continue
+            callback = observer.resolve()
+            if callback is None:
+                observer.cancel()
+                continue
+            callback(event)
+
+    # --- Derived state ---
+    @property
+    def elapsed(self):
+        """Run time in seconds, excluding pauses."""
+        if self._resumed_at is None:
+            return self._elapsed_before
+        return min(self.protocol.duration, self._elapsed_before + self.time_source() - self._resumed_at)
+
+    @property
+    def remaining(self):
+        return max(0.0, self.protocol.duration - self.elapsed)
+
+    @property
+    def progress(self):
+        return self.elapsed / self.protocol.duration
+
+    @property
+    def stage(self):
+        return None if self.stage_index is None else self.protocol.stages[self.stage_index]
+
+    @property
+    def stage_elapsed(self):
+        if self.stage_index is None:
+            return 0.0
+        return min(self.elapsed - self.protocol.starts[self.stage_index], self.stage.duration)
+
+    @property
+    def stage_remaining(self):
+        if self.stage_index is None:
+            return 0.0
+        return max(0.0, self.stage.duration - self.stage_elapsed)
+
+    @property
+    def finished(self):
+        return self.state in FINISHED_STATES
+
+    @property
+    def active(self):
+        return self.state in (RUNNING, PAUSED)
+
+    # --- Commands ---
+    def start(self):
+        """Start from the first stage. A finished run can be started again."""
+        if self.active:
+            raise RuntimeError(f"Cannot start a run that is {self.state}")
+        self.stage_index = None
+        self.abort_reason = None
+        self.acquired = 0
+        self._next_acquisition = 0
+        self._elapsed_before = 0.0
+        self._resumed_at = self.time_source()
+        self._set_state(RUNNING)
+        self._enter_stage(0)
+        self.update()
+
+    def pause(self):
+        """Freeze the run clock. The heater holds the setpoint it had when paused."""
+        if self.state != RUNNING:
+            return False
+        self._freeze()
+        if self.heater is not None:
+            self.heater.pause_profile()
+        self._set_state(PAUSED)
+        return True
+
+    def resume(self):
+        if self.state != PAUSED:
+            return False
+        self._resumed_at = self.time_source()
+        if self.heater is not None:
+            self.heater.resume_profile()
+        self._set_state(RUNNING)
+        return True
+
+    def abort(self, reason="user"):
+        """Stop the run and turn the heater off. Returns False if no run was active."""
+        if not self.active:
+            return False
+        self._freeze()
+        self.abort_reason = reason
+        self._heater_off()
+        self._set_state(ABORTED)
+        return True
+
+    # --- Advancing ---
+    def update(self):
+        """Catch up to `time_source()`: enter due stages, fire due acquisitions, finish."""
+        if self.state != RUNNING:
+            return
+        elapsed = self.elapsed
+        starts = self.protocol.starts
+        while self.stage_index + 1 < len(starts) and starts[self.stage_index + 1] <= elapsed:
+            # Captures at the very end of a stage belong to that stage.
+            self._fire_acquisitions(starts[self.stage_index + 1])
+            self._enter_stage(self.stage_index + 1)
+        self._fire_acquisitions(elapsed)
+
+        if elapsed >= self.protocol.duration:
+            self._freeze()
+            self._heater_off()
+            self._set_state(COMPLETED)
+        self._emit(EVENT_PROGRESS)
+
+    def attach_clock(self, tier=TIER_2HZ):
+        """
+        Advance on a clockService tier; keeps ticking while screens are hidden.
+        A FAST virtual_clock is advanced during frames while the run is running.
+        """
+        if not self._drives_clock:
+            self._drives_clock = True
+            virtual_clock.drive_while(self._needs_time)
+        self.detach_clock()
+        self._tick = clock_service.subscribe(self._on_tick, tier, ui=False)
+        return self._tick
+
+    def detach_clock(self):
+        if self._tick is not None:
+            self._tick.cancel()
+            self._tick = None
+
+    def _on_tick(self, dt):
+        self.update()
+
+    def _needs_time(self):
+        return self.state == RUNNING
+
+    def run_headless(self, step=0.05, sleep=None, timeout=None):
+        """
+        Start (if idle) and advance the run until it finishes, calling
+        `sleep(step)` between updates (default `virtual_clock.step`, which
+        advances a FAST clock). `timeout` is in real seconds. Returns the
+        final state.
+        """
+        sleep = sleep or virtual_clock.step
+        if not self.active:
+            self.start()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.finished:
+            if deadline is not None and time.monotonic() > deadline:
+                self.abort("timeout")
+                break
+            sleep(step)
+            self.update()
+        return self.state
+
+    # --- Internals ---
+    def _set_state(self, state):
+        self.state = state
+        self._emit(EVENT_STATE)
+
+    def _freeze(self):
+        self._elapsed_before = self.elapsed
+        self._resumed_at = None
+
+    def _enter_stage(self, index):
+        self.stage_index = index
+        stage = self.protocol.stages[index]
+        if self.heater is not None:
+            profile = stage.profile()
+            if profile is None:
+                self.heater.set_stage(None)
+            else:
+                # When update() catches up over several stages, this one started
+                # in the past. Assumes the heater shares this engine's time base
+                # (both default to virtual_clock.now).
+                late = self.elapsed - self.protocol.starts[index]
+                self.heater.set_stage(stage.name, profile, started_at=self.time_source() - late)
+        self._emit(EVENT_STAGE, {"time": self.protocol.starts[index]})
+
+    def _fire_acquisitions(self, until):
+        acquisitions = self.protocol.acquisitions
+        while self._next_acquisition < len(acquisitions) and acquisitions[self._next_acquisition][0] <= until:
+            at, index, kind, number = acquisitions[self._next_acquisition]
+            self._next_acquisition += 1
+            self.acquired += 1
+            self._emit(EVENT_ACQUIRE, {"time": at, "stage_index": index, "kind": kind, "number": number})
+
+    def _heater_off(self):
+        if self.heater is not None:
+            self.heater.set_stage(None)
@@ -0,0 +1,36 @@
+from clockService import clock_service
+
+
+class ScreenLifecycleMixin:
+    """
+    Mixin for MDScreen subclasses that pauses the screen's UI-only ticks while
+    it is not `manager.current`.
+
+    Footer clocks, loading bars and label refreshers subscribed through
+    `clock_service` are paused on `on_leave` and resumed on `on_enter`, where
+    each one is called once immediately to catch up from wall-clock time.
+    Subscriptions made with `ui=False` (data acquisition) keep running.
+
+    Put the mixin before MDScreen in the bases:
+
+        class pretest(ScreenLifecycleMixin, MDScreen):
+    """
+
+    def on_manager(self, instance, manager):
+        # Screens built while another one is showing start out paused.
+        if manager is not None and manager.current != self.name:
+            self.suspend_ui_timers()
+
+    def on_enter(self, *args):
+        self.resume_ui_timers()
+        return super().on_enter(*args)
+
+    def on_leave(self, *args):
+        self.suspend_ui_timers()
+        return super().on_leave(*args)
+
+    def suspend_ui_timers(self):
+        clock_service.pause_tree(self)
+
+    def resume_ui_timers(self):
+        clock_service.resume_tree(self)
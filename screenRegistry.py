@@ -0,0 +1,105 @@
+import importlib
+
+from kivy.clock import Clock
+from kivy.uix.screenmanager import ScreenManagerException
+
+from kivymd.uix.screenmanager import MDScreenManager
+
+from traceRecorder import tracer
+
+
+class LazyScreenManager(MDScreenManager):
+    """
+    Screen manager that builds screens on first use.
+
+    Screens are declared with `register(name, factory)` and only constructed
+    the first time they are requested through `current = name` or
+    `get_screen(name)`. `prebuild()` can warm up the remaining screens one per
+    idle frame once the first screen is on display.
+    """
+
+    def __init__(self, **kwargs):
+        self._factories = {}
+        self._prebuild_queue = []
+        self._prebuild_event = None
+        super().__init__(**kwargs)
+
+    def register(self, name, factory):
+        """
+        Declare a screen by name. `factory` is called with `name=name` and must
+        return the Screen instance. It can also be a "module:Class" string, so
+        the screen's module is only imported when the screen is built.
+        """
+        if name in self._factories or self._is_built(name):
+            raise ScreenManagerException('Screen "%s" is already registered.' % name)
+        self._factories[name] = factory
+
+    def is_built(self, name):
+        return self._is_built(name)
+
+    def _is_built(self, name):
+        return any(screen.name == name for screen in self.screens)
+
+    def build_screen(self, name):
+        """Construct a registered screen now (no-op if it already exists)."""
+        if self._is_built(name):
+            return super().get_screen(name)
+        factory = self._factories.get(name)
+        if factory is None:
+            raise ScreenManagerException('No Screen with name "%s".' % name)
+        with tracer.span(f"build screen {name}", "screen"):
+            if isinstance(factory, str):
+                module_name, _, attr = factory.partition(":")
+                factory = getattr(importlib.import_module(module_name), attr)
+            screen = factory(name=name)
+        if screen.name != name:
+            screen.name = name
+        del self._factories[name]
+        self.add_widget(screen)
+        return screen
+
+    def get_screen(self, name):
+        if name in self._factories:
+            return self.build_screen(name)
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+    @property
+    def registered_names(self):
+        return [screen.name for screen in self.screens] + list(self._factories)
+
+    # --- Idle prebuild ---
+    def prebuild(self, names=None, delay=0):
+        """
+        Build pending screens in the background, one per frame, so the first
+        visit to each screen does not pay its construction cost.
+        `names` defaults to every registered screen that is not built yet.
+        """
+        pending = list(self._factories) if names is None else list(names)
+        for name in pending:
+            if name in self._factories and name not in self._prebuild_queue:
+                self._prebuild_queue.append(name)
+        if self._prebuild_queue and self._prebuild_event is None:
+            self._prebuild_event = Clock.schedule_once(self._prebuild_next, delay)
+
+    def cancel_prebuild(self):
+        self._prebuild_queue = []
+        if self._prebuild_event is not None:
+            self._prebuild_event.cancel()
+            self._prebuild_event = None
+
+    def _prebuild_next(self, *args):
+        self._prebuild_event = None
+        while self._prebuild_queue:
+            name = self._prebuild_queue.pop(0)
+            if name in self._factories:
+                try:
+                    self.build_screen(name)
+                except Exception as e:
+                    print(f"[Warning] Prebuild of screen '{name}' failed: {e}")
+                break
+        if self._prebuild_queue:
+            # Yield back to the main loop so each build lands in its own frame.
+            self._prebuild_event = Clock.schedule_once(self._prebuild_next, 0)
@@ -0,0 +1,164 @@
+"""
+Texture cache for soft box shadows.
+
+A BoxShadow is re-evaluated by its shader over the whole blurred area on
+every frame and re-set up whenever the widget resizes. Most shadows in the
+app share a handful of parameter sets, so `ShadowCache` renders each distinct
+(border radius, blur, spread, inset) shadow once into a small texture with an
+Fbo, and `ShadowBox` draws it as a nine-patch (BorderImage) stretched to the
+widget. The corners keep their exact blur; only the flat middle band is
+stretched.
+
+`ShadowBox` takes the same arguments as BoxShadow and exposes `pos`/`size`,
+so it can replace one inside a `with canvas:` block:
+
+    with self.canvas.before:
+        Color(0, 0, 0, 0.10)
+        self.shadow = ShadowBox(pos=self.pos, size=self.size, blur_radius=dp(16),
+                                border_radius=(20, 20, 20, 20))
+"""
+
+import math
+
+from kivy.graphics import BorderImage, BoxShadow, Callback, ClearBuffers, ClearColor, Color, Fbo
+from kivy.graphics.opengl import (
+    GL_ONE,
+    GL_ONE_MINUS_SRC_ALPHA,
+    GL_SRC_ALPHA,
+    glBlendFuncSeparate,
+)
+
+
+class ShadowTexture:
+    """One rendered shadow: the texture, its transparent margin and nine-patch border."""
+
+    def __init__(self, fbo, margin, border):
+        # The Fbo is kept so the texture can be restored after a GL context reload.
+        self.fbo = fbo
+        self.texture = fbo.texture
+        self.margin = margin
+        self.border = border
+
+
+class ShadowCache:
+    def __init__(self):
+        self._entries = {}
+        self.renders = 0
+
+    def key_for(self, border_radius, blur_radius, spread_radius=0, inset=False):
+        # "+ 0.0" folds -0.0 into 0.0 so equal shadows share a key.
+        radii = tuple(round(float(r), 1) + 0.0 for r in border_radius)
+        return (radii, round(float(blur_radius), 1) + 0.0, round(float(spread_radius), 1) + 0.0, bool(inset))
+
+    def get(self, border_radius=(0, 0, 0, 0), blur_radius=0, spread_radius=0, inset=False):
+        key = self.key_for(border_radius, blur_radius, spread_radius, inset)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._render(*key)
+            self._entries[key] = entry
+        return entry
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _render(self, border_radius, blur_radius, spread_radius, inset):
+        self.renders += 1
+        # Distance from the box edge over which the shadow still varies.
+        falloff = max(border_radius) + blur_radius + abs(spread_radius)
+        margin = 0 if inset else math.ceil(blur_radius + max(spread_radius, 0)) + 2
+        # Box large enough that its middle band is flat, plus a 2px band to stretch.
+        core = 2 * math.ceil(falloff) + 4
+        tex_size = core + 2 * margin
+
+        fbo = Fbo(size=(tex_size, tex_size))
+        with fbo:
+            # White with straight alpha, so the Color before the ShadowBox tints it.
+            ClearColor(1, 1, 1, 0)
+            ClearBuffers()
+            Callback(_straight_alpha_blend)
+            Color(1, 1, 1, 1)
+            BoxShadow(
+                pos=(margin, margin),
+                size=(core, core),
+                offset=(0, 0),
+                blur_radius=blur_radius,
+                spread_radius=(spread_radius, spread_radius),
+                border_radius=border_radius,
+                inset=inset,
+            )
+            Callback(_default_blend)
+        fbo.draw()
+
+        border = margin + math.ceil(falloff) + 1
+        return ShadowTexture(fbo, margin, border)
+
+
+def _straight_alpha_blend(instr):
+    glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE_MINUS_SRC_ALPHA)
+
+
+def _default_blend(instr):
+    # Kivy's own blend state. A plain glBlendFunc would also change how alpha
+    # accumulates in every later Fbo (e.g. other BoxShadows' textures).
+    glBlendFuncSeparate(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA, GL_ONE, GL_ONE)
+
+
+shadow_cache = ShadowCache()
+
+
+class ShadowBox:
+    """
+    Cached stand-in for BoxShadow. `pos`/`size` are the box casting the
+    shadow (as with BoxShadow); the nine-patch is placed around it.
+    """
+
+    def __init__(
+        self,
+        pos=(0, 0),
+        size=(100, 100),
+        offset=(0, 0),
+        blur_radius=0,
+        spread_radius=0,
+        border_radius=(0, 0, 0, 0),
+        inset=False,
+    ):
+        self.offset = tuple(offset)
+        self.inset = inset
+        self.entry = shadow_cache.get(border_radius, blur_radius, spread_radius, inset)
+        self._pos = tuple(pos)
+        self._size = tuple(size)
+        self.image = BorderImage(
+            texture=self.entry.texture,
+            border=(self.entry.border,) * 4,
+            auto_scale="both_lower",
+        )
+        self._place()
+
+    @property
+    def pos(self):
+        return self._pos
+
+    @pos.setter
+    def pos(self, value):
+        self._pos = tuple(value)
+        self._place()
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        self._size = tuple(value)
+        self._place()
+
+    def _place(self):
+        margin = self.entry.margin
+        x, y = self._pos
+        w, h = self._size
+        if self.inset:
+            self.image.pos = (x, y)
+            self.image.size = (w, h)
+        else:
+            self.image.pos = (x - margin + self.offset[0], y - margin + self.offset[1])
+            self.image.size = (w + 2 * margin, h + 2 * margin)
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+Headless check that cached shadows (shadowCache.ShadowBox) look like the
+BoxShadow they replace.
+
+Each case is drawn twice into an offscreen Fbo over white, once with
+BoxShadow and once with ShadowBox, and the pixels are compared:
+
+    usercard-<level>  - lockScreen.UserCard built on its own, at each MDCard
+                        elevation level (the parameters are read from the card
+                        after it swapped in its cached shadow)
+    lock-inset        - LockScreen.add_inner_shadow on a plain widget
+    center-box        - mdWidgets.uni_centerBox's outer shadow
+
+Usage:
+    python shadowCheck.py
+    python shadowCheck.py --tolerance 12 --alpha 1
+
+Outer shadows are only compared outside the box, where they are visible.
+Exits with code 1 if any case differs by more than --tolerance (0-255) in
+any channel, so it doubles as a regression test.
+"""
+
+import os
+import sys
+
+if __name__ == "__main__":
+    # Headless by default; the CLI has its own arguments.
+    os.environ.setdefault("SDL_VIDEODRIVER", "offscreen")
+    os.environ.setdefault("KIVY_NO_ARGS", "1")
+
+from kivy.clock import Clock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Box drawn in each case, inside a canvas large enough for the blur.
+BOX_SIZE = (220, 160)
+CANVAS_SIZE = (320, 260)
+
+
+def _render(draw):
+    """RGBA pixels (numpy, int) of `draw()` over white in an offscreen Fbo."""
+    import numpy as np
+    from kivy.graphics import ClearBuffers, ClearColor, Fbo
+
+    fbo = Fbo(size=CANVAS_SIZE)
+    with fbo:
+        ClearColor(1, 1, 1, 1)
+        ClearBuffers()
+        draw()
+    fbo.draw()
+    return np.frombuffer(fbo.pixels, dtype=np.uint8).reshape(CANVAS_SIZE[1], CANVAS_SIZE[0], 4).astype(int)
+
+
+def compare(params, alpha):
+    """(max, mean) per-channel difference between BoxShadow and ShadowBox for `params`."""
+    from kivy.graphics import BoxShadow, Color
+
+    from shadowCache import ShadowBox
+
+    pos = ((CANVAS_SIZE[0] - BOX_SIZE[0]) / 2, (CANVAS_SIZE[1] - BOX_SIZE[1]) / 2)
+    spread = params.get("spread_radius", 0)
+
+    def reference():
+        Color(0, 0, 0, alpha)
+        BoxShadow(pos=pos, size=BOX_SIZE, spread_radius=(spread, spread), **{
+            k: v for k, v in params.items() if k != "spread_radius"
+        })
+
+    def cached():
+        Color(0, 0, 0, alpha)
+        ShadowBox(pos=pos, size=BOX_SIZE, **params)
+
+    # RGB only: the Fbo's alpha channel never reaches the screen.
+    diff = abs(_render(reference) - _render(cached))[:, :, :3]
+    if not params.get("inset"):
+        # An outer shadow is drawn under its widget; only the part outside the box shows.
+        diff = diff[~_box_mask(pos, BOX_SIZE, params.get("border_radius", (0, 0, 0, 0)))]
+    return int(diff.max()), float(diff.mean())
+
+
+def _box_mask(pos, size, border_radius):
+    """Pixels (by pixel center) inside the rounded box at `pos`/`size`."""
+    import numpy as np
+
+    ys, xs = np.mgrid[0:CANVAS_SIZE[1], 0:CANVAS_SIZE[0]] + 0.5
+    radius = max(border_radius)
+    half = np.array(size) / 2.0
+    center = np.array(pos) + half
+    # Rounded-box signed distance, as in BoxShadow's shader (one radius for all corners).
+    qx = abs(xs - center[0]) - half[0] + radius
+    qy = abs(ys - center[1]) - half[1] + radius
+    outside = np.hypot(np.maximum(qx, 0), np.maximum(qy, 0)) + np.minimum(np.maximum(qx, qy), 0) - radius
+    return outside <= 0
+
+
+def collect_cases():
+    """(name, ShadowBox/BoxShadow keyword arguments) for every shadow checked."""
+    from kivy.metrics import dp
+    from kivy.uix.widget import Widget
+
+    import shadowCache
+    from lockScreen import LockScreen, UserCard
+    from mdWidgets import uni_centerBox
+
+    cases = []
+    created = []
+    original = shadowCache.ShadowBox
+
+    class RecordingShadowBox(original):
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            created.append(kwargs)
+
+    # Record the arguments the app code passes, without changing what it draws.
+    shadowCache.ShadowBox = RecordingShadowBox
+    import lockScreen
+    import mdWidgets
+
+    saved = lockScreen.ShadowBox, mdWidgets.ShadowBox
+    lockScreen.ShadowBox = mdWidgets.ShadowBox = RecordingShadowBox
+    try:
+        LockScreen.add_inner_shadow(None, Widget(size=BOX_SIZE))
+        cases.append(("lock-inset", _shadow_args(created[-1])))
+        uni_centerBox()
+        cases.append(("center-box", _shadow_args(created[-1])))
+    finally:
+        shadowCache.ShadowBox = original
+        lockScreen.ShadowBox, mdWidgets.ShadowBox = saved
+
+    card = UserCard(0, None, None, None, style="elevated", size_hint=(None, None), size=BOX_SIZE, radius=[dp(16)] * 4)
+    return cases, card
+
+
+def _shadow_args(kwargs):
+    return {k: v for k, v in kwargs.items() if k not in ("pos", "size")}
+
+
+def _card_args(card):
+    shadow = card._box_shadow
+    return {
+        "offset": tuple(shadow.offset),
+        "blur_radius": shadow.blur_radius,
+        "spread_radius": shadow.spread_radius[0],
+        "border_radius": tuple(shadow.border_radius),
+    }
+
+
+def check_shadows(tolerance, alpha, levels):
+    sys.path.insert(0, HERE)
+    os.chdir(HERE)
+    from kivymd.app import MDApp
+    from kivymd.uix.screen import MDScreen
+
+    results = []
+
+    class CheckApp(MDApp):
+        def build(self):
+            return MDScreen()
+
+        def on_start(self):
+            self._cases, self._card = collect_cases()
+            self.root.add_widget(self._card)
+            self._levels = list(levels)
+            # UserCard swaps in its cached shadow on the frame after it is built.
+            Clock.schedule_once(self._next_level, 0.2)
+
+        def _next_level(self, dt):
+            if not hasattr(self._card, "_box_shadow"):
+                self._finish("UserCard did not swap in a cached shadow")
+                return
+            if self._levels:
+                level = self._levels.pop(0)
+                self._card.elevation_level = level
+                Clock.schedule_once(lambda dt: self._record_level(level), 0.1)
+                return
+            self._finish(None)
+
+        def _record_level(self, level):
+            args = _card_args(self._card)
+            if self._card._shadow_key != (
+                args["offset"], args["blur_radius"], args["spread_radius"], args["border_radius"]
+            ):
+                results.append({"name": f"usercard-{level}", "errors": ["cached shadow not rebuilt for the new elevation"]})
+            self._cases.append((f"usercard-{level}", args))
+            self._next_level(0)
+
+        def _finish(self, error):
+            if error is not None:
+                results.append({"name": "usercard", "errors": [error]})
+            for name, params in self._cases:
+                worst, mean = compare(params, alpha)
+                errors = [f"max difference {worst} > {tolerance}"] if worst > tolerance else []
+                results.append({"name": name, "max": worst, "mean": mean, "errors": errors})
+            self.stop()
+
+    CheckApp().run()
+    return results
+
+
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare cached shadows with the BoxShadow they replace.")
+    parser.add_argument("--tolerance", type=int, default=8, help="largest per-channel difference allowed (0-255)")
+    parser.add_argument("--alpha", type=float, default=0.5, help="shadow color alpha used for the comparison")
+    parser.add_argument("--levels", type=int, nargs="*", default=[0, 1, 2, 3, 4], help="UserCard elevation levels")
+    args = parser.parse_args(argv)
+
+    results = check_shadows(args.tolerance, args.alpha, args.levels)
+    for result in results:
+        status = "ok" if not result["errors"] else "[Warning] " + "; ".join(result["errors"])
+        if "max" in result:
+            print(f"{result['name']:>12s}: max {result['max']:3d}, mean {result['mean']:.2f}, {status}")
+        else:
+            print(f"{result['name']:>12s}: {status}")
+    failed = [r for r in results if r["errors"]]
+    print(f"{len(results)} shadows checked, {len(failed)} failed")
+    return 1 if failed or not results else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+UI-thread stall watchdog.
+
+The main loop stamps a heartbeat every frame through the Kivy Clock. A daemon
+thread checks it; when the heartbeat is older than `threshold` seconds it
+captures the main thread's Python stack (`sys._current_frames`), the active
+screen and the scheduled Clock events, prints them, and keeps the stall in a
+bounded ring. When the main loop comes back the stall's total duration is
+filled in.
+
+    from stallWatchdog import stall_watchdog
+
+    stall_watchdog.start()            # or watchdog_from_env(app): POCT_WATCHDOG=1
+    ...
+    for stall in stall_watchdog.stalls:   # newest first
+        print(stall.summary())
+
+The recorded stalls are listed on the diagnostics screen (diagnosticsScreen.py).
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime
+
+from kivy.app import App
+from kivy.clock import Clock
+
+# Imported up front: the watchdog thread must not import while the UI thread is stuck.
+from frameProfiler import callback_name
+
+WATCHDOG_ENV = "POCT_WATCHDOG"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_CAPACITY = 20
+# Upper bound on the timers listed per stall.
+MAX_TIMERS = 30
+
+
+class Stall:
+    """One detected stall. `duration` is None until the main loop recovers."""
+
+    def __init__(self, started, late, screen, stack, timers):
+        self.started = started
+        self.late = late
+        self.duration = None
+        self.screen = screen
+        self.stack = stack
+        self.timers = timers
+        self.detected_at = None
+
+    @property
+    def ongoing(self):
+        return self.duration is None
+
+    def summary(self):
+        length = f"{self.duration * 1000:.0f} ms" if self.duration is not None else f">{self.late * 1000:.0f} ms"
+        return f"{self.started:%H:%M:%S} stall {length} on screen '{self.screen}'"
+
+    def format(self):
+        lines = [self.summary(), "Main thread stack (most recent call last):"]
+        lines.extend(line.rstrip("\n") for line in self.stack)
+        if self.timers:
+            lines.append("Scheduled Clock events:")
+            lines.extend(f"  {timer}" for timer in self.timers)
+        return "\n".join(lines)
+
+
+class StallWatchdog:
+    def __init__(self, threshold=DEFAULT_THRESHOLD, capacity=DEFAULT_CAPACITY, poll_interval=None):
+        self.threshold = threshold
+        self.poll_interval = poll_interval or threshold / 5
+        self._stalls = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self._current = None
+        self._last_beat = time.monotonic()
+        self._main_ident = None
+        self._event = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    @property
+    def stalls(self):
+        """Recorded stalls, newest first."""
+        with self._lock:
+            return list(reversed(self._stalls))
+
+    def clear(self):
+        with self._lock:
+            self._stalls.clear()
+
+    # --- Start / stop (UI thread) ---
+    def start(self):
+        if self._thread is not None:
+            return self
+        self._main_ident = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._event = Clock.schedule_interval(self._beat, 0)
+        self._thread = threading.Thread(target=self._run, name="stall-watchdog", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join(timeout=1)
+        self._thread = None
+        self._event.cancel()
+        self._event = None
+
+    def _beat(self, dt):
+        now = time.monotonic()
+        with self._lock:
+            stall = self._current
+            self._current = None
+            self._last_beat = now
+        if stall is not None:
+            stall.duration = stall.late + (now - stall.detected_at)
+            print(f"[Warning] UI thread stall ended after {stall.duration * 1000:.0f} ms")
+
+    # --- Watchdog thread ---
+    def _run(self):
+        while not self._stop.wait(self.poll_interval):
+            now = time.monotonic()
+            with self._lock:
+                late = now - self._last_beat
+                if late <= self.threshold or self._current is not None:
+                    continue
+            stall = self._capture(late)
+            stall.detected_at = now
+            with self._lock:
+                # The main loop may have recovered while the stack was captured.
+                recovered = self._last_beat >= now
+                if not recovered:
+                    self._current = stall
+                    self._stalls.append(stall)
+            if not recovered:
+                print(f"[Warning] UI thread stalled for >{late * 1000:.0f} ms\n{stall.format()}")
+
+    def _capture(self, late):
+        frame = sys._current_frames().get(self._main_ident)
+        stack = traceback.format_stack(frame) if frame is not None else ["  <main thread stack unavailable>\n"]
+        return Stall(datetime.now(), late, _active_screen(), stack, _scheduled_timers())
+
+
+def _active_screen():
+    app = App.get_running_app()
+    return getattr(getattr(app, "root", None), "current", None) or "?"
+
+
+def _scheduled_timers():
+    timers = []
+    try:
+        events = Clock.get_events()
+    except Exception as e:
+        return [f"<could not list Clock events: {e}>"]
+    for event in events[:MAX_TIMERS]:
+        callback = event.get_callback()
+        if callback is None:
+            continue
+        # Unwrap callbacks registered while the frame profiler was installed.
+        ref = getattr(callback, "_profiled_callback", None)
+        if ref is not None:
+            callback = ref() or callback
+        timeout = "every frame" if event.timeout == 0 else f"{event.timeout:g}s"
+        kind = "interval" if event.loop else "once"
+        timers.append(f"{callback_name(callback)} ({kind}, {timeout})")
+    if len(events) > MAX_TIMERS:
+        timers.append(f"... {len(events) - MAX_TIMERS} more")
+    return timers
+
+
+stall_watchdog = StallWatchdog()
+
+
+def watchdog_from_env(app):
+    """
+    Start `stall_watchdog` if `POCT_WATCHDOG` is set ("1" for the default
+    threshold, or a threshold in ms), and stop it when `app` stops.
+    """
+    value = os.environ.get(WATCHDOG_ENV, "").strip().lower()
+    if value in ("", "0", "off", "false", "no"):
+        return False
+    if value not in ("1", "on", "true", "yes"):
+        try:
+            threshold = float(value) / 1000.0
+            if threshold <= 0:
+                raise ValueError("threshold must be positive")
+        except ValueError as e:
+            print(f"[Warning] Ignoring {WATCHDOG_ENV}={value!r}: {e}")
+        else:
+            stall_watchdog.threshold = threshold
+            stall_watchdog.poll_interval = threshold / 5
+    stall_watchdog.start()
+
+    def stop(*args):
+        app.unbind(on_stop=stop)
+        stall_watchdog.stop()
+
+    app.bind(on_stop=stop)
+    return True
@@ -0,0 +1,222 @@
+"""
+High-rate temperature acquisition.
+
+A sampling thread reads the HAL temperature sensor at a fixed rate (10-50 Hz)
+into a preallocated NumPy ring buffer. Control and analysis code reads
+zero-copy views of the latest samples; the UI gets a decimated stream (mean,
+min and max of the samples since its last tick) on the shared 2 Hz tick, so
+display rate never limits sampling rate.
+
+    from temperatureAcquisition import get_temperature_acquisition
+
+    acquisition = get_temperature_acquisition()          # started on first use
+    acquisition.subscribe_display(self.update_actual_temperature)
+
+    times, values = acquisition.ring.latest(100)         # read-only views
+"""
+
+import threading
+import weakref
+from collections import namedtuple
+from types import MethodType
+
+import numpy as np
+
+from clockService import TIER_2HZ, TIER_INTERVALS, clock_service
+from virtualClock import virtual_clock
+
+DEFAULT_RATE_HZ = 20
+DEFAULT_HISTORY_SECONDS = 600
+
+DisplayPoint = namedtuple("DisplayPoint", "time mean min max last count")
+
+
+class SampleRing:
+    """
+    Fixed-size (time, value) history. Every sample is written twice, at `i`
+    and `i + capacity`, so the newest `n` samples are always one contiguous
+    slice and `latest()` can return views instead of copies.
+
+    Single writer. Views stay valid until `capacity` more samples have been
+    written; copy them to keep them longer.
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.written = 0
+        self._times = np.zeros(2 * capacity)
+        self._values = np.zeros(2 * capacity)
+
+    def __len__(self):
+        return min(self.written, self.capacity)
+
+    def append(self, t, value):
+        i = self.written % self.capacity
+        self._times[i] = self._times[i + self.capacity] = t
+        self._values[i] = self._values[i + self.capacity] = value
+        # Published last, so readers never see an index without its sample.
+        self.written += 1
+
+    def latest(self, n=None, written=None):
+        """Read-only (times, values) views of the newest `n` samples (default: all)."""
+        written = self.written if written is None else written
+        n = min(self.capacity if n is None else n, written, self.capacity)
+        if n <= 0:
+            return self._times[:0], self._values[:0]
+        end = (written - 1) % self.capacity + self.capacity + 1
+        times = self._times[end - n:end]
+        values = self._values[end - n:end]
+        times.flags.writeable = False
+        values.flags.writeable = False
+        return times, values
+
+    def last(self):
+        if not self.written:
+            return None
+        i = (self.written - 1) % self.capacity
+        return self._times[i], self._values[i]
+
+    def decimate(self, buckets, n=None):
+        """
+        (times, mean, min, max) arrays of length `buckets` over the newest `n`
+        samples, for charts. The oldest samples that don't fill a bucket are
+        dropped.
+        """
+        times, values = self.latest(n)
+        per_bucket = len(values) // buckets
+        if per_bucket == 0:
+            return times, values, values, values
+        usable = per_bucket * buckets
+        shaped = values[-usable:].reshape(buckets, per_bucket)
+        t = times[-usable:].reshape(buckets, per_bucket)[:, -1]
+        return t, shaped.mean(axis=1), shaped.min(axis=1), shaped.max(axis=1)
+
+
+class TemperatureAcquisition:
+    def __init__(
+        self, sensor, rate_hz=DEFAULT_RATE_HZ, history_seconds=DEFAULT_HISTORY_SECONDS, time_source=None, clock=None
+    ):
+        """`rate_hz` is per virtual second of `clock` (default `virtual_clock`)."""
+        self.sensor = sensor
+        self.rate_hz = rate_hz
+        self.clock = clock or virtual_clock
+        self.time_source = time_source or self.clock.now
+        self.ring = SampleRing(int(rate_hz * history_seconds))
+        self.errors = 0
+        self.overruns = 0
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    @property
+    def latest_value(self):
+        last = self.ring.last()
+        return None if last is None else float(last[1])
+
+    def start(self):
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="temperature-acquisition", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout=1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    # --- Sampling thread ---
+    def _run(self):
+        clock = self.clock
+        period = 1.0 / self.rate_hz
+        deadline = clock.now()
+        while not self._stop.is_set():
+            try:
+                value = self.sensor.read()
+            except Exception as e:
+                self.errors += 1
+                if self.errors == 1 or self.errors % 100 == 0:
+                    print(f"[Warning] Temperature read failed ({self.errors} so far): {e}")
+            else:
+                self.ring.append(self.time_source(), value)
+
+            deadline += period
+            delay = deadline - clock.now()
+            if delay < 0:
+                # Fell behind (slow bus or sensor): skip the missed slots, keep the phase.
+                missed = int(-delay // period) + 1
+                self.overruns += missed
+                deadline += missed * period
+                delay = deadline - clock.now()
+            clock.wait(max(0.0, delay), self._stop)
+
+    # --- Display stream ---
+    def subscribe_display(self, callback, tier=TIER_2HZ, owner=None):
+        """
+        Call `callback(DisplayPoint)` on the UI thread once per `tier` tick with
+        the statistics of the samples taken since the previous call. After the
+        owner's screen was hidden (clockService.resume_tree), the first call
+        only covers the last tier interval, not the whole hidden period.
+        Returns the clock_service subscription; bound-method callbacks are held
+        weakly.
+        """
+        if isinstance(callback, MethodType):
+            ref = weakref.WeakMethod(callback)
+            owner = owner or callback.__self__
+        else:
+            ref = lambda: callback  # noqa: E731
+        cursor = [self.ring.written]
+
+        def tick(dt):
+            target = ref()
+            written = self.ring.written
+            count = written - cursor[0]
+            cursor[0] = written
+            if target is None or count <= 0:
+                return
+            times, values = self.ring.latest(count, written)
+            if subscription.paused:
+                # Catching up after resume_tree: restart the window one tick ago.
+                fresh = times >= self.time_source() - TIER_INTERVALS[tier]
+                if not fresh.any():
+                    return
+                times, values = times[fresh], values[fresh]
+                count = len(values)
+            target(
+                DisplayPoint(
+                    time=float(times[-1]),
+                    mean=float(values.mean()),
+                    min=float(values.min()),
+                    max=float(values.max()),
+                    last=float(values[-1]),
+                    count=count,
+                )
+            )
+
+        subscription = clock_service.subscribe(tick, tier, owner=owner)
+        return subscription
+
+
+_acquisition = None
+
+
+def get_temperature_acquisition(rate_hz=DEFAULT_RATE_HZ):
+    """The shared acquisition on the HAL's temperature sensor, started on first use."""
+    global _acquisition
+    if _acquisition is None:
+        from hal import get_hal
+
+        _acquisition = TemperatureAcquisition(get_hal().temperature, rate_hz=rate_hz).start()
+    return _acquisition
+
+
+def reset_temperature_acquisition():
+    """Stop the shared acquisition and forget it (app exit, tests)."""
+    global _acquisition
+    if _acquisition is not None:
+        _acquisition.stop()
+        _acquisition = None
@@ -1,24 +1,56 @@
 from kivy.core.window import Window
 from kivymd.app import MDApp
+from screenRegistry import LazyScreenManager
 from test_dashboard import testScreenLive
 from pretest import pretest
 from userReport import userReport
 from lockScreen import LockScreen
 from userLoginScreen import UserLoginScreen
+from traceRecorder import trace_from_env
+from stallWatchdog import watchdog_from_env
 
 #this is the test for the testing in progress screen
 
 class MyApp(MDApp):
     def build(self):
-        #Window.clearcolor = (1, 1, 1, 1)   
+        #Window.clearcolor = (1, 1, 1, 1)
         self.current_user = {
             "username": "Black Paint",
             "password": "999",
             "color": "green"
         }
-        login_screen = UserLoginScreen()
-        login_screen.set_user(self.current_user)
-        return login_screen
+        # Screens are only constructed when first shown (or prebuilt in on_start)
+        sm = LazyScreenManager()
+        sm.register("lock", LockScreen)
+        sm.register("user_login", UserLoginScreen)
+        sm.register("main", pretest)
+        sm.register("test", testScreenLive)
+        sm.register("report", userReport)
+        sm.register("diagnostics", "diagnosticsScreen:DiagnosticsScreen")
+
+        # POCT_TRACE=<file.json> records a Chrome trace of the session
+        trace_from_env(self, sm)
+
+        sm.current = "user_login"
+        sm.get_screen("user_login").set_user(self.current_user)
+        return sm
+
+    def on_start(self):
+        # Warm up the next screens during idle frames after the first one is shown
+        self.root.prebuild(["main", "test", "report"])
+        # POCT_WATCHDOG=1 (or a threshold in ms) reports UI thread stalls
+        watchdog_from_env(self)
+
+    def on_stop(self):
+        # The control, sampling and bus threads are daemons: turn the heater off
+        # and release the bus and pins before the process exits.
+        from hal import reset_hal
+        from heaterControl import reset_heater_controller
+        from temperatureAcquisition import reset_temperature_acquisition
+
+        reset_heater_controller()
+        reset_temperature_acquisition()
+        reset_hal()
 
 if __name__ == "__main__":
     MyApp().run()
@@ -5,6 +5,9 @@ from kivy.metrics import dp
 from kivy.core.window import Window
 from kivy.graphics import Color, BoxShadow, RoundedRectangle, Line
 
+from screenLifecycle import ScreenLifecycleMixin
+from heaterControl import get_heater_controller
+from runEngine import COMPLETED, DEMO_PROTOCOL, EVENT_STATE, IDLE, RunEngine
 from mdWidgets import (
     LoadingBar,
     StatusHeader,
@@ -34,13 +37,32 @@ def add_debug_outline(widget, color=(1, 0, 0, 1), line_width=1.5):
             width=line_width,
         )
 
-class testScreenLive(MDScreen):
+class testScreenLive(ScreenLifecycleMixin, MDScreen):
     def on_confirm(self):
         print("Confirmation accepted!")
+        self.engine.abort()
+
+    def on_run_state(self, event):
+        # Hand the finished run over to the report screen
+        if event.state == COMPLETED and self.manager is not None and self.manager.has_screen("report"):
+            self.manager.current = "report"
+
+    def on_enter(self, *args):
+        # The run starts the first time the screen is shown
+        if self.engine.state == IDLE:
+            # The heater loop (and the HAL threads under it) starts with the run, not at boot
+            self.engine.heater = get_heater_controller()
+            self.engine.start()
+        return super().on_enter(*args)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
+        # Run state lives in the engine; the widgets below only observe it
+        self.engine = RunEngine(DEMO_PROTOCOL)
+        self.engine.attach_clock()
+        self.engine.add_observer(self.on_run_state, kinds=(EVENT_STATE,))
+
         # 🔥 FORCE ROOT TO FILL THE SCREEN
         self.md_bg_color = (1, 1, 1, 1)
         self.size_hint = (1, 1)
@@ -65,7 +87,7 @@ class testScreenLive(MDScreen):
         #mainContent.add_widget(test_label)
         
         #add_debug_outline(mainContent, color=(1, 0, 1, 1))    # Blue
-        mainContent.add_widget(LoadingBar(total_time=50))
+        mainContent.add_widget(LoadingBar(engine=self.engine))
         
         buttonContainer = MDBoxLayout(
             orientation = "horizontal",
@@ -4,8 +4,8 @@ MotorControlScreen build_ui() Standalone Demo - Educational Version
 Focus: Pie Chart Progress Animation (ProcessFlowWidget)
 
 Key Learning Topics:
-1. Custom Widget - inherit from kivy.uix.widget.Widget
-2. Canvas Drawing - using Kivy Graphics instructions
+1. Custom Widget - inherit from mdWidgets.ProgressRing
+2. Retained-mode Canvas - instructions built once, then mutated
 3. NumericProperty - Kivy's reactive properties
 4. Clock.schedule_interval - animation timer updates
 5. Circular Progress Bar - Ellipse with angle_start and angle_end
@@ -13,9 +13,7 @@ Key Learning Topics:
 
 from kivy.metrics import dp
 from kivy.clock import Clock
-from kivy.graphics import Color, Ellipse, Line
 from kivy.properties import NumericProperty, StringProperty
-from kivy.uix.widget import Widget
 from kivymd.app import MDApp
 from kivymd.uix.screen import MDScreen
 from kivymd.uix.screenmanager import MDScreenManager
@@ -24,22 +22,23 @@ from kivymd.uix.floatlayout import MDFloatLayout
 from kivymd.uix.button import MDButton, MDButtonIcon, MDButtonText
 from kivymd.uix.label import MDLabel
 from datetime import datetime
-import math
 
+from mdWidgets import ProgressRing
 
-class ProcessFlowWidget(Widget):
+
+class ProcessFlowWidget(ProgressRing):
     """
     Pie Chart Progress Animation Widget
     
     Core Concepts:
-    - Use Canvas to draw circles and sectors
+    - Retained-mode drawing: ProgressRing creates its canvas instructions once
+      and only updates angles/positions/colors afterwards
     - fill_percentage controls progress (0-100)
-    - Auto-update animation
+    - Auto-update animation (fill eases at display rate)
     """
     
     # Kivy reactive properties - auto-trigger updates when values change
     remaining_time = NumericProperty(10)              # Remaining time (seconds)
-    current_stage = NumericProperty(0)                # Current stage index
     fill_percentage = NumericProperty(0)               # Fill percentage 0-100
     stage_text = StringProperty("Initializing")        # Stage text
     total_time_per_stage = 10                          # Duration per stage (seconds)
@@ -50,7 +49,7 @@ class ProcessFlowWidget(Widget):
         # Save reference to MotorControlScreen (for updating status)
         self.motor_screen = motor_screen
         
-        # Define all stages
+        # Define all stages (one ring segment per stage)
         self.stages = [
             "Preheating",           # Preheating stage
             "Heating",              # Heating stage
@@ -64,9 +63,10 @@ class ProcessFlowWidget(Widget):
         
         # Start timer - update every second
         Clock.schedule_interval(self.update_timer, 1)
-        
-        # Initial draw
-        self.update_canvas()
+    
+    def on_fill_percentage(self, instance, value):
+        """Forward the 0-100 percentage to the ring's 0-1 progress"""
+        self.progress = value / 100
     
     def update_timer(self, dt):
         """
@@ -74,8 +74,7 @@ class ProcessFlowWidget(Widget):
         
         Functions:
         1. Update remaining time
-        2. Switch stages
-        3. Update progress percentage
+        2. Switch stages (highlights the active ring segment)
         """
         if self.remaining_time > 0:
             self.remaining_time -= 1
@@ -84,56 +83,6 @@ class ProcessFlowWidget(Widget):
             self.current_stage = (self.current_stage + 1) % len(self.stages)
             self.stage_text = self.stages[self.current_stage]
             self.remaining_time = self.total_time_per_stage
-        
-        # Update canvas
-        self.update_canvas()
-    
-    def on_size(self, *args):
-        """Redraw when window size changes"""
-        self.update_canvas()
-    
-    def update_canvas(self):
-        """
-        Core drawing method - draw pie chart progress animation
-        
-        Drawing steps:
-        1. Clear canvas
-        2. Draw gray background circle
-        3. Draw blue progress sector
-        4. Draw black border
-        """
-        # Clear previous drawings
-        self.canvas.clear()
-        
-        # Calculate circle radius and center position
-        radius = min(self.width, self.height) / 2 - 20
-        center_x, center_y = self.center_x, self.center_y
-        
-        with self.canvas:
-            # ========== 1. Draw gray background circle ==========
-            Color(0.9, 0.9, 0.9, 1)  # Light gray (R, G, B, Alpha)
-            Ellipse(
-                pos=(center_x - radius, center_y - radius),  # Bottom-left position
-                size=(radius * 2, radius * 2)                # Circle size
-            )
-            
-            # ========== 2. Draw blue progress sector ==========
-            # Calculate fill angle based on fill_percentage
-            fill_angle = 360 * (self.fill_percentage / 100)
-            Color(0.3, 0.5, 0.9, 1)  # Blue
-            Ellipse(
-                pos=(center_x - radius, center_y - radius),
-                size=(radius * 2, radius * 2),
-                angle_start=0,           # Start angle (from right, counter-clockwise)
-                angle_end=fill_angle     # End angle
-            )
-            
-            # ========== 3. Draw black border ==========
-            Color(0, 0, 0, 1)  # Black
-            Line(
-                circle=(center_x, center_y, radius),  # (center_x, center_y, radius)
-                width=2                                # Line width
-            )
 
 
 class MotorControlScreen(MDScreen):
@@ -406,7 +355,7 @@ class DemoApp(MDApp):
         print("="*70)
         print("\n📚 Key Learning Points:")
         print("  1. ProcessFlowWidget - Custom circular progress widget")
-        print("  2. Canvas Drawing - Using Color, Ellipse, Line")
+        print("  2. Retained-mode Canvas - ProgressRing mutates angle_end")
         print("  3. NumericProperty - Reactive property system")
         print("  4. Clock.schedule_interval - Timer-based animations")
         print("  5. Complex Layout - Dual-column with multiple components")
@@ -420,7 +369,7 @@ class DemoApp(MDApp):
         print("  - Border: Black outline")
         print("\n🔧 Try modifying:")
         print("  - Change fill_percentage increment speed")
-        print("  - Modify colors in update_canvas()")
+        print("  - Modify fill_color / stage_colors on ProgressRing")
         print("  - Add more stages to self.stages list")
         print("="*70 + "\n")
 
@@ -0,0 +1,270 @@
+"""
+Chrome trace-event recorder for UI thread activity.
+
+While recording, `tracer` collects begin/end spans for:
+
+    * Clock callbacks (through the frame profiler's Clock wrappers)
+    * touch dispatch (Window on_touch_down/move/up)
+    * screen transitions (`manager.current` changes until the transition ends)
+    * screen builds, dialog builds and dialog opens
+    * texture loads (image decode on the worker thread, upload on the UI thread)
+
+and writes them as Chrome trace-event JSON, which loads in chrome://tracing or
+https://ui.perfetto.dev.
+
+Recording a session:
+    POCT_TRACE=session.json python test_1124.py
+
+or from code:
+    from traceRecorder import tracer
+
+    tracer.start()
+    ...
+    tracer.stop()
+    tracer.save("session.json")
+
+Modules mark their own expensive sections with `tracer.span()`; it costs one
+attribute check while no trace is being recorded:
+
+    with tracer.span("decode", "texture", path=path):
+        ...
+"""
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+TRACE_ENV = "POCT_TRACE"
+
+# Enough for a long assay session; the oldest events are dropped beyond this.
+DEFAULT_MAX_EVENTS = 500000
+
+_TOUCH_EVENTS = ("on_touch_down", "on_touch_move", "on_touch_up")
+
+
+class TraceRecorder:
+    def __init__(self, max_events=DEFAULT_MAX_EVENTS):
+        self.active = False
+        self.events = deque(maxlen=max_events)
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._threads = {}
+        self._owns_profiler = False
+        self._managers = []
+        self._dialog_open = None
+
+    # --- Recording API ---
+    def _ts(self, t):
+        return (t - self._origin) * 1e6
+
+    def _tid(self):
+        ident = threading.get_ident()
+        if ident not in self._threads:
+            self._threads[ident] = threading.current_thread().name
+        return ident
+
+    def complete(self, name, cat, start, duration, **args):
+        """Add a finished span. `start` is a `time.perf_counter()` value, `duration` seconds."""
+        if not self.active:
+            return
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": self._ts(start),
+            "dur": duration * 1e6,
+            "pid": self._pid,
+            "tid": self._tid(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def instant(self, name, cat, **args):
+        if not self.active:
+            return
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "i",
+            "s": "t",
+            "ts": self._ts(time.perf_counter()),
+            "pid": self._pid,
+            "tid": self._tid(),
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    @contextmanager
+    def span(self, name, cat, **args):
+        if not self.active:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.complete(name, cat, start, time.perf_counter() - start, **args)
+
+    # --- Start / stop ---
+    def start(self, manager=None):
+        """
+        Start recording. `manager` is the ScreenManager whose transitions are
+        traced; it defaults to the running app's root when that is one.
+        """
+        if self.active:
+            return self
+        self.events.clear()
+        self._threads.clear()
+        self._origin = time.perf_counter()
+        self.active = True
+        self._hook_clock()
+        self._hook_touches()
+        self._hook_dialogs()
+        if manager is None:
+            manager = _app_screen_manager()
+        if manager is not None:
+            self.watch_manager(manager)
+        return self
+
+    def stop(self):
+        if not self.active:
+            return
+        self.active = False
+        self._unhook_clock()
+        self._unhook_touches()
+        self._unhook_dialogs()
+        for manager in self._managers:
+            manager.unbind(current=self._on_current)
+        self._managers = []
+
+    def save(self, path):
+        metadata = [
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": name}}
+            for tid, name in self._threads.items()
+        ]
+        with open(path, "w") as f:
+            json.dump({"traceEvents": metadata + list(self.events), "displayTimeUnit": "ms"}, f)
+        return path
+
+    # --- Clock callbacks ---
+    def _hook_clock(self):
+        from frameProfiler import frame_profiler
+
+        self._owns_profiler = not frame_profiler.installed
+        frame_profiler.install()
+        frame_profiler.listeners.append(self._on_callback)
+
+    def _unhook_clock(self):
+        from frameProfiler import frame_profiler
+
+        if self._on_callback in frame_profiler.listeners:
+            frame_profiler.listeners.remove(self._on_callback)
+        if self._owns_profiler:
+            frame_profiler.uninstall()
+        self._owns_profiler = False
+
+    def _on_callback(self, name, start, duration):
+        self.complete(name, "clock", start, duration)
+
+    # --- Touches ---
+    def _hook_touches(self):
+        from kivy.core.window import Window
+
+        # EventDispatcher.dispatch looks the default handler up on the instance,
+        # so an instance attribute wraps the whole dispatch to the widget tree.
+        for event_name in _TOUCH_EVENTS:
+            handler = getattr(Window, event_name)
+            setattr(Window, event_name, self._wrap_touch(event_name, handler))
+
+    def _unhook_touches(self):
+        from kivy.core.window import Window
+
+        for event_name in _TOUCH_EVENTS:
+            if event_name in Window.__dict__:
+                delattr(Window, event_name)
+
+    def _wrap_touch(self, event_name, handler):
+        def dispatch(touch, *args):
+            with self.span(event_name, "touch", pos=[round(touch.x), round(touch.y)]):
+                return handler(touch, *args)
+
+        return dispatch
+
+    # --- Screens ---
+    def watch_manager(self, manager):
+        if manager not in self._managers:
+            self._managers.append(manager)
+            manager.bind(current=self._on_current)
+
+    def _on_current(self, manager, name):
+        start = time.perf_counter()
+        self.instant(f"screen {name}", "screen")
+        transition = manager.transition
+        if not transition.is_active:
+            return
+
+        def on_complete(*args):
+            transition.unbind(on_complete=on_complete)
+            self.complete(f"transition to {name}", "screen", start, time.perf_counter() - start)
+
+        transition.bind(on_complete=on_complete)
+
+    # --- Dialogs ---
+    def _hook_dialogs(self):
+        try:
+            from kivymd.uix.dialog import MDDialog
+        except ImportError:
+            return
+        original = MDDialog.open
+        recorder = self
+
+        def open(dialog, *args, **kwargs):
+            with recorder.span("dialog open", "dialog", dialog=type(dialog).__name__):
+                return original(dialog, *args, **kwargs)
+
+        self._dialog_open = (MDDialog, original)
+        MDDialog.open = open
+
+    def _unhook_dialogs(self):
+        if self._dialog_open is not None:
+            cls, original = self._dialog_open
+            cls.open = original
+            self._dialog_open = None
+
+
+tracer = TraceRecorder()
+
+
+def _app_screen_manager():
+    from kivy.app import App
+    from kivy.uix.screenmanager import ScreenManager
+
+    app = App.get_running_app()
+    root = getattr(app, "root", None)
+    return root if isinstance(root, ScreenManager) else None
+
+
+def trace_from_env(app, manager=None):
+    """
+    Start recording if `POCT_TRACE` names an output file, and save the trace
+    when `app` stops.
+    """
+    path = os.environ.get(TRACE_ENV)
+    if not path:
+        return False
+    tracer.start(manager)
+
+    def save(*args):
+        # App.stop() can dispatch on_stop more than once.
+        app.unbind(on_stop=save)
+        tracer.stop()
+        tracer.save(path)
+        print(f"Trace written to {path} ({len(tracer.events)} events)")
+
+    app.bind(on_stop=save)
+    return True
@@ -1,18 +1,16 @@
 from kivymd.uix.screen import MDScreen
 from kivy.core.window import Window
 
+from screenLifecycle import ScreenLifecycleMixin
 from mdWidgets import (
     uni_lowerContainer,
     uni_upperContainer,
     uni_backButton,
     uni_homeButton,
     uni_folderContainer,
-    build_test_results_tab,
-    build_result_details_tab,
-    build_export_tab,
 )
 
-class userReport(MDScreen):
+class userReport(ScreenLifecycleMixin, MDScreen):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
@@ -34,12 +32,14 @@ class userReport(MDScreen):
             size_hint=(0.9, 0.65),
             pos_hint={'center_x': 0.5, 'center_y': 0.48},
             bg_color=(1, 1, 1, 1),
+            prebuild_adjacent=True,
             #style="elevated"
         )
+        # Builders run when their tab is first shown (the neighbour is prebuilt when idle)
         mainContent.set_tabs([
-            ("Test Results", build_test_results_tab("Project Name", "20XX-XX-XX", "high tolerance")),
-            ("Result Details", build_result_details_tab("high tolerance")),
-            ("Export", build_export_tab()),
+            ("Test Results", self._build_test_results_tab),
+            ("Result Details", self._build_result_details_tab),
+            ("Export", self._build_export_tab),
         ])
         # Add a simple label to verify widget positioning
         #from kivy.uix.label import Label
@@ -78,4 +78,20 @@ class userReport(MDScreen):
         Window.bind(width=update_width)
         self.bind(width=update_width)
 
-    
\ No newline at end of file
+    
+
+    # --- Tab builders (imported on demand so unused tabs cost nothing) ---
+    def _build_test_results_tab(self):
+        from mdReportTabs import build_test_results_tab
+
+        return build_test_results_tab("Project Name", "20XX-XX-XX", "high tolerance")
+
+    def _build_result_details_tab(self):
+        from mdReportTabs import build_result_details_tab
+
+        return build_result_details_tab("high tolerance")
+
+    def _build_export_tab(self):
+        from mdExportTab import build_export_tab
+
+        return build_export_tab()
@@ -0,0 +1,199 @@
+"""
+Virtual time for accelerated simulation.
+
+Everything that measures run time reads `virtual_clock` instead of
+`time.monotonic()`: the run engine, LoadingBar, the footer clock (through
+clockService), the simulated HAL's thermal model and the acquisition and
+heater loops. At 1x it is exactly the monotonic clock; at 10x or 100x it
+runs faster than real time; in FAST mode it only moves when a driver calls
+`step()`, so a full assay runs as fast as the code allows.
+
+    POCT_SPEED=100 python test_1124.py       # 1, 10, 100 or "fast"
+
+    from virtualClock import virtual_clock
+    virtual_clock.now()              # seconds (monotonic at 1x)
+    virtual_clock.datetime()         # wall-clock time for displays
+    virtual_clock.wait(0.1, stop)    # periodic threads: 0.1 virtual seconds
+    virtual_clock.step(0.05)         # drivers: let 0.05 virtual seconds pass
+
+`POCT_SPEED` is read when the module is first imported; `set_speed()`
+changes it at runtime without making `now()` jump.
+"""
+
+import os
+import threading
+import time
+import weakref
+from datetime import datetime, timedelta
+from types import MethodType
+
+FAST = "fast"
+SPEEDS = (1, 10, 100, FAST)
+
+# FAST mode with a UI: each frame advances the clock in FAST_STEP increments
+# for up to FAST_FRAME_BUDGET real seconds (see drive_while).
+FAST_STEP = 0.05
+FAST_FRAME_BUDGET = 0.02
+# FAST mode: how often blocked waits re-check their stop event.
+_FAST_POLL = 0.05
+
+
+def parse_speed(value):
+    """1, 10, 100 (any positive number) or "fast"/"max"."""
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in (FAST, "max", "afap"):
+            return FAST
+        value = float(text.rstrip("x"))
+    if value <= 0:
+        raise ValueError(f"Clock speed must be positive: {value!r}")
+    return value
+
+
+class VirtualClock:
+    def __init__(self, speed=1):
+        self._condition = threading.Condition()
+        self._origin_real = time.monotonic()
+        self._origin_wall = datetime.now()
+        self._base_real = self._origin_real
+        self._base_virtual = self._origin_real
+        self.speed = parse_speed(speed)
+        self._frame_event = None
+        self._demands = []
+
+    @classmethod
+    def from_env(cls, name="POCT_SPEED"):
+        value = os.environ.get(name)
+        if not value:
+            return cls()
+        try:
+            return cls(value)
+        except ValueError as e:
+            print(f"[Warning] Ignoring {name}={value!r}: {e}")
+            return cls()
+
+    @property
+    def fast(self):
+        return self.speed == FAST
+
+    def __repr__(self):
+        return f"VirtualClock(speed={'fast' if self.fast else f'{self.speed:g}x'})"
+
+    # --- Reading ---
+    def now(self):
+        """Virtual seconds; equals time.monotonic() until the speed changes."""
+        with self._condition:
+            if self.fast:
+                return self._base_virtual
+            return self._base_virtual + (time.monotonic() - self._base_real) * self.speed
+
+    def datetime(self):
+        """Wall-clock time as seen by the simulation (for footers and reports)."""
+        return self._origin_wall + timedelta(seconds=self.now() - self._origin_real)
+
+    # --- Changing speed / advancing ---
+    def set_speed(self, speed):
+        speed = parse_speed(speed)
+        with self._condition:
+            self._base_virtual = self.now()
+            self._base_real = time.monotonic()
+            self.speed = speed
+            self._condition.notify_all()
+        if self.fast and self._demands:
+            self._schedule_frames()
+
+    def advance(self, seconds):
+        """Move FAST time forward and wake the waits that are now due."""
+        if not self.fast:
+            raise RuntimeError("advance() only applies to a FAST clock")
+        with self._condition:
+            self._base_virtual += seconds
+            self._condition.notify_all()
+
+    # --- Waiting ---
+    def sleep(self, seconds):
+        """
+        Simulated latency (bus transfers, sensor conversions): scaled real
+        sleep, free in FAST mode.
+        """
+        if seconds > 0 and not self.fast:
+            time.sleep(seconds / self.speed)
+
+    def wait(self, seconds, stop_event=None):
+        """
+        Block until `seconds` of virtual time have passed or `stop_event` is
+        set, for periodic worker threads. Returns True if `stop_event` is set.
+        In FAST mode this waits for a driver to advance the clock.
+        """
+        if not self.fast:
+            if stop_event is None:
+                time.sleep(max(0.0, seconds / self.speed))
+                return False
+            return stop_event.wait(max(0.0, seconds / self.speed))
+
+        deadline = self.now() + seconds
+        with self._condition:
+            while self.fast and self._base_virtual < deadline:
+                if stop_event is not None and stop_event.is_set():
+                    return True
+                self._condition.wait(_FAST_POLL)
+            if not self.fast:
+                # Switched back to scaled time while waiting: finish the rest at that speed.
+                remaining = deadline - self.now()
+            else:
+                remaining = 0.0
+        if remaining > 0:
+            return self.wait(remaining, stop_event)
+        return stop_event is not None and stop_event.is_set()
+
+    def step(self, seconds):
+        """
+        Let `seconds` of virtual time pass on behalf of a driver loop (e.g.
+        RunEngine.run_headless): advances a FAST clock, sleeps otherwise.
+        """
+        if self.fast:
+            self.advance(seconds)
+            # Give the worker threads woken by advance() a chance to run.
+            time.sleep(0)
+        else:
+            self.sleep(seconds)
+
+    def drive_while(self, predicate):
+        """
+        Inside a Kivy app a FAST clock has no driver of its own. Register
+        `predicate()`; on every frame where one returns True, up to
+        FAST_FRAME_BUDGET real seconds are spent advancing the clock, so
+        virtual time only races while something (e.g. a running assay) needs
+        it. Bound methods are held weakly.
+        """
+        if isinstance(predicate, MethodType):
+            self._demands.append(weakref.WeakMethod(predicate))
+        else:
+            self._demands.append(lambda: predicate)
+        if self.fast:
+            self._schedule_frames()
+
+    def _schedule_frames(self):
+        if self._frame_event is None:
+            from kivy.clock import Clock
+
+            self._frame_event = Clock.schedule_interval(self._drive_frame, 0)
+
+    def _drive_frame(self, dt):
+        demanded = False
+        for ref in list(self._demands):
+            predicate = ref()
+            if predicate is None:
+                self._demands.remove(ref)
+            elif predicate():
+                demanded = True
+        if not self.fast or not self._demands:
+            self._frame_event = None
+            return False
+        if demanded:
+            until = time.perf_counter() + FAST_FRAME_BUDGET
+            while time.perf_counter() < until:
+                self.step(FAST_STEP)
+
+
+virtual_clock = VirtualClock.from_env()